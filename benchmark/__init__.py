@@ -0,0 +1 @@
+# Benchmarks. Run from project root, e.g., `python -m benchmark.benchmark_search_worker_pool`
@@ -0,0 +1,91 @@
+import os
+import sys
+import time
+
+from unicode_extension.load_unicode_data import load_unicode_data
+from unicode_extension.search_unicode_character import (
+    configure_search_worker_pool,
+    search_unicode_character_fuzzy,
+)
+
+PROJECT_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Most of them are found by earlier tiers or by indexes in usual search, and
+# never scan whole list. Scanned as whole list here. (See `full_scan`)
+QUERY_LIST = ["c", "e", "chekmark", "elipsis", "qwxz", "lef arow"]
+
+REPEAT = 5
+
+
+def full_scan(unicode_character_list: list, query: str) -> list:
+    """Fuzzy search of whole list. (No candidate is found by indexes)
+
+    Only this path of search uses `SearchWorkerPool`.
+    """
+
+    return search_unicode_character_fuzzy(
+        query, unicode_character_list, 10, candidate_position_list=[]
+    )
+
+
+def measure_search_time(unicode_character_list: list, query: str) -> float:
+    """Return best time (sec) of `REPEAT` times"""
+
+    time_list: list[float] = []
+
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        full_scan(unicode_character_list, query)
+        time_list.append(time.perf_counter() - start)
+
+    return min(time_list)
+
+
+def main():
+    """Benchmark - Full scan of whole list, single process vs `SearchWorkerPool`"""
+
+    worker_number = int(sys.argv[1]) if len(sys.argv) >= 2 else os.cpu_count() or 1
+
+    unicode_character_list = load_unicode_data(PROJECT_PATH)["UNICODE_CHARACTER_LIST"]
+
+    configure_search_worker_pool(unicode_character_list, 1)
+    single_process_result = {
+        query: full_scan(unicode_character_list, query) for query in QUERY_LIST
+    }
+    single_process_time = {
+        query: measure_search_time(unicode_character_list, query)
+        for query in QUERY_LIST
+    }
+
+    configure_search_worker_pool(unicode_character_list, worker_number)
+    worker_pool_result = {
+        query: full_scan(unicode_character_list, query) for query in QUERY_LIST
+    }
+    worker_pool_time = {
+        query: measure_search_time(unicode_character_list, query)
+        for query in QUERY_LIST
+    }
+    configure_search_worker_pool(unicode_character_list, 1)
+
+    print(
+        f"Characters: {len(unicode_character_list):,}, Workers: {worker_number},"
+        + f" CPU cores: {os.cpu_count()}"
+    )
+
+    # Shards are scored at the same time only on their own cores.
+    if worker_number > (os.cpu_count() or 1):
+        print(f"More workers than CPU cores. No speedup is expected.")
+
+    print(f"")
+    print(f"{'Query':12} {'Single':>10} {'Workers':>10} {'Speedup':>8}  Same Result")
+
+    for query in QUERY_LIST:
+        print(
+            f"{query:12} {single_process_time[query] * 1000:>8.1f}ms {worker_pool_time[query] * 1000:>8.1f}ms"
+            + f" {single_process_time[query] / worker_pool_time[query]:>7.2f}x"
+            + f"  {single_process_result[query] == worker_pool_result[query]}"
+        )
+
+
+if __name__ == "__main__":
+    main()
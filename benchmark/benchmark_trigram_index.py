@@ -0,0 +1,90 @@
+import os
+import time
+
+from rapidfuzz import process
+
+from unicode_extension.load_unicode_data import load_unicode_data
+from unicode_extension.search_unicode_character import (
+    search_unicode_character_fuzzy,
+)
+from unicode_extension.unicode_character_search_index import (
+    get_unicode_character_search_index,
+)
+from unicode_extension.unicode_character_trigram_index import (
+    UnicodeCharacterTrigramIndex,
+)
+
+PROJECT_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Misspelled queries. (No token shared with characters)
+QUERY_LIST = ["chekmark", "elipsis", "copyrite", "smilng", "lef arow"]
+
+REPEAT = 5
+
+
+def measure_time(function) -> float:
+    """Return best time (sec) of `REPEAT` times"""
+
+    time_list: list[float] = []
+
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        function()
+        time_list.append(time.perf_counter() - start)
+
+    return min(time_list)
+
+
+def main():
+    """Benchmark - Misspelled query, trigram index candidates vs whole list scan"""
+
+    unicode_character_list = load_unicode_data(PROJECT_PATH)["UNICODE_CHARACTER_LIST"]
+
+    search_index = get_unicode_character_search_index(unicode_character_list)
+
+    start = time.perf_counter()
+    trigram_index = UnicodeCharacterTrigramIndex(unicode_character_list)
+    build_time = time.perf_counter() - start
+
+    print(f"Characters: {len(unicode_character_list):,}")
+    print(f"Trigrams: {len(trigram_index.trigram_position_dict):,}")
+    print(f"Build: {build_time * 1000:.1f}ms")
+    print(f"Memory: {trigram_index.get_memory_size() / 1024 / 1024:.1f}MiB")
+    print(f"")
+    print(f"{'Query':12} {'Whole':>10} {'Trigram':>10} {'Candidates':>10}  Top Result")
+
+    for query in QUERY_LIST:
+        whole_list_time = measure_time(
+            lambda: process.extract(
+                query=query.upper(),
+                choices=search_index.string_data_for_search_list,
+                processor=None,
+                score_cutoff=1,
+                limit=10,
+            )
+        )
+
+        candidate_position_list = trigram_index.find_candidate_position_list(query)
+
+        trigram_time = measure_time(
+            lambda: search_unicode_character_fuzzy(
+                query,
+                unicode_character_list,
+                10,
+                trigram_index.find_candidate_position_list(query),
+            )
+        )
+
+        search_result = search_unicode_character_fuzzy(
+            query, unicode_character_list, 10, candidate_position_list
+        )
+        top_result = search_result[0][0].name if len(search_result) > 0 else "-"
+
+        print(
+            f"{query:12} {whole_list_time * 1000:>8.1f}ms {trigram_time * 1000:>8.1f}ms"
+            + f" {len(candidate_position_list):>10}  {top_result}"
+        )
+
+
+if __name__ == "__main__":
+    main()
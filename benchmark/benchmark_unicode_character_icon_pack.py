@@ -0,0 +1,100 @@
+import os
+import tempfile
+import time
+
+from unicode_extension.load_unicode_data import load_unicode_data_from_json
+from unicode_extension.search_unicode_character import search_unicode_character
+from unicode_extension.unicode_character_icon import (
+    UnicodeCharacterIconCache,
+    load_unicode_character_icon_pack,
+)
+
+PROJECT_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+UNICODE_DATA_JSON_PATH = f"{PROJECT_PATH}/data/unicode_data.json"
+# Made by `generate_data` (`save_unicode_character_icon_pack.py`)
+ICON_PACK_DIR_PATH = f"{PROJECT_PATH}/data/unicode_character_icon_pack"
+
+QUERY_LIST = ["em dash", "arrow", "bdlh", "chekmark", "latin small letter", "smile"]
+
+
+def measure_cold_query(
+    unicode_character_list: list, query: str, icon_pack_dir_path: str | None
+) -> tuple[float, int]:
+    """Icons of result of query, with empty icon cache. (First query after install)
+
+    Scan (loading index of icon pack) is done by worker before the first query,
+    so it's not counted. (See `UnicodeCharacterIconPrefetcher`)
+
+    Returns:
+        (time to get icons (sec), number of icon files made)
+    """
+
+    result = search_unicode_character(query, unicode_character_list, limit=10)
+
+    with tempfile.TemporaryDirectory() as icon_cache_dir_path:
+        icon_cache = UnicodeCharacterIconCache(
+            icon_cache_dir_path, icon_pack_dir_path=icon_pack_dir_path
+        )
+
+        icon_cache.scan()
+
+        start = time.perf_counter()
+
+        for unicode_character, _, _ in result:
+            icon_cache.get_icon(unicode_character)
+
+        icon_time = time.perf_counter() - start
+
+        return (icon_time, len(icon_cache))
+
+
+def main():
+    """Benchmark - Icons of cold query, with and without icon pack"""
+
+    if not os.path.isfile(f"{ICON_PACK_DIR_PATH}/icon_pack.json"):
+        raise FileNotFoundError(
+            f"`{ICON_PACK_DIR_PATH}` not exist. Run `generate_data` first."
+        )
+
+    unicode_character_list = load_unicode_data_from_json(UNICODE_DATA_JSON_PATH)[
+        "UNICODE_CHARACTER_LIST"
+    ]
+
+    start = time.perf_counter()
+    icon_pack_file_path_set = load_unicode_character_icon_pack(ICON_PACK_DIR_PATH)
+    load_time = time.perf_counter() - start
+
+    print(
+        f"Icon pack: {len(icon_pack_file_path_set):,} icons,"
+        + f" index loaded in {load_time * 1000:.2f}ms (by worker, before first query)"
+    )
+    print(f"")
+    print(f"{'Query':20} {'No Pack':>16} {'Pack':>16}")
+
+    total_list = [[0.0, 0], [0.0, 0]]
+
+    for query in QUERY_LIST:
+        row = f"{query:20}"
+
+        for total, icon_pack_dir_path in zip(total_list, [None, ICON_PACK_DIR_PATH]):
+            icon_time, file_number = measure_cold_query(
+                unicode_character_list, query, icon_pack_dir_path
+            )
+            total[0] += icon_time
+            total[1] += file_number
+
+            row += f" {icon_time * 1000:>6.2f}ms {file_number:>2} files"
+
+        print(row)
+
+    print(
+        f"{'Total':20}"
+        + "".join(
+            f" {icon_time * 1000:>6.2f}ms {file_number:>2} files"
+            for icon_time, file_number in total_list
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
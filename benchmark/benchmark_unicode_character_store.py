@@ -0,0 +1,92 @@
+import gc
+import json
+import os
+import time
+import tracemalloc
+
+from unicode_extension.load_unicode_data import load_unicode_data_from_json
+from unicode_extension.search_unicode_character import search_unicode_character
+from unicode_extension.unicode_character import UnicodeCharacter
+
+PROJECT_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+UNICODE_DATA_JSON_PATH = f"{PROJECT_PATH}/data/unicode_data.json"
+
+QUERY_LIST = ["em dash", "arrow", "bdlh", "chekmark", "latin small letter"]
+
+
+def load_eager() -> dict:
+    """Load `UnicodeCharacter` of every character. (Before `UnicodeCharacterStore`)"""
+
+    unicode_character_list: list[UnicodeCharacter] = []
+    unicode_character_dict: dict[str, UnicodeCharacter] = {}
+
+    with open(UNICODE_DATA_JSON_PATH) as json_file:
+        for character_data in json.load(json_file):
+            unicode_character = UnicodeCharacter(
+                code_point=character_data["cp"],
+                name=character_data["na"],
+                block=character_data["blk"],
+                aliases=character_data.get("als", []),
+            )
+
+            unicode_character_list.append(unicode_character)
+            unicode_character_dict[unicode_character.u_code_point] = unicode_character
+
+    return {
+        "UNICODE_CHARACTER_LIST": unicode_character_list,
+        "UNICODE_CHARACTER_DICT": unicode_character_dict,
+    }
+
+
+def measure(load) -> tuple[dict, float, int]:
+    """Returns: (loaded data, load time (sec), memory kept after load (byte))"""
+
+    gc.collect()
+    tracemalloc.start()
+
+    start = time.perf_counter()
+    unicode_data = load()
+    load_time = time.perf_counter() - start
+
+    gc.collect()
+    memory_size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return (unicode_data, load_time, memory_size)
+
+
+def main():
+    """Benchmark - Memory of eager `UnicodeCharacter` list vs `UnicodeCharacterStore`"""
+
+    print(f"{'Load':8} {'Time':>10} {'Memory':>10}")
+
+    for label, load in [
+        ("Eager", load_eager),
+        ("Store", lambda: load_unicode_data_from_json(UNICODE_DATA_JSON_PATH)),
+    ]:
+        unicode_data, load_time, memory_size = measure(load)
+
+        print(
+            f"{label:8} {load_time * 1000:>8.1f}ms"
+            + f" {memory_size / 1024 / 1024:>7.1f}MiB"
+        )
+
+        del unicode_data
+
+    unicode_character_list = load_unicode_data_from_json(UNICODE_DATA_JSON_PATH)[
+        "UNICODE_CHARACTER_LIST"
+    ]
+
+    for query in QUERY_LIST:
+        search_unicode_character(query, unicode_character_list, limit=10)
+
+    print(f"")
+    print(
+        f"Materialized after {len(QUERY_LIST)} searches:"
+        + f" {unicode_character_list.get_materialized_number():,}"
+        + f" / {len(unicode_character_list):,}"
+    )
+
+
+if __name__ == "__main__":
+    main()
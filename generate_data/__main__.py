@@ -7,12 +7,16 @@ from get_original_ucd_xml_file import (
 from process_ucd_xml_file import process_ucd_xml_file
 from assert_characters_for_test import assert_characters_for_test
 from save_unicode_data_to_json_file import save_unicode_data_to_json_file
+from save_unicode_data_to_binary_file import save_unicode_data_to_binary_file
+from save_unicode_data_to_delta_file import save_unicode_data_to_delta_file
+from save_unicode_character_icon_pack import save_unicode_character_icon_pack
 
 from process_ucd_xml_file import UnicodeBlock, UnicodeCharacter
 
 
 def main():
-    """Generate Data (unicode_data.json for UnicodeExtension)"""
+    """Generate Data (unicode_data.json, unicode_data.bin, unicode_data_delta.json,
+    unicode_character_icon_pack for UnicodeExtension)"""
 
     ORIGINAL_DATA_DIR = "original_data"
 
@@ -29,6 +33,15 @@ def main():
     OUTPUT_JSON_FILENAME = "unicode_data.json"
     OUTPUT_JSON_FILE_PATH = f"{OUTPUT_DIR}/{OUTPUT_JSON_FILENAME}"
 
+    OUTPUT_BINARY_FILENAME = "unicode_data.bin"
+    OUTPUT_BINARY_FILE_PATH = f"{OUTPUT_DIR}/{OUTPUT_BINARY_FILENAME}"
+
+    OUTPUT_DELTA_FILENAME = "unicode_data_delta.json"
+    OUTPUT_DELTA_FILE_PATH = f"{OUTPUT_DIR}/{OUTPUT_DELTA_FILENAME}"
+
+    OUTPUT_ICON_PACK_DIRNAME = "unicode_character_icon_pack"
+    OUTPUT_ICON_PACK_DIR_PATH = f"{OUTPUT_DIR}/{OUTPUT_ICON_PACK_DIRNAME}"
+
     if not os.path.isdir(ORIGINAL_DATA_DIR):
         print(
             f"generate_data - `{ORIGINAL_DATA_DIR}` directory is not exist. Create Directory."
@@ -79,6 +92,21 @@ def main():
             output_json_indent=None,
         )
 
+        save_unicode_data_to_binary_file(
+            unicode_data_list=UNICODE_CHARACTER_LIST,
+            output_binary_file_path=OUTPUT_BINARY_FILE_PATH,
+        )
+
+        save_unicode_data_to_delta_file(
+            unicode_data_list=UNICODE_CHARACTER_LIST,
+            output_delta_file_path=OUTPUT_DELTA_FILE_PATH,
+        )
+
+        save_unicode_character_icon_pack(
+            unicode_data_list=UNICODE_CHARACTER_LIST,
+            output_icon_pack_dir_path=OUTPUT_ICON_PACK_DIR_PATH,
+        )
+
         print(f"")
         print(f"")
         print(f"==============")
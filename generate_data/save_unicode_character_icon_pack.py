@@ -0,0 +1,231 @@
+import argparse
+import hashlib
+import json
+import os
+import shutil
+
+from process_ucd_xml_file import process_ucd_xml_file
+from process_ucd_xml_file import UnicodeCharacter
+
+# Format of icon pack. Read by `load_unicode_character_icon_pack` of
+# `unicode_extension/unicode_character_icon.py`
+#
+# - `{namespace}/{last 2 hex digits of code point}/u_{code point}.svg`: Icons.
+#   Same path as icons made by the extension in its cache directory.
+# - `icon_pack.json`: Index of icons. Icons are found by it, not by file system.
+#   `{"version": 1, "namespaces": {namespace: {"font", "background", "code_points"}}}`
+UNICODE_CHARACTER_ICON_PACK_INDEX_FILENAME = "icon_pack.json"
+
+# Same as `unicode_extension/unicode_character_icon.py`
+UNICODE_CHARACTER_ICON_VERSION = 1
+ICON_FILE_PREFIX = "u_"
+ICON_FILE_EXTENSION = ".svg"
+
+ICON_WITHOUT_BACKGROUND_TEMPLATE = """
+<svg  width="100" height="100">
+    <text x="50" y="50" dy=".35em" text-anchor="middle" dominant-baseline="middle" font-family="{font}" font-size="80">{character}</text>
+</svg>
+"""
+
+ICON_WITH_WHITE_BACKGROUND_TEMPLATE = """
+<svg  width="100" height="100">
+    <rect x="0" y="0" rx="10" ry="10" width="100" height="100" style="fill:rgb(255,255,255)" />
+    <text x="50" y="50" dy=".35em" text-anchor="middle" dominant-baseline="middle" font-family="{font}" font-size="80">{character}</text>
+</svg>
+"""
+
+# Blocks of most result rows. (Latin, punctuation, arrows, math, box drawing, emoji)
+DEFAULT_ICON_PACK_BLOCK_LIST = [
+    "Basic Latin",
+    "Latin-1 Supplement",
+    "Greek and Coptic",
+    "General Punctuation",
+    "Supplemental Punctuation",
+    "Currency Symbols",
+    "Letterlike Symbols",
+    "Arrows",
+    "Supplemental Arrows-B",
+    "Miscellaneous Symbols and Arrows",
+    "Mathematical Operators",
+    "Miscellaneous Technical",
+    "Box Drawing",
+    "Block Elements",
+    "Geometric Shapes",
+    "Miscellaneous Symbols",
+    "Dingbats",
+    "Miscellaneous Symbols and Pictographs",
+    "Emoticons",
+    "Supplemental Symbols and Pictographs",
+]
+# Default of preferences. (`unicode_character_icon_font`)
+DEFAULT_ICON_PACK_FONT_LIST = ["sans-serif"]
+# `None` for no background. (`unicode_character_icon_background`)
+DEFAULT_ICON_PACK_BACKGROUND_LIST: list[str | None] = [None]
+
+
+def get_unicode_character_icon_namespace(background: str | None, font: str) -> str:
+    """Same as `get_unicode_character_icon_namespace` of
+    `unicode_extension/unicode_character_icon.py`"""
+
+    key = f"{UNICODE_CHARACTER_ICON_VERSION}\0{background}\0{font}"
+
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+
+
+def generate_icon_content(
+    unicode_character: UnicodeCharacter, background: str | None, font: str
+) -> str:
+    """Same as `create_unicode_character_icon_file` of
+    `unicode_extension/unicode_character_icon.py`"""
+
+    if background is None:
+        template = ICON_WITHOUT_BACKGROUND_TEMPLATE
+    elif background == "white":
+        template = ICON_WITH_WHITE_BACKGROUND_TEMPLATE
+    else:
+        raise ValueError(
+            f"Unknown background value. current background value: `{background}`"
+        )
+
+    return template.replace(
+        "{character}", f"&#x{unicode_character.code_point};"
+    ).replace("{font}", font)
+
+
+def save_unicode_character_icon_pack(
+    unicode_data_list: list[UnicodeCharacter],
+    output_icon_pack_dir_path: str,
+    block_list: list[str] = DEFAULT_ICON_PACK_BLOCK_LIST,
+    font_list: list[str] = DEFAULT_ICON_PACK_FONT_LIST,
+    background_list: list[str | None] = DEFAULT_ICON_PACK_BACKGROUND_LIST,
+):
+    """Save pre-made icons of characters of blocks (Icon pack)
+
+    Extension uses icons of pack as they are, and makes icons only for
+    characters not in pack. Old pack in `output_icon_pack_dir_path` is removed.
+
+    Args:
+        unicode_data_list: Unicode characters.
+        output_icon_pack_dir_path: Output icon pack directory path.
+        block_list: Blocks of characters in pack.
+        font_list: Fonts of icons. (Preference `unicode_character_icon_font`)
+        background_list: Backgrounds of icons. (`None`, `"white"`)
+    """
+
+    unknown_block_set = set(block_list) - set(
+        unicode_character.block for unicode_character in unicode_data_list
+    )
+
+    if len(unknown_block_set) > 0:
+        raise ValueError(f"Unknown blocks. {sorted(unknown_block_set)}")
+
+    block_set = set(block_list)
+
+    # Non-printable characters have no icon. (Extension shows non-printable icon)
+    icon_character_list: list[UnicodeCharacter] = [
+        unicode_character
+        for unicode_character in unicode_data_list
+        if (unicode_character.block in block_set)
+        and chr(int(unicode_character.code_point, base=16)).isprintable()
+    ]
+
+    if os.path.isdir(output_icon_pack_dir_path):
+        shutil.rmtree(output_icon_pack_dir_path)
+
+    namespace_dict: dict[str, dict] = {}
+
+    for font in font_list:
+        for background in background_list:
+            namespace = get_unicode_character_icon_namespace(background, font)
+
+            for unicode_character in icon_character_list:
+                code_point = unicode_character.code_point.lower()
+                icon_dir_path = (
+                    f"{output_icon_pack_dir_path}/{namespace}/{code_point[-2:]}"
+                )
+
+                os.makedirs(icon_dir_path, exist_ok=True)
+
+                with open(
+                    f"{icon_dir_path}/{ICON_FILE_PREFIX}{code_point}{ICON_FILE_EXTENSION}",
+                    "w",
+                ) as icon_file:
+                    icon_file.write(
+                        generate_icon_content(unicode_character, background, font)
+                    )
+
+            namespace_dict[namespace] = {
+                "font": font,
+                "background": background,
+                "code_points": [
+                    unicode_character.code_point
+                    for unicode_character in icon_character_list
+                ],
+            }
+
+    print(
+        f"save_unicode_character_icon_pack - Save {len(icon_character_list) * len(namespace_dict):,} icons to `{output_icon_pack_dir_path}`"
+    )
+    with open(
+        f"{output_icon_pack_dir_path}/{UNICODE_CHARACTER_ICON_PACK_INDEX_FILENAME}", "w"
+    ) as file:
+        json.dump(
+            {"version": UNICODE_CHARACTER_ICON_VERSION, "namespaces": namespace_dict},
+            file,
+        )
+
+
+if __name__ == "__main__":
+    # E.g., `python save_unicode_character_icon_pack.py --font "Noto Sans" --font serif`
+    argument_parser = argparse.ArgumentParser(
+        description="Save pre-made icons of characters (Icon pack)"
+    )
+    argument_parser.add_argument(
+        "--block", action="append", help="Block of characters in pack. (Repeatable)"
+    )
+    argument_parser.add_argument(
+        "--font", action="append", help="Font of icons. (Repeatable)"
+    )
+    argument_parser.add_argument(
+        "--background",
+        action="append",
+        choices=["none", "white"],
+        help="Background of icons. (Repeatable)",
+    )
+    arguments = argument_parser.parse_args()
+
+    ORIGINAL_UCD_ALL_FLAT_XML_PATH = "original_data/ucd.all.flat.xml"
+    OUTPUT_DIR = "data"
+    OUTPUT_ICON_PACK_DIR_PATH = f"{OUTPUT_DIR}/unicode_character_icon_pack"
+
+    if not os.path.exists(ORIGINAL_UCD_ALL_FLAT_XML_PATH):
+        raise FileNotFoundError(f"`{ORIGINAL_UCD_ALL_FLAT_XML_PATH}` not exist.")
+
+    # Process Full Unicode Characters
+    process_result = process_ucd_xml_file(ORIGINAL_UCD_ALL_FLAT_XML_PATH)
+
+    UNICODE_CHARACTER_DICT: dict[str, UnicodeCharacter] = process_result[
+        "UNICODE_CHARACTER_DICT"
+    ]
+    UNICODE_CHARACTER_LIST: list[UnicodeCharacter] = list(
+        UNICODE_CHARACTER_DICT.values()
+    )
+
+    if not os.path.isdir(OUTPUT_DIR):
+        print(f"`{OUTPUT_DIR}` directory is not exist. Create Directory.")
+        os.mkdir(OUTPUT_DIR)
+
+    save_unicode_character_icon_pack(
+        unicode_data_list=UNICODE_CHARACTER_LIST,
+        output_icon_pack_dir_path=OUTPUT_ICON_PACK_DIR_PATH,
+        block_list=arguments.block or DEFAULT_ICON_PACK_BLOCK_LIST,
+        font_list=arguments.font or DEFAULT_ICON_PACK_FONT_LIST,
+        background_list=(
+            [
+                None if background == "none" else background
+                for background in arguments.background
+            ]
+            if arguments.background
+            else DEFAULT_ICON_PACK_BACKGROUND_LIST
+        ),
+    )
@@ -0,0 +1,327 @@
+import os
+import struct
+import sys
+import zlib
+from array import array
+
+from process_ucd_xml_file import process_ucd_xml_file
+from process_ucd_xml_file import UnicodeCharacter
+
+# Format of `unicode_data.bin`. Same as `unicode_extension/unicode_data_binary.py`
+#
+# Little endian. Each section starts at a multiple of 4 bytes.
+#
+# - Header: magic, version, reserved, character number, block number,
+#   name range number, word number, checksum (CRC-32 of everything after header),
+#   offset of each section below
+# - Code points: uint32 * character number
+# - Name word offsets: uint32 * (character number + 1), offset in name word ids
+# - Block ids: uint16 * character number, index of block table
+# - Block string offsets: uint32 * (block number + 1), offset in block string blob
+# - Search string offsets: uint32 * (character number + 1), offset in search
+#   string blob
+# - Name ranges: uint32 * 3 * name range number, first code point, last code point
+#   and block id of each range
+# - Name range prefix offsets: uint32 * (name range number + 1), offset in name
+#   range prefix blob
+# - Word offsets: uint32 * (word number + 1), offset in word blob
+# - Name word ids: uint16 * (number of words of every name and alias), word ids
+#   of name and aliases of each character. `0xFFFF` between name and aliases.
+# - Block string blob: UTF-8, block names
+# - Search string blob: UTF-8, string for search of each character
+#   (See `convert_for_search`)
+# - Name range prefix blob: UTF-8, prefix of the rule of each range
+# - Word blob: UTF-8, sorted words of names and aliases (split by space)
+#
+# Characters of name ranges (names made by a rule, `CJK UNIFIED IDEOGRAPH-4E00`)
+# are not in the records above. (See `unicode_extension/unicode_name_range.py`)
+UNICODE_DATA_BINARY_MAGIC = b"UCDB"
+UNICODE_DATA_BINARY_VERSION = 4
+UNICODE_DATA_BINARY_HEADER = struct.Struct("<4sHHIIIIIIIIIIIIIIIIII")
+UNICODE_DATA_BINARY_NAME_WORD_SEPARATOR = " "
+UNICODE_DATA_BINARY_ALIAS_SEPARATOR_WORD_ID = 0xFFFF
+
+# Same as `unicode_extension/unicode_name_range.py`
+CODE_POINT_NAME_PREFIX_LIST = [
+    "CJK UNIFIED IDEOGRAPH-",
+    "CJK COMPATIBILITY IDEOGRAPH-",
+    "TANGUT IDEOGRAPH-",
+    "KHITAN SMALL SCRIPT CHARACTER-",
+    "NUSHU CHARACTER-",
+]
+HANGUL_SYLLABLE_NAME_PREFIX = "HANGUL SYLLABLE "
+HANGUL_SYLLABLE_FIRST_CODE_POINT = 0xAC00
+HANGUL_SYLLABLE_LAST_CODE_POINT = 0xD7A3
+
+HANGUL_JAMO_L_NAME_LIST = [
+    *["G", "GG", "N", "D", "DD", "R", "M", "B", "BB", "S"],
+    *["SS", "", "J", "JJ", "C", "K", "T", "P", "H"],
+]
+HANGUL_JAMO_V_NAME_LIST = [
+    *["A", "AE", "YA", "YAE", "EO", "E", "YEO", "YE", "O", "WA", "WAE"],
+    *["OE", "YO", "U", "WEO", "WE", "WI", "YU", "EU", "YI", "I"],
+]
+HANGUL_JAMO_T_NAME_LIST = [
+    *["", "G", "GG", "GS", "N", "NJ", "NH", "D", "L", "LG", "LM", "LB", "LS", "LT"],
+    *["LP", "LH", "M", "B", "BS", "S", "SS", "NG", "J", "C", "K", "T", "P", "H"],
+]
+
+
+def convert_for_search(u_code_point: str, name: str, aliases: list[str]) -> str:
+    """Same as `convert_for_search` of `unicode_extension/unicode_character.py`"""
+
+    string_list: list[str] = []
+
+    for string in [u_code_point, name, *aliases]:
+        if string not in string_list:
+            string_list.append(string)
+
+    return " ".join(string_list).upper()
+
+
+def generate_name(prefix: str, code_point: int) -> str:
+    """Same as `generate_name` of `unicode_extension/unicode_name_range.py`"""
+
+    if prefix == HANGUL_SYLLABLE_NAME_PREFIX:
+        syllable_index = code_point - HANGUL_SYLLABLE_FIRST_CODE_POINT
+
+        l_index, vt_index = divmod(
+            syllable_index,
+            len(HANGUL_JAMO_V_NAME_LIST) * len(HANGUL_JAMO_T_NAME_LIST),
+        )
+        v_index, t_index = divmod(vt_index, len(HANGUL_JAMO_T_NAME_LIST))
+
+        return (
+            prefix
+            + HANGUL_JAMO_L_NAME_LIST[l_index]
+            + HANGUL_JAMO_V_NAME_LIST[v_index]
+            + HANGUL_JAMO_T_NAME_LIST[t_index]
+        )
+
+    return f"{prefix}{code_point:04X}"
+
+
+def find_name_prefix(unicode_character: UnicodeCharacter) -> str | None:
+    """Find prefix of the rule the name of character is made by
+
+    Returns:
+        E.g., `"CJK UNIFIED IDEOGRAPH-"`. `None` if the name is not made by a rule,
+        or the character has aliases. (Aliases are stored only in records)
+    """
+
+    if len(unicode_character.aliases) > 0:
+        return None
+
+    code_point = int(unicode_character.code_point, base=16)
+    name = unicode_character.name
+
+    if (
+        HANGUL_SYLLABLE_FIRST_CODE_POINT
+        <= code_point
+        <= HANGUL_SYLLABLE_LAST_CODE_POINT
+    ):
+        prefix = HANGUL_SYLLABLE_NAME_PREFIX
+    else:
+        prefix = name[: name.rfind("-") + 1]
+
+        if prefix not in CODE_POINT_NAME_PREFIX_LIST:
+            return None
+
+    if name != generate_name(prefix, code_point):
+        return None
+
+    return prefix
+
+
+def save_unicode_data_to_binary_file(
+    unicode_data_list: list[UnicodeCharacter],
+    output_binary_file_path: str,
+):
+    """Save Unicode data to binary file (`unicode_data.bin`)
+
+    Compact form of `unicode_data.json`, read by memory-mapping without parsing
+    the whole file.
+
+    Args:
+        unicode_data_list: Unicode characters, in order of code point.
+        output_binary_file_path: Output binary file path.
+    """
+
+    block_list: list[str] = list(
+        dict.fromkeys(
+            unicode_character.block for unicode_character in unicode_data_list
+        )
+    )
+    block_id_dict: dict[str, int] = {block: i for i, block in enumerate(block_list)}
+
+    # Words of names and aliases, sorted. (Names are stored as word ids)
+    word_list: list[str] = sorted(
+        set(
+            word
+            for unicode_character in unicode_data_list
+            if find_name_prefix(unicode_character) is None
+            for string in [unicode_character.name, *unicode_character.aliases]
+            for word in string.split(UNICODE_DATA_BINARY_NAME_WORD_SEPARATOR)
+        )
+    )
+    word_id_dict: dict[str, int] = {word: i for i, word in enumerate(word_list)}
+
+    if len(word_list) >= UNICODE_DATA_BINARY_ALIAS_SEPARATOR_WORD_ID:
+        raise ValueError(f"Too many words of names. ({len(word_list)})")
+
+    code_point_array = array("I")
+    name_word_offset_array = array("I", [0])
+    block_id_array = array("H")
+    name_word_id_array = array("H")
+    search_string_offset_array = array("I", [0])
+    search_string_blob = bytearray()
+
+    # [first code point, last code point, block id] of each range
+    name_range_array = array("I")
+    name_range_prefix_list: list[str] = []
+
+    for unicode_character in unicode_data_list:
+        code_point = int(unicode_character.code_point, base=16)
+        block_id = block_id_dict[unicode_character.block]
+        prefix = find_name_prefix(unicode_character)
+
+        if prefix is not None:
+            # Contiguous to the last range of the same rule and block
+            if (
+                (len(name_range_prefix_list) > 0)
+                and (name_range_prefix_list[-1] == prefix)
+                and (name_range_array[-2] + 1 == code_point)
+                and (name_range_array[-1] == block_id)
+            ):
+                name_range_array[-2] = code_point
+            else:
+                name_range_array.extend([code_point, code_point, block_id])
+                name_range_prefix_list.append(prefix)
+
+            continue
+
+        code_point_array.append(code_point)
+        block_id_array.append(block_id)
+
+        for i, string in enumerate(
+            [unicode_character.name, *unicode_character.aliases]
+        ):
+            if i > 0:
+                name_word_id_array.append(UNICODE_DATA_BINARY_ALIAS_SEPARATOR_WORD_ID)
+
+            name_word_id_array.extend(
+                word_id_dict[word]
+                for word in string.split(UNICODE_DATA_BINARY_NAME_WORD_SEPARATOR)
+            )
+
+        name_word_offset_array.append(len(name_word_id_array))
+
+        search_string_blob += convert_for_search(
+            f"U+{unicode_character.code_point}",
+            unicode_character.name,
+            unicode_character.aliases,
+        ).encode("utf-8")
+        search_string_offset_array.append(len(search_string_blob))
+
+    block_string_offset_array = array("I", [0])
+    block_string_blob = bytearray()
+
+    for block in block_list:
+        block_string_blob += block.encode("utf-8")
+        block_string_offset_array.append(len(block_string_blob))
+
+    name_range_prefix_offset_array = array("I", [0])
+    name_range_prefix_blob = bytearray()
+
+    for prefix in name_range_prefix_list:
+        name_range_prefix_blob += prefix.encode("utf-8")
+        name_range_prefix_offset_array.append(len(name_range_prefix_blob))
+
+    word_offset_array = array("I", [0])
+    word_blob = bytearray()
+
+    for word in word_list:
+        word_blob += word.encode("utf-8")
+        word_offset_array.append(len(word_blob))
+
+    section_list: list[bytes] = []
+
+    for section_array in [
+        code_point_array,
+        name_word_offset_array,
+        block_id_array,
+        block_string_offset_array,
+        search_string_offset_array,
+        name_range_array,
+        name_range_prefix_offset_array,
+        word_offset_array,
+        name_word_id_array,
+    ]:
+        if sys.byteorder != "little":
+            section_array.byteswap()
+
+        section_list.append(section_array.tobytes())
+
+    section_list.append(bytes(block_string_blob))
+    section_list.append(bytes(search_string_blob))
+    section_list.append(bytes(name_range_prefix_blob))
+    section_list.append(bytes(word_blob))
+
+    section_offset_list: list[int] = []
+    offset = UNICODE_DATA_BINARY_HEADER.size
+    body = bytearray()
+
+    for section in section_list:
+        section_offset_list.append(offset)
+        offset += len(section) + (-len(section) % 4)
+
+        body += section
+        body += b"\0" * (-len(section) % 4)
+
+    header = UNICODE_DATA_BINARY_HEADER.pack(
+        UNICODE_DATA_BINARY_MAGIC,
+        UNICODE_DATA_BINARY_VERSION,
+        0,
+        len(code_point_array),
+        len(block_list),
+        len(name_range_prefix_list),
+        len(word_list),
+        zlib.crc32(body),
+        *section_offset_list,
+    )
+
+    print(
+        f"save_unicode_data_to_binary_file - Save Unicode data to `{output_binary_file_path}`"
+    )
+    with open(output_binary_file_path, "wb") as file:
+        file.write(header)
+        file.write(body)
+
+
+if __name__ == "__main__":
+
+    ORIGINAL_UCD_ALL_FLAT_XML_PATH = "original_data/ucd.all.flat.xml"
+    OUTPUT_DIR = "data"
+    OUTPUT_BINARY_FILE_PATH = f"{OUTPUT_DIR}/unicode_data.bin"
+
+    if not os.path.exists(ORIGINAL_UCD_ALL_FLAT_XML_PATH):
+        raise FileNotFoundError(f"`{ORIGINAL_UCD_ALL_FLAT_XML_PATH}` not exist.")
+
+    # Process Full Unicode Characters
+    process_result = process_ucd_xml_file(ORIGINAL_UCD_ALL_FLAT_XML_PATH)
+
+    UNICODE_CHARACTER_DICT: dict[str, UnicodeCharacter] = process_result[
+        "UNICODE_CHARACTER_DICT"
+    ]
+    UNICODE_CHARACTER_LIST: list[UnicodeCharacter] = list(
+        UNICODE_CHARACTER_DICT.values()
+    )
+
+    if not os.path.isdir(OUTPUT_DIR):
+        print(f"`{OUTPUT_DIR}` directory is not exist. Create Directory.")
+        os.mkdir(OUTPUT_DIR)
+
+    save_unicode_data_to_binary_file(
+        unicode_data_list=UNICODE_CHARACTER_LIST,
+        output_binary_file_path=OUTPUT_BINARY_FILE_PATH,
+    )
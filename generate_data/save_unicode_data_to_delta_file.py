@@ -0,0 +1,212 @@
+import os
+import json
+import unicodedata
+
+from process_ucd_xml_file import process_ucd_xml_file
+from process_ucd_xml_file import UnicodeCharacter
+
+# Format of `unicode_data_delta.json`. Read by `load_unicode_data_from_delta` of
+# `unicode_extension/load_unicode_data.py`
+#
+# Only what Python `unicodedata` of the same `unidata_version` can't give:
+#
+# - `unidata_version`: `unicodedata.unidata_version` the delta is made against.
+#   Names are read from `unicodedata.name()`, so it's used only with this version.
+# - `blocks`: `[first code point, last code point, block]` of characters in each
+#   block. Characters in a block are the ones `unicodedata` has names of,
+#   and the ones of `characters` below.
+# - `characters`: Characters that `unicodedata` can't give everything of.
+#   `na` if name is different (e.g., Unicode 1.0 name `LINE FEED (LF)` of control
+#   character, and characters not in `unicodedata`), `als` if it has aliases.
+# - `excluded`: Code points `unicodedata` has names of, but not in Unicode data.
+#   (Not in file if it's empty)
+
+
+def find_stdlib_name(code_point: int) -> str | None:
+    """Name of `unicodedata`. `None` if it has no name of the code point."""
+
+    return unicodedata.name(chr(code_point), None)
+
+
+def create_unicode_data_delta(unicode_data_list: list[UnicodeCharacter]) -> dict:
+    """Delta of Unicode data from `unicodedata`. (See format above)"""
+
+    block_list: list[list] = []
+    character_list: list[dict] = []
+
+    for unicode_character in unicode_data_list:
+        code_point = int(unicode_character.code_point, base=16)
+
+        if (len(block_list) > 0) and (block_list[-1][2] == unicode_character.block):
+            block_list[-1][1] = unicode_character.code_point
+        else:
+            block_list.append(
+                [
+                    unicode_character.code_point,
+                    unicode_character.code_point,
+                    unicode_character.block,
+                ]
+            )
+
+        character_data: dict = {"cp": unicode_character.code_point}
+
+        if find_stdlib_name(code_point) != unicode_character.name:
+            character_data["na"] = unicode_character.name
+
+        if len(unicode_character.aliases) > 0:
+            character_data["als"] = unicode_character.aliases
+
+        if len(character_data) > 1:
+            character_list.append(character_data)
+
+    code_point_set = set(
+        int(unicode_character.code_point, base=16)
+        for unicode_character in unicode_data_list
+    )
+    excluded_list: list[str] = [
+        f"{code_point:04X}"
+        for first, last, _ in block_list
+        for code_point in range(int(first, base=16), int(last, base=16) + 1)
+        if (code_point not in code_point_set)
+        and (find_stdlib_name(code_point) is not None)
+    ]
+
+    unicode_data_delta: dict = {
+        "unidata_version": unicodedata.unidata_version,
+        "blocks": block_list,
+        "characters": character_list,
+    }
+
+    if len(excluded_list) > 0:
+        unicode_data_delta["excluded"] = excluded_list
+
+    return unicode_data_delta
+
+
+def restore_unicode_data_from_delta(unicode_data_delta: dict) -> list[tuple]:
+    """Unicode data of delta. Same as `load_unicode_data_from_delta`
+
+    Returns:
+        `(code point, name, block, aliases)` of each character.
+    """
+
+    character_data_dict: dict[int, dict] = {
+        int(character_data["cp"], base=16): character_data
+        for character_data in unicode_data_delta["characters"]
+    }
+    excluded_set = set(
+        int(code_point, base=16)
+        for code_point in unicode_data_delta.get("excluded", [])
+    )
+
+    result: list[tuple] = []
+
+    for first, last, block in unicode_data_delta["blocks"]:
+        for code_point in range(int(first, base=16), int(last, base=16) + 1):
+            character_data = character_data_dict.get(code_point, {})
+            name = character_data.get("na", find_stdlib_name(code_point))
+
+            if (name is None) or (code_point in excluded_set):
+                continue
+
+            result.append(
+                (f"{code_point:04X}", name, block, character_data.get("als", []))
+            )
+
+    return result
+
+
+def verify_unicode_data_delta(
+    unicode_data_list: list[UnicodeCharacter], unicode_data_delta: dict
+):
+    """Verify that delta gives the same data for every code point.
+
+    Names given by `unicodedata.name()` are checked by `unicodedata.lookup()` too.
+    (Raises `RuntimeError` if it's different)
+    """
+
+    restored_list = restore_unicode_data_from_delta(unicode_data_delta)
+    original_list = [
+        (
+            unicode_character.code_point,
+            unicode_character.name,
+            unicode_character.block,
+            unicode_character.aliases,
+        )
+        for unicode_character in unicode_data_list
+    ]
+
+    if len(restored_list) != len(original_list):
+        raise RuntimeError(
+            f"verify_unicode_data_delta - Number of characters is different. ({len(restored_list)} != {len(original_list)})"
+        )
+
+    for restored, original in zip(restored_list, original_list):
+        if restored != original:
+            raise RuntimeError(
+                f"verify_unicode_data_delta - Character is different. ({restored} != {original})"
+            )
+
+        code_point, name, _, _ = original
+
+        if (find_stdlib_name(int(code_point, base=16)) == name) and (
+            unicodedata.lookup(name) != chr(int(code_point, base=16))
+        ):
+            raise RuntimeError(
+                f"verify_unicode_data_delta - `unicodedata.lookup` is different. (U+{code_point} {name})"
+            )
+
+
+def save_unicode_data_to_delta_file(
+    unicode_data_list: list[UnicodeCharacter],
+    output_delta_file_path: str,
+):
+    """Save delta of Unicode data from `unicodedata` (`unicode_data_delta.json`)
+
+    Names come from Python `unicodedata` of the same version when it's loaded,
+    so the file has only aliases, blocks and names `unicodedata` doesn't have.
+    Every code point is verified before saving.
+
+    Args:
+        unicode_data_list: Unicode characters, in order of code point.
+        output_delta_file_path: Output delta file path.
+    """
+
+    unicode_data_delta = create_unicode_data_delta(unicode_data_list)
+
+    verify_unicode_data_delta(unicode_data_list, unicode_data_delta)
+
+    print(
+        f"save_unicode_data_to_delta_file - Save Unicode data delta of unicodedata {unicodedata.unidata_version} to `{output_delta_file_path}`"
+    )
+    with open(output_delta_file_path, "w") as file:
+        json.dump(unicode_data_delta, file, separators=(",", ":"))
+
+
+if __name__ == "__main__":
+
+    ORIGINAL_UCD_ALL_FLAT_XML_PATH = "original_data/ucd.all.flat.xml"
+    OUTPUT_DIR = "data"
+    OUTPUT_DELTA_FILE_PATH = f"{OUTPUT_DIR}/unicode_data_delta.json"
+
+    if not os.path.exists(ORIGINAL_UCD_ALL_FLAT_XML_PATH):
+        raise FileNotFoundError(f"`{ORIGINAL_UCD_ALL_FLAT_XML_PATH}` not exist.")
+
+    # Process Full Unicode Characters
+    process_result = process_ucd_xml_file(ORIGINAL_UCD_ALL_FLAT_XML_PATH)
+
+    UNICODE_CHARACTER_DICT: dict[str, UnicodeCharacter] = process_result[
+        "UNICODE_CHARACTER_DICT"
+    ]
+    UNICODE_CHARACTER_LIST: list[UnicodeCharacter] = list(
+        UNICODE_CHARACTER_DICT.values()
+    )
+
+    if not os.path.isdir(OUTPUT_DIR):
+        print(f"`{OUTPUT_DIR}` directory is not exist. Create Directory.")
+        os.mkdir(OUTPUT_DIR)
+
+    save_unicode_data_to_delta_file(
+        unicode_data_list=UNICODE_CHARACTER_LIST,
+        output_delta_file_path=OUTPUT_DELTA_FILE_PATH,
+    )
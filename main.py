@@ -5,12 +5,13 @@ import sys
 from ulauncher.api.client.Extension import Extension
 from ulauncher.api.client.EventListener import EventListener
 
+from ulauncher.api.shared.action.RenderResultListAction import RenderResultListAction
 from ulauncher.api.shared.event import KeywordQueryEvent
 from ulauncher.api.shared.event import PreferencesEvent
 from ulauncher.api.shared.event import PreferencesUpdateEvent
+from ulauncher.api.shared.Response import Response
 
 from unicode_extension.load_unicode_data import load_unicode_data
-from unicode_extension.unicode_character_icon import reset_unicode_character_icon_dir
 from unicode_extension.unicode_extension_feature import UnicodeExtensionFeature
 from unicode_extension.util import get_project_path
 
@@ -21,26 +22,32 @@ class UlauncherUnicodeExtension(Extension):
     def __init__(self):
         super().__init__()
 
-        reset_unicode_character_icon_dir()
-
         self.subscribe(KeywordQueryEvent, UlauncherKeywordQueryEventListener())
         self.subscribe(PreferencesEvent, UlauncherPreferencesEventListener())
         self.subscribe(
             PreferencesUpdateEvent, UlauncherPreferencesUpdateEventListener()
         )
 
-        unicode_data = load_unicode_data()
-
+        # Queries are answered while Unicode data is loading. (Conversion only)
         self.feature: UnicodeExtensionFeature = UnicodeExtensionFeature(
-            project_path=get_project_path(),
-            unicode_character_list=unicode_data["UNICODE_CHARACTER_LIST"],
-            unicode_character_dict=unicode_data["UNICODE_CHARACTER_DICT"],
+            project_path=get_project_path()
         )
+        self.feature.load_unicode_data_in_background(load_unicode_data)
+
+    def send_action(self, event: KeywordQueryEvent, action: RenderResultListAction):
+        """Send action of event later. (Same as `Extension.trigger_event` does with
+        action returned by listener)"""
+
+        self._client.send(Response(event, action))
 
 
 class UlauncherKeywordQueryEventListener(EventListener):
     def on_event(self, event: KeywordQueryEvent, extension: UlauncherUnicodeExtension):
-        return extension.feature.handle_keyword_query_event(event)
+        # Events are dispatched one by one. Result is sent from worker, so the next
+        # keystroke can stop this search. (Nothing is returned here)
+        extension.feature.handle_keyword_query_event_in_background(
+            event, lambda action: extension.send_action(event, action)
+        )
 
 
 class UlauncherPreferencesEventListener(EventListener):
@@ -0,0 +1,133 @@
+import re
+from typing import Callable
+
+from .search_unicode_character import search_unicode_character
+from .unicode_block_index import UnicodeBlockIndex
+from .unicode_character import UnicodeCharacter
+
+
+# E.g., `blk:arrows right`, `in:box heavy`
+BLOCK_QUERY_PATTERN = re.compile(r"^\s*((?:BLK|IN):)(.*)$", re.IGNORECASE | re.DOTALL)
+
+
+class BlockQuery:
+    """
+    Query scoped to a Unicode block.
+
+    Attributes:
+        prefix (str): Typed prefix. `"blk:"` or `"in:"`
+        block_query (str): Typed block name part. E.g., `"arrows right"`
+        block (str | None): Matched block of `block_query`. E.g., `"Arrows"`
+            `None` if no block matches.
+        search_query (str): Rest of query after block name. E.g., `"RIGHT"`
+        is_completing (bool): Only block name is being typed. (`blk:`, `blk:arr`)
+            Block names are suggested, instead of characters.
+    """
+
+    prefix: str
+    block_query: str
+    block: str | None
+    search_query: str
+    is_completing: bool
+
+    def __init__(
+        self,
+        prefix: str,
+        block_query: str,
+        block: str | None,
+        search_query: str,
+        is_completing: bool,
+    ):
+        self.prefix = prefix
+        self.block_query = block_query
+        self.block = block
+        self.search_query = search_query
+        self.is_completing = is_completing
+
+    def __str__(self):
+        return f"{self.prefix}{self.block} - '{self.search_query}'"
+
+    def __repr__(self):
+        return str(self)
+
+
+def parse_block_query(
+    query: str, unicode_block_index: UnicodeBlockIndex
+) -> BlockQuery | None:
+    """Classify query scoped to a block.
+
+    Block name is taken from the words after prefix, more words only when they
+    make it unique or exact. (See `UnicodeBlockIndex.split_block_query`)
+
+    Args:
+        query: E.g., `"blk:arrows right"`, `"in:box heavy"`, `"blk:"`
+        unicode_block_index: Block index of searching list.
+
+    Returns:
+        `BlockQuery`, or `None` if query doesn't start with `blk:` or `in:`
+    """
+
+    match = BLOCK_QUERY_PATTERN.match(query)
+
+    if match is None:
+        return None
+
+    prefix = match[1].lower()
+    block_query = match[2]
+
+    block, search_query = unicode_block_index.split_block_query(block_query)
+
+    # Trailing space means block name is done (e.g., selected suggestion).
+    is_completing = (search_query == "") and (
+        (block_query == "") or (not block_query[-1].isspace())
+    )
+
+    return BlockQuery(prefix, block_query, block, search_query, is_completing)
+
+
+def search_unicode_character_in_block(
+    block_query: BlockQuery,
+    unicode_character_list: list[UnicodeCharacter],
+    unicode_block_index: UnicodeBlockIndex,
+    limit: int = 10,
+    should_stop: Callable[[], bool] | None = None,
+) -> list[UnicodeCharacter]:
+    """Search Unicode character only in the block of query.
+
+    The block is a contiguous slice of `unicode_character_list`, so only
+    the characters of the block are scored, instead of the whole list.
+
+    Args:
+        block_query: Result of `parse_block_query`
+        unicode_character_list: Sorted by code point.
+        unicode_block_index: Block index of `unicode_character_list`
+        limit: Search result item number.
+        should_stop: Same as `search_unicode_character`
+
+    Returns:
+        Found characters. Without search query, characters of the block
+        in order of code point.
+    """
+
+    if block_query.block is None:
+        return []
+
+    block_position_range = unicode_block_index.block_position_range_dict[
+        block_query.block
+    ]
+
+    if block_query.search_query == "":
+        return [
+            unicode_character_list[position]
+            for position in block_position_range[:limit]
+        ]
+
+    search_result = search_unicode_character(
+        query=block_query.search_query,
+        unicode_character_list=unicode_character_list,
+        limit=limit,
+        candidate_position_list=list(block_position_range),
+        should_stop=should_stop,
+    )
+
+    return [unicode_character for (unicode_character, _, _) in search_result]
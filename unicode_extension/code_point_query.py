@@ -0,0 +1,191 @@
+import bisect
+import re
+
+from .unicode_character import UnicodeCharacter
+from .unicode_character_store import (
+    UnicodeCharacterList,
+    get_unicode_character_by_code_point,
+)
+
+MAX_CODE_POINT = 0x10FFFF
+
+# Code point of range. Hex digits of `U+`, `0x`, or bare hex digits as
+# `BARE_HEX_CODE_POINT_PATTERN`. (Not words like `a..b`, `c..f`)
+RANGE_CODE_POINT_PATTERN = (
+    r"(?:(?:U\+|0X)([0-9A-F]{1,6})|((?=[0-9A-F]*[0-9])[0-9A-F]{4,6}))"
+)
+# E.g., `U+2190..U+21FF`, `2190..21FF`
+CODE_POINT_RANGE_PATTERN = re.compile(
+    rf"^{RANGE_CODE_POINT_PATTERN}\s*\.\.\s*{RANGE_CODE_POINT_PATTERN}$"
+)
+# E.g., `U+2014`, `0x1F600`, `&#x2603;`
+HEX_CODE_POINT_PATTERN = re.compile(r"^(?:U\+|0X|&#X)([0-9A-F]{1,6});?$")
+# E.g., `&#9731;`, `#9731`
+DECIMAL_CODE_POINT_PATTERN = re.compile(r"^(?:&#|#)([0-9]{1,7});?$")
+# E.g., `2014`, `1F600` (Without digit, it's a word like `FACE`)
+BARE_HEX_CODE_POINT_PATTERN = re.compile(r"^(?=.*[0-9])[0-9A-F]{4,6}$")
+
+
+class CodePointQuery:
+    """
+    Query of code point form.
+
+    Attributes:
+        kind (str): One of below
+            `"range"`: `U+2190..U+21FF`
+            `"hex"`: `U+2014`, `0x1F600`, `&#x2603;`
+            `"decimal"`: `&#9731;`, `#9731`
+            `"bare"`: `2014`, `1F600` (Can be a part of character name)
+        first_code_point (int): Code point. First code point of range.
+        last_code_point (int): Same as `first_code_point`. Last code point of range.
+        hex_digits (str): Hex digits of query. Only for `"hex"`, `"bare"`.
+    """
+
+    kind: str
+    first_code_point: int
+    last_code_point: int
+    hex_digits: str
+
+    def __init__(
+        self,
+        kind: str,
+        first_code_point: int,
+        last_code_point: int,
+        hex_digits: str = "",
+    ):
+        self.kind = kind
+        self.first_code_point = first_code_point
+        self.last_code_point = last_code_point
+        self.hex_digits = hex_digits
+
+    def __str__(self):
+        return (
+            f"{self.kind}: U+{self.first_code_point:04X}..U+{self.last_code_point:04X}"
+        )
+
+    def __repr__(self):
+        return str(self)
+
+
+def parse_code_point_query(query: str) -> CodePointQuery | None:
+    """Classify query of code point form.
+
+    Args:
+        query: E.g., `"U+2014"`, `"0x1F600"`, `"&#x2603;"`, `"#9731"`, `"U+2190..U+21FF"`
+
+    Returns:
+        `CodePointQuery`, or `None` if query is not code point form
+        (or code point is out of Unicode range).
+    """
+
+    query = query.strip().upper()
+
+    code_point_query: CodePointQuery | None = None
+
+    if match := CODE_POINT_RANGE_PATTERN.match(query):
+        # Digits are in one of groups. (`U+`, `0x`, or bare)
+        first_code_point = int(match[1] or match[2], base=16)
+        last_code_point = int(match[3] or match[4], base=16)
+
+        code_point_query = CodePointQuery(
+            "range",
+            min(first_code_point, last_code_point),
+            max(first_code_point, last_code_point),
+        )
+    elif match := HEX_CODE_POINT_PATTERN.match(query):
+        code_point = int(match[1], base=16)
+        code_point_query = CodePointQuery("hex", code_point, code_point, match[1])
+    elif match := DECIMAL_CODE_POINT_PATTERN.match(query):
+        code_point = int(match[1])
+        code_point_query = CodePointQuery("decimal", code_point, code_point)
+    elif match := BARE_HEX_CODE_POINT_PATTERN.match(query):
+        code_point = int(match[0], base=16)
+        code_point_query = CodePointQuery("bare", code_point, code_point, match[0])
+
+    if (code_point_query is None) or (
+        code_point_query.first_code_point > MAX_CODE_POINT
+    ):
+        return None
+
+    code_point_query.last_code_point = min(
+        code_point_query.last_code_point, MAX_CODE_POINT
+    )
+
+    return code_point_query
+
+
+def search_unicode_character_by_code_point(
+    code_point_query: CodePointQuery,
+    unicode_character_list: list[UnicodeCharacter],
+    unicode_character_dict: dict[str, UnicodeCharacter],
+    limit: int = 10,
+) -> list[UnicodeCharacter]:
+    """Search Unicode character of code point query, without fuzzy search.
+
+    - `"range"`: Characters in range, in order of code point.
+    - `"hex"`: The character, and characters with code point starting with query.
+      (`U+201` -> `U+0201`, `U+2010`, `U+2011`, ..., `U+201F`)
+      For type-ahead, like the fuzzy search did for `U+201`.
+    - `"decimal"`, `"bare"`: The character.
+
+    Args:
+        code_point_query: Result of `parse_code_point_query`
+        unicode_character_list: Sorted by code point.
+        unicode_character_dict: Key is `U+XXXX`
+        limit: Search result item number.
+
+    Returns:
+        Found characters. Unassigned code points are skipped.
+    """
+
+    def get_unicode_character(code_point: int) -> UnicodeCharacter | None:
+        return get_unicode_character_by_code_point(unicode_character_dict, code_point)
+
+    unicode_character_result_list: list[UnicodeCharacter] = []
+
+    if code_point_query.kind == "range":
+        # Range can have big unassigned area. Find start in the list, not in dict.
+        # Bisect code points of store, not making a character at each probe.
+        if isinstance(unicode_character_list, UnicodeCharacterList):
+            code_point_sequence = unicode_character_list.store.code_point_array
+            key = None
+        else:
+            code_point_sequence = unicode_character_list
+            key = lambda unicode_character: int(unicode_character.code_point, base=16)
+
+        start = bisect.bisect_left(
+            code_point_sequence, code_point_query.first_code_point, key=key
+        )
+        end = bisect.bisect_right(
+            code_point_sequence, code_point_query.last_code_point, lo=start, key=key
+        )
+
+        unicode_character_result_list.extend(
+            unicode_character_list[start : min(end, start + limit)]
+        )
+
+        return unicode_character_result_list
+
+    unicode_character = get_unicode_character(code_point_query.first_code_point)
+
+    if unicode_character is not None:
+        unicode_character_result_list.append(unicode_character)
+
+    if code_point_query.kind == "hex":
+        first_child_code_point = code_point_query.first_code_point * 16
+
+        for code_point in range(first_child_code_point, first_child_code_point + 16):
+            if (len(unicode_character_result_list) >= limit) or (
+                code_point > MAX_CODE_POINT
+            ):
+                break
+
+            unicode_character = get_unicode_character(code_point)
+
+            # `U+0201` is not a start of `U+2010`
+            if (unicode_character is not None) and (
+                unicode_character.code_point.startswith(code_point_query.hex_digits)
+            ):
+                unicode_character_result_list.append(unicode_character)
+
+    return unicode_character_result_list[:limit]
@@ -1,29 +1,212 @@
 import json
-from .unicode_character import UnicodeCharacter
-from .util import get_project_path
+import logging
+import os
+import time
+import unicodedata
 
+from .unicode_character_store import (
+    UnicodeCharacterDict,
+    UnicodeCharacterList,
+    UnicodeCharacterStore,
+)
+from .unicode_data_binary import UnicodeDataBinary
+from .unicode_data_snapshot import (
+    UNICODE_DATA_SNAPSHOT_FILENAME,
+    load_unicode_data_snapshot,
+    save_unicode_data_snapshot,
+)
+from .unicode_name_lexicon import UnicodeNameLexicon
+from .util import get_cache_dir_path, get_project_path
+
+logger = logging.getLogger(__name__)
 
 PROJECT_PATH = get_project_path()
+SNAPSHOT_DIR_PATH = get_cache_dir_path()
+
+
+def load_unicode_data(
+    project_path: str = PROJECT_PATH, snapshot_dir_path: str | None = SNAPSHOT_DIR_PATH
+) -> dict:
+    """Load Unicode Data (`unicode_data.bin`, `unicode_data_delta.json`, or
+    `unicode_data.json`)
+
+    `unicode_data.bin` is a compact binary format, parsed in full at load.
+    (Faster than JSON, no names to split or strings for search to make)
+    If it doesn't exist (or can't be read), `unicode_data_delta.json` is loaded
+    with names of Python `unicodedata`, if its Unicode version is the same.
+    Otherwise `unicode_data.json` is loaded.
+
+    Characters are kept in columns. (See `UnicodeCharacterStore`)
+    `UnicodeCharacter` of list and dict is made when it's accessed.
 
+    Loaded data and its search indexes are saved to a snapshot in
+    `snapshot_dir_path`, and next load uses it while data files and extension
+    are not changed. (See `unicode_data_snapshot.py`)
 
-def load_unicode_data() -> dict:
-    """Load Unicode Data (`unicode_data.json`)
+    Args:
+        project_path: Path of project, which has `data/unicode_data.json`
+        snapshot_dir_path: Directory of snapshot file. `None` for no snapshot.
 
     Returns:
 
         {
-            UNICODE_CHARACTER_LIST: list[UnicodeCharacter],
-            UNICODE_CHARACTER_DICT: dict[str, UnicodeCharacter],
+            UNICODE_CHARACTER_LIST: UnicodeCharacterList, (`list[UnicodeCharacter]`)
+            UNICODE_CHARACTER_DICT: UnicodeCharacterDict, (`dict[str, UnicodeCharacter]`)
         }
 
     """
 
-    UNICODE_DATA_JSON_PATH = f"{PROJECT_PATH}/data/unicode_data.json"
+    UNICODE_DATA_BINARY_PATH = f"{project_path}/data/unicode_data.bin"
+    UNICODE_DATA_DELTA_PATH = f"{project_path}/data/unicode_data_delta.json"
+    UNICODE_DATA_JSON_PATH = f"{project_path}/data/unicode_data.json"
+
+    start = time.perf_counter()
+
+    if snapshot_dir_path is None:
+        return load_unicode_data_from_data_file(
+            UNICODE_DATA_BINARY_PATH, UNICODE_DATA_JSON_PATH, UNICODE_DATA_DELTA_PATH
+        )
+
+    snapshot_file_path = f"{snapshot_dir_path}/{UNICODE_DATA_SNAPSHOT_FILENAME}"
+    data_file_path_list = [
+        UNICODE_DATA_BINARY_PATH,
+        UNICODE_DATA_JSON_PATH,
+        UNICODE_DATA_DELTA_PATH,
+    ]
+
+    unicode_data = load_unicode_data_snapshot(snapshot_file_path, data_file_path_list)
+
+    if unicode_data is not None:
+        logger.info(
+            f"Unicode data loaded from snapshot (warm start): {(time.perf_counter() - start) * 1000:.1f}ms"
+        )
+
+        return unicode_data
+
+    unicode_data = load_unicode_data_from_data_file(
+        UNICODE_DATA_BINARY_PATH, UNICODE_DATA_JSON_PATH, UNICODE_DATA_DELTA_PATH
+    )
+
+    try:
+        save_unicode_data_snapshot(
+            snapshot_file_path, data_file_path_list, unicode_data
+        )
+    except OSError as error:
+        logger.warning(f"Can't save snapshot `{snapshot_file_path}`. {error}")
+
+    logger.info(
+        f"Unicode data loaded and snapshot saved (cold start): {(time.perf_counter() - start) * 1000:.1f}ms"
+    )
+
+    return unicode_data
+
+
+def load_unicode_data_from_data_file(
+    unicode_data_binary_path: str,
+    unicode_data_json_path: str,
+    unicode_data_delta_path: str | None = None,
+) -> dict:
+    """Load Unicode Data from `unicode_data.bin`, `unicode_data_delta.json`, or
+    `unicode_data.json`
+
+    Returns: Same as `load_unicode_data`
+    """
+
+    if os.path.exists(unicode_data_binary_path):
+        try:
+            return load_unicode_data_from_binary(unicode_data_binary_path)
+        except (OSError, ValueError, IndexError) as error:
+            logger.warning(
+                f"Can't load `{unicode_data_binary_path}`, load JSON instead. {error}"
+            )
+
+    if (unicode_data_delta_path is not None) and os.path.exists(
+        unicode_data_delta_path
+    ):
+        try:
+            return load_unicode_data_from_delta(unicode_data_delta_path)
+        except (OSError, ValueError, KeyError) as error:
+            logger.warning(
+                f"Can't load `{unicode_data_delta_path}`, load JSON instead. {error}"
+            )
+
+    return load_unicode_data_from_json(unicode_data_json_path)
+
+
+def load_unicode_data_from_binary(unicode_data_binary_path: str) -> dict:
+    """Load Unicode Data from `unicode_data.bin`. Returns: Same as `load_unicode_data`
+
+    Every record is copied to `UnicodeCharacterStore`, and the file is closed.
+    """
+
+    unicode_data_binary = UnicodeDataBinary(unicode_data_binary_path)
+
+    try:
+        unicode_character_store = load_unicode_character_store_from_binary(
+            unicode_data_binary
+        )
+    finally:
+        unicode_data_binary.close()
+
+    return create_unicode_data(unicode_character_store)
+
+
+def load_unicode_character_store_from_binary(
+    unicode_data_binary: UnicodeDataBinary,
+) -> UnicodeCharacterStore:
+    """Copy every record of `unicode_data.bin` to `UnicodeCharacterStore`"""
 
-    unicode_character_list: list[UnicodeCharacter] = []
-    unicode_character_dict: dict[str, UnicodeCharacter] = {}
+    # Word ids of file are used as they are.
+    lexicon = UnicodeNameLexicon(unicode_data_binary.word_list)
 
-    with open(UNICODE_DATA_JSON_PATH) as json_file:
+    if unicode_data_binary.is_checksum_valid:
+        unicode_character_store = UnicodeCharacterStore(lexicon)
+    else:
+        unicode_character_store = UnicodeCharacterStore()
+
+    # Data of valid checksum is the same as generated (and checked) data.
+    # Otherwise, validate every record, not using strings for search in file.
+    if not unicode_data_binary.is_checksum_valid:
+        logger.warning(
+            f"Checksum of `{unicode_data_binary.file_path}` is wrong. Validate every record."
+        )
+
+    # Records and name ranges are each in order of code point. Merge them.
+    name_range_iterator = unicode_data_binary.iterate_name_range()
+    name_range = next(name_range_iterator, None)
+
+    for (
+        code_point,
+        name_word_id_array,
+        block,
+        string_data_for_search,
+    ) in unicode_data_binary.iterate_record():
+        while (name_range is not None) and (name_range[1] < code_point):
+            unicode_character_store.append_name_range(*name_range)
+            name_range = next(name_range_iterator, None)
+
+        if unicode_data_binary.is_checksum_valid:
+            unicode_character_store.append_trusted(
+                code_point, name_word_id_array, block, string_data_for_search
+            )
+        else:
+            name, aliases = lexicon.decode(name_word_id_array)
+
+            unicode_character_store.append(code_point, name, aliases, block)
+
+    while name_range is not None:
+        unicode_character_store.append_name_range(*name_range)
+        name_range = next(name_range_iterator, None)
+
+    return unicode_character_store
+
+
+def load_unicode_data_from_json(unicode_data_json_path: str) -> dict:
+    """Load Unicode Data from `unicode_data.json`. Returns: Same as `load_unicode_data`"""
+
+    unicode_character_store = UnicodeCharacterStore()
+
+    with open(unicode_data_json_path) as json_file:
         unicode_data_json: list = json.load(json_file)
 
         for character_data in unicode_data_json:
@@ -38,12 +221,74 @@ def load_unicode_data() -> dict:
             if "als" in character_data.keys():
                 aliases = character_data["als"]
 
-            unicode_character = UnicodeCharacter(
-                code_point=code_point, name=name, block=block, aliases=aliases
+            unicode_character_store.append(
+                int(code_point, base=16), name, aliases, block
             )
 
-            unicode_character_list.append(unicode_character)
-            unicode_character_dict[unicode_character.u_code_point] = unicode_character
+    return create_unicode_data(unicode_character_store)
+
+
+def load_unicode_data_from_delta(unicode_data_delta_path: str) -> dict:
+    """Load Unicode Data from `unicode_data_delta.json` and Python `unicodedata`
+
+    Delta has only what `unicodedata` can't give. (Aliases, blocks, and names
+    not in `unicodedata`) Names of other characters are `unicodedata.name()`.
+    (See `generate_data/save_unicode_data_to_delta_file.py`)
+
+    Raises `ValueError` if `unicodedata.unidata_version` is not the version of delta.
+
+    Returns: Same as `load_unicode_data`
+    """
+
+    with open(unicode_data_delta_path) as delta_file:
+        unicode_data_delta: dict = json.load(delta_file)
+
+    if unicode_data_delta["unidata_version"] != unicodedata.unidata_version:
+        raise ValueError(
+            f"Unicode version of delta is {unicode_data_delta['unidata_version']}, but unicodedata is {unicodedata.unidata_version}."
+        )
+
+    character_data_dict: dict[int, dict] = {
+        int(character_data["cp"], base=16): character_data
+        for character_data in unicode_data_delta["characters"]
+    }
+    excluded_set: set[int] = set(
+        int(code_point, base=16)
+        for code_point in unicode_data_delta.get("excluded", [])
+    )
+
+    unicode_character_store = UnicodeCharacterStore()
+
+    for first_code_point, last_code_point, block in unicode_data_delta["blocks"]:
+        for code_point in range(
+            int(first_code_point, base=16), int(last_code_point, base=16) + 1
+        ):
+            character_data = character_data_dict.get(code_point)
+
+            if character_data is None:
+                name = unicodedata.name(chr(code_point), None)
+                aliases: list[str] = []
+            else:
+                name = character_data.get("na")
+                aliases = character_data.get("als", [])
+
+                if name is None:
+                    name = unicodedata.name(chr(code_point), None)
+
+            # Not a character. (Unassigned, surrogate, ...)
+            if (name is None) or (code_point in excluded_set):
+                continue
+
+            unicode_character_store.append(code_point, name, aliases, block)
+
+    return create_unicode_data(unicode_character_store)
+
+
+def create_unicode_data(unicode_character_store: UnicodeCharacterStore) -> dict:
+    """List and dict of `UnicodeCharacterStore`. Returns: Same as `load_unicode_data`"""
+
+    unicode_character_list = UnicodeCharacterList(unicode_character_store)
+    unicode_character_dict = UnicodeCharacterDict(unicode_character_list)
 
     result = {
         "UNICODE_CHARACTER_LIST": unicode_character_list,
@@ -0,0 +1,64 @@
+from collections import OrderedDict
+from typing import Generic, Hashable, TypeVar
+
+Value = TypeVar("Value")
+
+
+class LRUCache(Generic[Value]):
+    """
+    Size limited cache. Least recently used item is removed first.
+
+    Attributes:
+        max_size (int): Max number of cached items.
+        hit_count (int): Number of `get` found the item.
+        miss_count (int): Number of `get` not found the item.
+    """
+
+    max_size: int
+    hit_count: int
+    miss_count: int
+
+    def __init__(self, max_size: int):
+        if max_size < 1:
+            raise ValueError(
+                f"LRUCache init - `max_size` should be bigger than 0. Current `max_size`: `{max_size}`"
+            )
+
+        self.max_size = max_size
+        self.hit_count = 0
+        self.miss_count = 0
+
+        self._item_dict: OrderedDict[Hashable, Value] = OrderedDict()
+
+    def __len__(self):
+        return len(self._item_dict)
+
+    def __str__(self):
+        return f"LRUCache(size: {len(self)}/{self.max_size}, hit: {self.hit_count}, miss: {self.miss_count})"
+
+    def get(self, key: Hashable) -> Value | None:
+        value = self._item_dict.get(key)
+
+        if value is None:
+            self.miss_count += 1
+            return None
+
+        self.hit_count += 1
+        self._item_dict.move_to_end(key)
+
+        return value
+
+    def put(self, key: Hashable, value: Value):
+        self._item_dict[key] = value
+        self._item_dict.move_to_end(key)
+
+        while len(self._item_dict) > self.max_size:
+            self._item_dict.popitem(last=False)
+
+    def remove(self, key: Hashable):
+        """Remove the item, if it exists."""
+        self._item_dict.pop(key, None)
+
+    def clear(self):
+        """Remove all items. (`hit_count`, `miss_count` are kept)"""
+        self._item_dict.clear()
@@ -0,0 +1,97 @@
+import logging
+import threading
+import time
+from typing import Callable, Generic, TypeVar
+
+logger = logging.getLogger(__name__)
+
+Result = TypeVar("Result")
+
+
+class SearchExecutor(Generic[Result]):
+    """
+    Runs searches with a generation counter and a latency budget.
+
+    Search runs on the caller's thread. (Worker of keyword queries, See
+    `handle_keyword_query_event_in_background` of `UnicodeExtensionFeature`)
+
+    Each search gets a generation number. When a newer search starts (or
+    `supersede` is called), the older one is superseded and stops at its next
+    check, instead of finishing a result nobody will see.
+
+    When the latency budget is exceeded, the search stops at its next check too,
+    and returns the best result found so far. (Partial result)
+
+    Search function checks `should_stop()` between its steps, not after its last
+    step. (See `search_unicode_character_fuzzy`) Its result is partial only if
+    `should_stop()` returned `True`.
+
+    Attributes:
+        latency_budget (float): Max search time (sec). `0` for no limit.
+        generation (int): Generation number of the latest search.
+    """
+
+    latency_budget: float
+    generation: int
+
+    def __init__(self, latency_budget: float = 0):
+        self.latency_budget = latency_budget
+        self.generation = 0
+
+        self._generation_lock = threading.Lock()
+
+    def search(
+        self, search_function: Callable[[Callable[[], bool]], Result], name: str = ""
+    ) -> tuple[Result, bool]:
+        """Run search, superseding running search of other thread.
+
+        Args:
+            search_function: Search taking `should_stop` function.
+            name: Name of search for debug log. (e.g., query)
+
+        Returns:
+            (Result of search, `True` if search was stopped and result is partial)
+
+            Stopped only when `should_stop()` returned `True` to the search.
+            Search finished before the deadline is not partial, even if it
+            returns after the deadline.
+        """
+
+        with self._generation_lock:
+            self.generation += 1
+            generation = self.generation
+
+        start_time = time.perf_counter()
+        deadline = (
+            (start_time + self.latency_budget) if (self.latency_budget > 0) else None
+        )
+
+        is_stopped = False
+
+        def should_stop() -> bool:
+            nonlocal is_stopped
+
+            if (generation != self.generation) or (
+                (deadline is not None) and (time.perf_counter() > deadline)
+            ):
+                is_stopped = True
+
+            return is_stopped
+
+        result = search_function(should_stop)
+
+        logger.debug(
+            f"Search `{name}` (generation: {generation}) took {(time.perf_counter() - start_time) * 1000:.1f}ms"
+            + (" - stopped, partial result" if is_stopped else "")
+        )
+
+        return (result, is_stopped)
+
+    def supersede(self):
+        """Stop running search. (e.g., newer query is coming)"""
+
+        with self._generation_lock:
+            self.generation += 1
+
+    def shutdown(self):
+        self.supersede()
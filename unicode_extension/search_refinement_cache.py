@@ -0,0 +1,277 @@
+import itertools
+from typing import Callable
+
+from .search_unicode_character import (
+    is_full_scan_candidate_position_list,
+    is_fuzzy_search_result_filled,
+    iterate_fuzzy_candidate_position_list,
+    search_unicode_character,
+    search_unicode_character_fuzzy,
+    search_unicode_character_fuzzy_in_candidates,
+)
+from .unicode_character import UnicodeCharacter
+from .unicode_character_search_index import tokenize_for_search
+
+
+class SearchRefinementCache:
+    """
+    Cache of fuzzy search results for type-ahead queries.
+
+    When user types `arr`, `arro`, `arrow`, each query extends the previous one.
+    Characters matching `arrow` are (mostly) in the characters matching `arro`,
+    so `arrow` is searched only in the over-fetched result of `arro`, instead of
+    the whole `unicode_character_list`. (Only if the result of `arro` is not cut by
+    its limit) When it can't make the same result as scoring the whole list,
+    `arrow` is searched same as `search_unicode_character_fuzzy`.
+
+    Only the candidates of the indexes are over-fetched up to `pool_size`. When the
+    whole list is scored (misspelled query like `chekmark`), it's scored only up to
+    the limit of the search, so its result is refined from only if it has fewer.
+
+    When user deletes a letter (`arrow` -> `arro`), cached result of `arro` is reused.
+
+    Attributes:
+        unicode_character_list (list[UnicodeCharacter]): Searching from this list.
+        pool_size (int): Number of over-fetched result for each query.
+        max_query_number (int): Number of cached queries.
+    """
+
+    DEFAULT_POOL_SIZE: int = 2000
+    DEFAULT_MAX_QUERY_NUMBER: int = 32
+
+    unicode_character_list: list[UnicodeCharacter]
+    pool_size: int
+    max_query_number: int
+
+    def __init__(
+        self,
+        unicode_character_list: list[UnicodeCharacter],
+        pool_size: int = DEFAULT_POOL_SIZE,
+        max_query_number: int = DEFAULT_MAX_QUERY_NUMBER,
+    ):
+        self.unicode_character_list = unicode_character_list
+        self.pool_size = pool_size
+        self.max_query_number = max_query_number
+
+        # Query -> (over-fetched search result, limit of the search,
+        # `True` if every infix match was in the candidates) (Order of insertion)
+        self._search_result_dict: dict[
+            str, tuple[list[tuple[UnicodeCharacter, float, int]], int, bool]
+        ] = {}
+
+    def clear(self):
+        self._search_result_dict.clear()
+
+    def search(
+        self,
+        query: str,
+        limit: int = 10,
+        should_stop: Callable[[], bool] | None = None,
+    ) -> list[tuple[UnicodeCharacter, float, int]]:
+        """Search Unicode character with refinement of previous queries.
+
+        Same as `search_unicode_character`.
+        Only its fuzzy match is refined, the other tiers are fast enough.
+        """
+
+        return search_unicode_character(
+            query=query,
+            unicode_character_list=self.unicode_character_list,
+            limit=limit,
+            search_fuzzy=self.__search_fuzzy,
+            should_stop=should_stop,
+        )
+
+    def search_cached(
+        self, query: str, limit: int = 10
+    ) -> list[tuple[UnicodeCharacter, float, int]]:
+        """Same as `search`, but its fuzzy match is only taken from cached results.
+
+        No character is scored for fuzzy match, so it's as fast as the other tiers.
+        (e.g., Characters after the shown result, to prefetch their icons)
+        Fuzzy match of query not searched by `search` is empty.
+        """
+
+        return search_unicode_character(
+            query=query,
+            unicode_character_list=self.unicode_character_list,
+            limit=limit,
+            search_fuzzy=self.__find_cached_fuzzy_search_result,
+        )
+
+    def __search_fuzzy(
+        self,
+        query: str,
+        unicode_character_list: list[UnicodeCharacter],
+        limit: int = 10,
+        candidate_position_list: list[int] | None = None,
+        should_stop: Callable[[], bool] | None = None,
+    ) -> list[tuple[UnicodeCharacter, float, int]]:
+        """Same as `search_unicode_character_fuzzy`, but over-fetched and cached."""
+
+        if (limit > self.pool_size) or (candidate_position_list is not None):
+            return search_unicode_character_fuzzy(
+                query=query,
+                unicode_character_list=unicode_character_list,
+                limit=limit,
+                candidate_position_list=candidate_position_list,
+                should_stop=should_stop,
+            )
+
+        # Search is case insensitive
+        query_key = query.upper()
+
+        cached_search_result = self._search_result_dict.get(query_key)
+
+        if cached_search_result is not None:
+            search_result, _, _ = cached_search_result
+
+            return search_result[:limit]
+
+        is_stopped = False
+
+        # Stopped search is known by the checks while searching, not checked
+        # again after it. (See `SearchExecutor`)
+        def should_stop_search() -> bool:
+            nonlocal is_stopped
+
+            is_stopped = is_stopped or ((should_stop is not None) and should_stop())
+
+            return is_stopped
+
+        # Cached result of shorter query first, then same as
+        # `search_unicode_character_fuzzy`. (When it's not filled)
+        candidate_position_list_iterator = iterate_fuzzy_candidate_position_list(
+            query, unicode_character_list
+        )
+        refinement_candidate = self.__find_refinement_candidate_position_list(query_key)
+
+        if refinement_candidate is not None:
+            candidate_position_list_iterator = itertools.chain(
+                [refinement_candidate], candidate_position_list_iterator
+            )
+
+        search_result: list[tuple[UnicodeCharacter, float, int]] = []
+        search_limit = limit
+        has_every_infix_match = False
+
+        for i, (candidate_position_list, has_every_infix_match) in enumerate(
+            candidate_position_list_iterator
+        ):
+            # Stopped before scoring more candidates. Result of fewer ones is returned.
+            if (i > 0) and should_stop_search():
+                break
+
+            # Whole list is not over-fetched. Only candidates of the indexes are.
+            search_limit = (
+                limit
+                if is_full_scan_candidate_position_list(
+                    candidate_position_list, unicode_character_list
+                )
+                else self.pool_size
+            )
+
+            search_result = search_unicode_character_fuzzy_in_candidates(
+                query,
+                unicode_character_list,
+                search_limit,
+                candidate_position_list,
+                should_stop_search if should_stop is not None else None,
+            )
+
+            if is_fuzzy_search_result_filled(
+                search_result, limit, has_every_infix_match
+            ):
+                break
+
+        # Stopped search has only a part of result. Not to refine from it.
+        if not is_stopped:
+            self.__save_search_result(
+                query_key, search_result, search_limit, has_every_infix_match
+            )
+
+        return search_result[:limit]
+
+    def __find_cached_fuzzy_search_result(
+        self,
+        query: str,
+        unicode_character_list: list[UnicodeCharacter],
+        limit: int = 10,
+        candidate_position_list: list[int] | None = None,
+        should_stop: Callable[[], bool] | None = None,
+    ) -> list[tuple[UnicodeCharacter, float, int]]:
+        """Same as `__search_fuzzy`, but empty if its result is not cached."""
+
+        cached_search_result = self._search_result_dict.get(query.upper())
+
+        if (cached_search_result is None) or (candidate_position_list is not None):
+            return []
+
+        search_result, _, _ = cached_search_result
+
+        return search_result[:limit]
+
+    def __find_refinement_candidate_position_list(
+        self, query_key: str
+    ) -> tuple[list[int], bool] | None:
+        """Find candidate positions from the longest cached query extended by query
+
+        Characters having the query in their words have the cached query in them
+        too, so every infix match is in the cached result if it was in the
+        candidates of the cached query.
+
+        Returns:
+            (Sorted positions of the cached result, `True` if every infix match is
+            in them), or `None` if there is no such query.
+        """
+
+        refined_query_key = ""
+
+        for cached_query_key in self._search_result_dict.keys():
+            if query_key.startswith(cached_query_key) and len(cached_query_key) > len(
+                refined_query_key
+            ):
+                refined_query_key = cached_query_key
+
+        if refined_query_key == "":
+            return None
+
+        refined_search_result, refined_search_limit, has_every_infix_match = (
+            self._search_result_dict[refined_query_key]
+        )
+
+        # Only a result smaller than its limit has every character scored for the
+        # query. Result filled up to its limit (mostly of short query like `c`, or
+        # of whole list) is cut in the middle of same scores, so good candidates
+        # can be missed.
+        if not (0 < len(refined_search_result) < refined_search_limit):
+            return None
+
+        # Query of a new token (`arrow l`) has token candidates not in the cached
+        # result. (Only last token extended, `arro` -> `arrow`, has no new one)
+        if len(tokenize_for_search(query_key)) != len(
+            tokenize_for_search(refined_query_key)
+        ):
+            return None
+
+        return (
+            sorted(position for (_, _, position) in refined_search_result),
+            has_every_infix_match,
+        )
+
+    def __save_search_result(
+        self,
+        query_key: str,
+        search_result: list[tuple[UnicodeCharacter, float, int]],
+        search_limit: int,
+        has_every_infix_match: bool,
+    ):
+        self._search_result_dict[query_key] = (
+            search_result,
+            search_limit,
+            has_every_infix_match,
+        )
+
+        while len(self._search_result_dict) > self.max_query_number:
+            oldest_query_key = next(iter(self._search_result_dict))
+            del self._search_result_dict[oldest_query_key]
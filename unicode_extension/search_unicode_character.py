@@ -1,5 +1,59 @@
+import itertools
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Callable
+
 from rapidfuzz import process, fuzz
 from .unicode_character import UnicodeCharacter
+from .unicode_character_search_index import get_unicode_character_search_index
+from .unicode_character_trigram_index import get_unicode_character_trigram_index
+from .search_worker_pool import SearchWorkerPool
+
+# When most of the list is candidate, pruning is not worth it. Scan the whole list.
+FULL_SCAN_CANDIDATE_RATIO = 0.5
+
+# Fuzzy search checks `should_stop` after scoring each chunk of this size.
+SEARCH_CHUNK_SIZE = 4096
+
+# WRatio of query in a longer name. (`tick` in `LIPSTICK`, partial ratio 100 * 0.9)
+# Characters sharing no token with query score at most this.
+INFIX_MATCH_SCORE = 90
+
+# WRatio of one letter query in any string for search, which is at least 8 times
+# as long. (`U+0041 A`, partial ratio 100 * 0.6)
+ONE_LETTER_MATCH_SCORE = 60
+
+# Acronym match (`bdlh`) is only for query of letters as long as this.
+MIN_ACRONYM_QUERY_LENGTH = 2
+
+# Parallel search of whole list. (Opt-in, See `configure_search_worker_pool`)
+_search_worker_pool: SearchWorkerPool | None = None
+
+
+def configure_search_worker_pool(
+    unicode_character_list: list[UnicodeCharacter], worker_number: int
+):
+    """Start (or stop) worker processes for searching whole list in parallel.
+
+    Args:
+        unicode_character_list: Searching from this list.
+        worker_number: Number of worker processes. `1` (or lower) for no parallel search.
+    """
+
+    global _search_worker_pool
+
+    if (
+        (_search_worker_pool is not None)
+        and (_search_worker_pool.unicode_character_list is unicode_character_list)
+        and (_search_worker_pool.worker_number == worker_number)
+    ):
+        return
+
+    if _search_worker_pool is not None:
+        _search_worker_pool.shutdown()
+        _search_worker_pool = None
+
+    if worker_number > 1:
+        _search_worker_pool = SearchWorkerPool(unicode_character_list, worker_number)
 
 
 def processor_for_extract(data):
@@ -14,35 +68,483 @@ def processor_for_extract(data):
 
 
 def search_unicode_character(
-    query: str, unicode_character_list: list[UnicodeCharacter], limit: int = 10
+    query: str,
+    unicode_character_list: list[UnicodeCharacter],
+    limit: int = 10,
+    candidate_position_list: list[int] | None = None,
+    search_fuzzy: (
+        Callable[..., list[tuple[UnicodeCharacter, float, int]]] | None
+    ) = None,
+    should_stop: Callable[[], bool] | None = None,
 ) -> list[tuple[UnicodeCharacter, float, int]]:
     """Search Unicode character
 
-    Using RaidFuzz
+    Search in tiers. Exact matches are shown first, and matches of the other tiers
+    are merged by score. Same score in order of tier.
+
+    1. Exact match of name or alias. (`em dash` -> `EM DASH`) Also name made by a
+       rule, when query names the range. (`cjk unified ideograph 6f2`)
+    2. Prefix match of name or alias. (`em da` -> `EM DASH`)
+    3. Name made by a rule. (`cjk unified ideograph 6f22` -> `CJK UNIFIED
+       IDEOGRAPH-6F22`, See `UnicodeNameRange`)
+    4. Every word of query is a whole word of character. (`dash em` -> `EM DASH`)
+    5. Acronym of name or alias, for one word query. (`bdlh` -> `BOX DRAWINGS LIGHT
+       HORIZONTAL`, `lcl` -> `LATIN CAPITAL LETTER A`, ...) Ranked as infix match
+       at least, after fuzzy matches of same score.
+    6. Fuzzy match, using RaidFuzz. (See `search_unicode_character_fuzzy`) Runs
+       only when characters not found by the tiers can score better.
 
     Args:
         query: Query for search
         unicode_character_list: Searching from this list.
         limit: Search result item number.
+        candidate_position_list: Search only these positions of `unicode_character_list`.
+            If `None`, candidates are found by the search index.
+        search_fuzzy: Replacement of `search_unicode_character_fuzzy` for tier 6.
+            (e.g., `SearchRefinementCache`)
+        should_stop: Fuzzy search stops when it returns `True`,
+            and result found so far is returned. (See `SearchExecutor`)
 
     Returns:
-        List of Tuple. (Result from RapidFuzz)
+        List of Tuple. (Same as result from RapidFuzz)
 
         [(UnicodeCharacter, score, index), ...]
 
         `UnicodeCharacter`: UnicodeCharacter
         `score`: Similarity with Query
-        `index`: Index from result
+        `index`: Index of `unicode_character_list`
 
     """
 
-    search_result = process.extract(
-        query=query,
-        choices=unicode_character_list,
-        # scorer=scorer_for_extract,
-        processor=processor_for_extract,
-        score_cutoff=1,  # For cut 0 score result
-        limit=limit,
+    if search_fuzzy is None:
+        search_fuzzy = search_unicode_character_fuzzy
+
+    search_index = get_unicode_character_search_index(unicode_character_list)
+
+    candidate_position_set: set[int] | None = None
+
+    if candidate_position_list is not None:
+        candidate_position_set = set(candidate_position_list)
+
+    # Exact matches, shown first.
+    search_result: list[tuple[UnicodeCharacter, float, int]] = []
+    # Matches of the other tiers, shown by score after exact matches.
+    # [(score to rank, tier, score, position), ...]
+    ranked_search_result: list[tuple[float, int, float, int]] = []
+    found_position_set: set[int] = set()
+
+    def is_found(position: int) -> bool:
+        return (position in found_position_set) or (
+            (candidate_position_set is not None)
+            and (position not in candidate_position_set)
+        )
+
+    def calculate_position_score(position: int) -> float:
+        return calculate_score(query, search_index.get_string_data_for_search(position))
+
+    def add_search_result(position: int):
+        if (len(search_result) >= limit) or is_found(position):
+            return
+
+        search_result.append(
+            (
+                unicode_character_list[position],
+                calculate_position_score(position),
+                position,
+            )
+        )
+        found_position_set.add(position)
+
+    def add_ranked_search_result(
+        tier: int, position: int, score: float, rank_score: float | None = None
+    ):
+        if is_found(position):
+            return
+
+        ranked_search_result.append(
+            (score if rank_score is None else rank_score, tier, score, position)
+        )
+        found_position_set.add(position)
+
+    def extract(position_list: Iterable[int]) -> list[tuple[str, float, int]]:
+        """Better matches of positions. Same score in order of `position_list`."""
+
+        return process.extract(
+            query=query.upper(),
+            choices={
+                position: search_index.get_string_data_for_search(position)
+                for position in position_list
+                if not is_found(position)
+            },
+            processor=None,  # Choices are already upper case
+            limit=limit,
+        )
+
+    # Names are upper case, and separated by one space.
+    normalized_query = " ".join(query.upper().split())
+
+    if normalized_query == "":
+        return search_fuzzy(
+            query=query,
+            unicode_character_list=unicode_character_list,
+            limit=limit,
+            candidate_position_list=candidate_position_list,
+            should_stop=should_stop,
+        )
+
+    # 1. Exact match. Also names made by a rule, named by query to a part of code
+    # point. (`cjk unified ideograph 4e0`)
+    for position in search_index.find_name_position_list(normalized_query):
+        add_search_result(position)
+
+    for name_range in search_index.name_range_list:
+        if name_range.is_named_by(normalized_query):
+            for position in itertools.islice(
+                name_range.find_position_list(normalized_query), limit
+            ):
+                add_search_result(position)
+
+    # 2. Prefix match. Better match first, not shorter name first.
+    for _, score, position in extract(
+        sorted(search_index.find_name_prefix_position_list(normalized_query))
+    ):
+        add_ranked_search_result(2, position, score)
+
+    # 3. Name made by a rule. Characters of a range have names of same words,
+    # so only the first ones are scored.
+    for name_range in search_index.name_range_list:
+        if not name_range.is_named_by(normalized_query):
+            for position in itertools.islice(
+                name_range.find_position_list(normalized_query), limit
+            ):
+                if not is_found(position):
+                    add_ranked_search_result(
+                        3, position, calculate_position_score(position)
+                    )
+
+    # 4. Whole word match
+    for _, score, position in extract(
+        search_index.find_word_position_list(normalized_query)
+    ):
+        add_ranked_search_result(4, position, score)
+
+    # 5. Acronym match. (At least 2 letters, 1 letter is too common)
+    # Acronym shares few letters with name, so ranked same as infix match.
+    # (After fuzzy match of same score)
+    if (
+        len(normalized_query) >= MIN_ACRONYM_QUERY_LENGTH
+    ) and normalized_query.isalpha():
+        for position in itertools.islice(
+            search_index.find_acronym_prefix_position_list(normalized_query), limit
+        ):
+            if not is_found(position):
+                score = calculate_position_score(position)
+
+                add_ranked_search_result(
+                    7, position, score, max(score, INFIX_MATCH_SCORE)
+                )
+
+    # 6. Fuzzy match. Characters not found by the tiers score at most
+    # `INFIX_MATCH_SCORE`, unless they are similar to whole query.
+    # (See `is_fuzzy_search_result_filled`)
+    rest_number = limit - len(search_result)
+    fuzzy_match_score = (
+        INFIX_MATCH_SCORE if len(normalized_query) > 1 else ONE_LETTER_MATCH_SCORE
+    )
+    infix_match_number = sum(
+        1
+        for (rank_score, tier, _, _) in ranked_search_result
+        if (tier != 7) and (rank_score >= fuzzy_match_score)
+    )
+
+    if (rest_number > 0) and (infix_match_number < rest_number):
+        fuzzy_search_result = search_fuzzy(
+            query=query,
+            unicode_character_list=unicode_character_list,
+            # Some of fuzzy search result are already in result of tiers
+            limit=limit + len(found_position_set),
+            candidate_position_list=candidate_position_list,
+            should_stop=should_stop,
+        )
+
+        for _, score, position in fuzzy_search_result:
+            add_ranked_search_result(6, position, score)
+
+    # Better score first. Same score in order of tier, and of each tier.
+    ranked_search_result.sort(key=lambda item: (-item[0], item[1]))
+
+    search_result.extend(
+        (unicode_character_list[position], score, position)
+        for (_, _, score, position) in ranked_search_result[:rest_number]
     )
 
     return search_result
+
+
+def calculate_score(query: str, string_data_for_search: str) -> float:
+    """Similarity of query and character. Same scorer as fuzzy search.
+
+    Args:
+        string_data_for_search: `_string_data_for_search` of character.
+    """
+
+    return fuzz.WRatio(query.upper(), string_data_for_search, processor=None)
+
+
+def search_unicode_character_fuzzy(
+    query: str,
+    unicode_character_list: list[UnicodeCharacter],
+    limit: int = 10,
+    candidate_position_list: list[int] | None = None,
+    should_stop: Callable[[], bool] | None = None,
+    fill_limit: int | None = None,
+) -> list[tuple[UnicodeCharacter, float, int]]:
+    """Search Unicode character by fuzzy match
+
+    Using RaidFuzz
+
+    Only the characters sharing a token (or a token prefix) with the query are scored.
+    (See `UnicodeCharacterSearchIndex`) When they can't make the same result as
+    scoring the whole list, the characters sharing enough trigrams are scored too
+    (`tick` in `LIPSTICK`, misspelled `chekmark`, See
+    `UnicodeCharacterTrigramIndex`), and then the whole list.
+    (In parallel, if `configure_search_worker_pool` is set)
+    See `is_fuzzy_search_result_filled` for when the candidates are enough.
+
+    With `should_stop`, characters are scored in chunks, and scoring stops
+    when it returns `True`. Best of the scored chunks is returned.
+    (Shards of parallel search too)
+
+    Args:
+        fill_limit: Number of results to be same as scoring the whole list.
+            `limit` if `None`. (Only for candidates of the indexes)
+
+        Others: Same as `search_unicode_character`
+
+    Returns: Same as `search_unicode_character`
+    """
+
+    if fill_limit is None:
+        fill_limit = limit
+
+    if candidate_position_list is not None:
+        return search_unicode_character_fuzzy_in_candidates(
+            query, unicode_character_list, limit, candidate_position_list, should_stop
+        )
+
+    search_result: list[tuple[UnicodeCharacter, float, int]] = []
+    is_searched = False
+
+    for (
+        candidate_position_list,
+        has_every_infix_match,
+    ) in iterate_fuzzy_candidate_position_list(query, unicode_character_list):
+        # Stopped before scoring more candidates. Result of fewer ones is returned.
+        if is_searched and (should_stop is not None) and should_stop():
+            break
+
+        search_result = search_unicode_character_fuzzy_in_candidates(
+            query, unicode_character_list, limit, candidate_position_list, should_stop
+        )
+        is_searched = True
+
+        if is_fuzzy_search_result_filled(
+            search_result, fill_limit, has_every_infix_match
+        ):
+            break
+
+    return search_result
+
+
+def iterate_fuzzy_candidate_position_list(
+    query: str, unicode_character_list: list[UnicodeCharacter]
+) -> Iterator[tuple[list[int], bool]]:
+    """Candidates of fuzzy search, from the fewest to the whole list.
+
+    1. Characters sharing a token (or a token prefix) with the query.
+    2. And characters sharing enough trigrams with the query.
+    3. Whole list. (Empty list)
+
+    Characters having the query in their words (infix match, `tick` in `LIPSTICK`)
+    have every trigram of the query. They are all in the trigram candidates,
+    unless the query has no trigram (`pi`), or the candidates are cut by
+    `max_candidate_number` of `UnicodeCharacterTrigramIndex`.
+
+    Yields:
+        (Candidate positions, `True` if every infix match is in the candidates)
+    """
+
+    search_index = get_unicode_character_search_index(unicode_character_list)
+    trigram_index = get_unicode_character_trigram_index(unicode_character_list)
+
+    token_candidate_position_list = search_index.find_candidate_position_list(query)
+    trigram_candidate_position_list = trigram_index.find_candidate_position_list(query)
+
+    has_every_infix_match = (
+        0
+        < len(trigram_candidate_position_list)
+        < trigram_index.DEFAULT_MAX_CANDIDATE_NUMBER
+    )
+
+    candidate_position_set = set(token_candidate_position_list)
+    has_every_trigram_candidate = candidate_position_set.issuperset(
+        trigram_candidate_position_list
+    )
+
+    if len(token_candidate_position_list) > 0:
+        yield (
+            token_candidate_position_list,
+            has_every_infix_match and has_every_trigram_candidate,
+        )
+
+    if not has_every_trigram_candidate:
+        yield (
+            sorted(candidate_position_set.union(trigram_candidate_position_list)),
+            has_every_infix_match,
+        )
+
+    yield ([], True)
+
+
+def is_fuzzy_search_result_filled(
+    search_result: list[tuple[UnicodeCharacter, float, int]],
+    fill_limit: int,
+    has_every_infix_match: bool,
+) -> bool:
+    """Whether fuzzy search result of candidates is same as of the whole list.
+
+    Characters out of the candidates share no token (or token prefix) with the
+    query, so they score at most `INFIX_MATCH_SCORE`. (Query in their words)
+    Same score is in order of position, so an infix match out of the candidates
+    could be before the result of same score.
+
+    Args:
+        search_result: Result of `search_unicode_character_fuzzy_in_candidates`
+        fill_limit: Number of results to be same as of the whole list.
+        has_every_infix_match: `True` if every infix match is in the candidates.
+            (See `iterate_fuzzy_candidate_position_list`)
+    """
+
+    if len(search_result) < fill_limit:
+        return False
+
+    if fill_limit == 0:
+        return True
+
+    _, score, _ = search_result[fill_limit - 1]
+
+    return (score > INFIX_MATCH_SCORE) or (
+        has_every_infix_match and (score >= INFIX_MATCH_SCORE)
+    )
+
+
+def is_full_scan_candidate_position_list(
+    candidate_position_list: list[int], unicode_character_list: list[UnicodeCharacter]
+) -> bool:
+    """`True` if the whole list is scored for the candidates. (Empty, or most of list)"""
+
+    return not (
+        0
+        < len(candidate_position_list)
+        < (len(unicode_character_list) * FULL_SCAN_CANDIDATE_RATIO)
+    )
+
+
+def search_unicode_character_fuzzy_in_candidates(
+    query: str,
+    unicode_character_list: list[UnicodeCharacter],
+    limit: int,
+    candidate_position_list: list[int],
+    should_stop: Callable[[], bool] | None = None,
+) -> list[tuple[UnicodeCharacter, float, int]]:
+    """Fuzzy search of candidates. Whole list if `candidate_position_list` is empty,
+    or most of list is candidate."""
+
+    search_index = get_unicode_character_search_index(unicode_character_list)
+
+    # Scored as strings, `UnicodeCharacter` is only taken for the result.
+    # (See `UnicodeCharacterList`)
+    string_data_for_search_list = search_index.string_data_for_search_list
+
+    upper_query = query.upper()
+
+    # Nothing scores. Not scoring whole list for it.
+    if search_index.character_set.isdisjoint(upper_query):
+        return []
+
+    is_full_scan = is_full_scan_candidate_position_list(
+        candidate_position_list, unicode_character_list
+    )
+
+    if (
+        is_full_scan
+        and (_search_worker_pool is not None)
+        and (_search_worker_pool.unicode_character_list is unicode_character_list)
+    ):
+        return _search_worker_pool.search(query, limit, should_stop=should_stop)
+
+    def extract(start: int, end: int) -> list[tuple[float, int]]:
+        """Fuzzy search of `start:end` of the list, or of the candidates
+
+        Returns:
+            [(score, position), ...] `UnicodeCharacter` is taken after all chunks.
+        """
+
+        if is_full_scan:
+            # Slice of list, not copying strings to dict. (Index is from `start`)
+            choices: Sequence[str] | dict[int, str] = string_data_for_search_list[
+                start:end
+            ]
+            first_position = start
+        else:
+            # Key of dict is returned as `index`, same as when `choices` is list.
+            choices = {
+                position: string_data_for_search_list[position]
+                for position in candidate_position_list[start:end]
+            }
+            first_position = 0
+
+        return [
+            (score, first_position + index)
+            for _, score, index in process.extract(
+                query=upper_query,
+                choices=choices,
+                # scorer=scorer_for_extract,
+                processor=None,  # Choices are already upper case
+                score_cutoff=1,  # For cut 0 score result
+                limit=limit,
+            )
+        ]
+
+    choice_number = (
+        len(string_data_for_search_list)
+        if is_full_scan
+        else len(candidate_position_list)
+    )
+
+    if should_stop is None:
+        score_and_position_list = extract(0, choice_number)
+    else:
+        score_and_position_list = []
+
+        for chunk_start in range(0, choice_number, SEARCH_CHUNK_SIZE):
+            if should_stop():
+                break
+
+            score_and_position_list.extend(
+                extract(chunk_start, chunk_start + SEARCH_CHUNK_SIZE)
+            )
+
+        # Same order as `process.extract` of all chunks. (Same score by position)
+        # Sorted once after scoring, not after each chunk.
+        score_and_position_list.sort(
+            key=lambda score_and_position: (
+                -score_and_position[0],
+                score_and_position[1],
+            )
+        )
+
+    return [
+        (unicode_character_list[position], score, position)
+        for score, position in score_and_position_list[:limit]
+    ]
@@ -0,0 +1,212 @@
+import heapq
+import itertools
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, wait
+from typing import Callable
+
+from rapidfuzz import process
+
+from .unicode_character import UnicodeCharacter
+from .unicode_character_store import get_string_data_for_search_list
+
+
+# Same as `SEARCH_CHUNK_SIZE` of `search_unicode_character`
+# Shard checks whether its search is stopped after scoring each chunk.
+SHARD_CHUNK_SIZE = 4096
+
+# Interval (sec) to check `should_stop` while waiting for shards.
+SHOULD_STOP_CHECK_INTERVAL = 0.005
+
+# Shard of search strings in worker process. (Set by `_initialize_shard`)
+# `None` for characters of name ranges, which RapidFuzz skips.
+_shard_string_list: list[str | None] = []
+_shard_first_position: int = 0
+# Generation of running search, shared with main process. Search of older
+# generation is stopped. (See `SearchWorkerPool.search`)
+_shard_search_generation = None
+
+
+def _processor_for_shard(data: str) -> str:
+    # Same as `processor_for_extract` of `search_unicode_character` for string
+    return data.upper()
+
+
+def _initialize_shard(
+    shard_string_list: list[str | None],
+    shard_first_position: int,
+    shard_search_generation,
+):
+    global _shard_string_list, _shard_first_position, _shard_search_generation
+
+    _shard_string_list = shard_string_list
+    _shard_first_position = shard_first_position
+    _shard_search_generation = shard_search_generation
+
+
+def _search_shard(
+    query: str, limit: int, generation: int = 0
+) -> list[tuple[float, int]]:
+    """Search in the shard of worker process.
+
+    Scored in chunks. Stops when search of `generation` is stopped, and returns
+    best of the scored chunks.
+
+    Returns:
+        [(score, position), ...] `position` is position in whole list.
+    """
+
+    search_result: list[tuple[float, int]] = []
+
+    for chunk_start in range(0, len(_shard_string_list), SHARD_CHUNK_SIZE):
+        if (_shard_search_generation is not None) and (
+            _shard_search_generation.value != generation
+        ):
+            break
+
+        chunk_search_result = process.extract(
+            query=query,
+            choices=_shard_string_list[chunk_start : chunk_start + SHARD_CHUNK_SIZE],
+            processor=_processor_for_shard,
+            score_cutoff=1,  # For cut 0 score result
+            limit=limit,
+        )
+
+        search_result.extend(
+            (score, _shard_first_position + chunk_start + index)
+            for (_, score, index) in chunk_search_result
+        )
+
+    # Same order as `process.extract` of whole shard. (Same score by position)
+    # Sorted once after scoring, not after each chunk.
+    search_result.sort(
+        key=lambda score_and_position: (-score_and_position[0], score_and_position[1])
+    )
+
+    return search_result[:limit]
+
+
+class SearchWorkerPool:
+    """
+    Worker processes searching whole `unicode_character_list` in parallel.
+
+    The list is split into shards, one shard per worker process.
+    Each worker keeps its shard (search strings) during its life,
+    so only query and result are sent for each search.
+
+    Attributes:
+        unicode_character_list (list[UnicodeCharacter]): Searching from this list.
+        worker_number (int): Number of worker processes. (= Number of shards)
+    """
+
+    unicode_character_list: list[UnicodeCharacter]
+    worker_number: int
+
+    def __init__(
+        self, unicode_character_list: list[UnicodeCharacter], worker_number: int
+    ):
+        if worker_number < 1:
+            raise ValueError(
+                f"SearchWorkerPool init - `worker_number` should be bigger than 0. Current `worker_number`: `{worker_number}`"
+            )
+
+        self.unicode_character_list = unicode_character_list
+        self.worker_number = worker_number
+
+        # Not `fork`. Extension process has other threads (e.g., websocket client).
+        multiprocessing_context = multiprocessing.get_context("spawn")
+
+        # Generation of running search. Changed to stop it. (Shared with workers)
+        self._search_generation = multiprocessing_context.Value("q", 0, lock=False)
+
+        shard_size = -(-len(unicode_character_list) // worker_number)  # ceil
+
+        self._executor_list: list[ProcessPoolExecutor] = []
+
+        string_data_for_search_list = get_string_data_for_search_list(
+            unicode_character_list
+        )
+
+        for shard_first_position in range(0, len(unicode_character_list), shard_size):
+            shard_string_list = list(
+                string_data_for_search_list[
+                    shard_first_position : shard_first_position + shard_size
+                ]
+            )
+
+            # One process per shard, so the shard stays in the process.
+            executor = ProcessPoolExecutor(
+                max_workers=1,
+                mp_context=multiprocessing_context,
+                initializer=_initialize_shard,
+                initargs=(
+                    shard_string_list,
+                    shard_first_position,
+                    self._search_generation,
+                ),
+            )
+
+            self._executor_list.append(executor)
+
+            # Start process now, not at the first search.
+            executor.submit(_search_shard, "", 0)
+
+    def search(
+        self,
+        query: str,
+        limit: int = 10,
+        should_stop: Callable[[], bool] | None = None,
+    ) -> list[tuple[UnicodeCharacter, float, int]]:
+        """Search whole list in parallel. Same as `search_unicode_character`.
+
+        When `should_stop` returns `True`, shards stop after their current chunk,
+        and best of the scored chunks is returned. (Partial result)
+        """
+
+        # Same as single process search, stopped before the first chunk.
+        if (should_stop is not None) and should_stop():
+            return []
+
+        # One search at a time. (Called by worker of keyword queries)
+        generation = self._search_generation.value
+
+        future_list = [
+            executor.submit(_search_shard, query, limit, generation)
+            for executor in self._executor_list
+        ]
+
+        if should_stop is not None:
+            while (
+                len(wait(future_list, timeout=SHOULD_STOP_CHECK_INTERVAL).not_done) > 0
+            ):
+                if should_stop():
+                    # Shards stop after their current chunk.
+                    self._search_generation.value = generation + 1
+                    break
+
+        shard_search_result_list = [future.result() for future in future_list]
+
+        # Merge top `limit` of each shard. Each of them is already sorted.
+        # Same score is ordered by position, same as `process.extract` of whole list.
+        merged_search_result = list(
+            itertools.islice(
+                heapq.merge(
+                    *shard_search_result_list,
+                    key=lambda score_and_position: (
+                        -score_and_position[0],
+                        score_and_position[1],
+                    ),
+                ),
+                limit,
+            )
+        )
+
+        return [
+            (self.unicode_character_list[position], score, position)
+            for (score, position) in merged_search_result
+        ]
+
+    def shutdown(self):
+        for executor in self._executor_list:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        self._executor_list = []
@@ -3,10 +3,21 @@ import unittest
 import os
 import sys
 import logging
+import threading
+import time
+
+from rapidfuzz import process
 
 from .load_unicode_data import load_unicode_data
-from .search_unicode_character import search_unicode_character
+from .search_executor import SearchExecutor
+from .search_refinement_cache import SearchRefinementCache
+from .search_unicode_character import (
+    search_unicode_character,
+    search_unicode_character_fuzzy,
+)
+from .search_worker_pool import SearchWorkerPool
 from .unicode_character import UnicodeCharacter
+from .unicode_character_search_index import get_unicode_character_search_index
 from .unicode_extension_feature import UnicodeExtensionFeature
 
 
@@ -16,7 +27,7 @@ class SearchUnicodeCharacterTest(unittest.TestCase):
         cls.UNICODE_CHARACTER_DICT: dict[str, UnicodeCharacter] = {}
         cls.UNICODE_CHARACTER_LIST: list[UnicodeCharacter] = []
 
-        loaded_unicode_data = load_unicode_data()
+        loaded_unicode_data = load_unicode_data(snapshot_dir_path=None)
 
         cls.UNICODE_CHARACTER_DICT = loaded_unicode_data["UNICODE_CHARACTER_DICT"]
         cls.UNICODE_CHARACTER_LIST = loaded_unicode_data["UNICODE_CHARACTER_LIST"]
@@ -60,6 +71,290 @@ class SearchUnicodeCharacterTest(unittest.TestCase):
         self.check_search("U+00B7", "00b7")
         self.check_search("U+00B7", "middle dot")
 
+    def test_search_index_candidate(self):
+        search_index = get_unicode_character_search_index(self.UNICODE_CHARACTER_LIST)
+
+        # `em da` is prefix of `EM DASH`
+        candidate_u_code_point_list = [
+            self.UNICODE_CHARACTER_LIST[position].u_code_point
+            for position in search_index.find_candidate_position_list("em da")
+        ]
+        self.assertIn("U+2014", candidate_u_code_point_list)
+
+        self.assertEqual(search_index.find_candidate_position_list("qqqqq"), [])
+
+    def test_search_index_candidate_filled(self):
+        search_index = get_unicode_character_search_index(self.UNICODE_CHARACTER_LIST)
+
+        # Only a few names have `SMILE`. Result is filled by other characters.
+        self.assertLess(len(search_index.find_candidate_position_list("smile")), 10)
+
+        for search_result in [
+            search_unicode_character_fuzzy("smile", self.UNICODE_CHARACTER_LIST, 10),
+            search_unicode_character("smile", self.UNICODE_CHARACTER_LIST, 10),
+            SearchRefinementCache(self.UNICODE_CHARACTER_LIST).search("smile", 10),
+        ]:
+            self.assertEqual(len(search_result), 10)
+            self.assertEqual(search_result[0][0].name, "SMILE")
+
+    def test_search_fuzzy_same_as_full_scan(self):
+        search_index = get_unicode_character_search_index(self.UNICODE_CHARACTER_LIST)
+
+        def search_full_scan(query: str) -> list[tuple[float, int]]:
+            return [
+                (score, position)
+                for _, score, position in process.extract(
+                    query=query.upper(),
+                    choices=search_index.string_data_for_search_list,
+                    processor=None,
+                    score_cutoff=1,
+                    limit=10,
+                )
+            ]
+
+        # Infix matches (`tick` in `LIPSTICK`, `space` in `BACKSPACE`) are scored too.
+        for query in [
+            "tick",
+            "space",
+            "box",
+            "face",
+            "cat",
+            "sum",
+            "euro",
+            "pi",
+            "hea",
+            "arr",
+            "quote",
+            "arrow",
+            "smile",
+        ]:
+            self.assertEqual(
+                [
+                    (score, position)
+                    for _, score, position in search_unicode_character_fuzzy(
+                        query, self.UNICODE_CHARACTER_LIST, 10
+                    )
+                ],
+                search_full_scan(query),
+                f"Query: `{query}`",
+            )
+
+        # Type-ahead queries refined from the previous ones. (`t`, `ti`, `tic`, ...)
+        search_refinement_cache = SearchRefinementCache(self.UNICODE_CHARACTER_LIST)
+
+        for query in ["tick", "space", "euro", "arrow left"]:
+            for length in range(1, len(query) + 1):
+                self.assertEqual(
+                    search_refinement_cache.search(query[:length], 10),
+                    search_unicode_character(
+                        query[:length], self.UNICODE_CHARACTER_LIST, 10
+                    ),
+                    f"Query: `{query[:length]}`",
+                )
+
+    def test_search_acronym(self):
+        self.check_search("U+0041", "lcla")  # LATIN CAPITAL LETTER A
+        self.check_search("U+2500", "bdlh")  # BOX DRAWINGS LIGHT HORIZONTAL
+        self.check_search("U+200D", "zwj")  # ZERO WIDTH JOINER
+
+    def test_search_name_range(self):
+        # Names made by a rule are not stored, but found by name range.
+        self.check_search("U+6F22", "cjk unified ideograph-6f22")
+        self.check_search("U+6F22", "cjk unified ideograph 6f22")
+        self.check_search("U+AC00", "hangul syllable ga")
+        self.check_search("U+AC01", "hangul syllable gag")
+
+        search_result = search_unicode_character(
+            "cjk unified ideograph 4e0", self.UNICODE_CHARACTER_LIST, 10
+        )
+        self.assertEqual(
+            [unicode_character.name for (unicode_character, _, _) in search_result],
+            [f"CJK UNIFIED IDEOGRAPH-4E0{digit:X}" for digit in range(10)],
+        )
+
+    def test_search_ranked_by_score(self):
+        # Matches of tiers are merged by score. (Prefix `ARROW` is a longer name)
+        search_result = search_unicode_character(
+            "arrow", self.UNICODE_CHARACTER_LIST, 10
+        )
+        score_list = [score for (_, score, _) in search_result]
+        self.assertEqual(score_list, sorted(score_list, reverse=True))
+        self.assertEqual(score_list[-1], 90)
+
+        # Infix match of short name is better than prefix match of long name.
+        search_result = search_unicode_character(
+            "tangut", self.UNICODE_CHARACTER_LIST, 10
+        )
+        (unicode_character, _, _) = search_result[0]
+        self.assertEqual(unicode_character.name, "TANGUT ITERATION MARK")
+
+        # One letter is found in every name, fuzzy match scores no better.
+        score_list = [
+            score
+            for (_, score, _) in search_unicode_character(
+                "c", self.UNICODE_CHARACTER_LIST, 10
+            )
+        ]
+        self.assertEqual(score_list, sorted(score_list, reverse=True))
+
+    def test_search_misspelled_query(self):
+        def search_u_code_point_list(query: str) -> list[str]:
+            return [
+                unicode_character.u_code_point
+                for (unicode_character, _, _) in search_unicode_character(
+                    query, self.UNICODE_CHARACTER_LIST, 10
+                )
+            ]
+
+        # Found by trigram index. (`CHECK MARK`, `HORIZONTAL ELLIPSIS`)
+        self.assertIn("U+2713", search_u_code_point_list("chekmark"))
+        self.assertIn("U+2026", search_u_code_point_list("elipsis"))
+
+    def test_search_stopped(self):
+        # Fuzzy search scores nothing. Result is of the other tiers only.
+        search_result = search_unicode_character(
+            "middle dot", self.UNICODE_CHARACTER_LIST, 10, should_stop=lambda: True
+        )
+        (unicode_character, _, _) = search_result[0]
+        self.assertEqual(unicode_character.u_code_point, "U+00B7")
+
+        self.assertEqual(
+            search_unicode_character(
+                "chekmark", self.UNICODE_CHARACTER_LIST, 10, should_stop=lambda: True
+            ),
+            [],
+        )
+
+        # No character of names. Nothing scores, whole list is not scored.
+        self.assertEqual(
+            search_unicode_character_fuzzy("..", self.UNICODE_CHARACTER_LIST, 10), []
+        )
+
+        # Scored in chunks, same result as scored at once.
+        for query in ["c", "lef arow"]:
+            self.assertEqual(
+                search_unicode_character(
+                    query, self.UNICODE_CHARACTER_LIST, 10, should_stop=lambda: False
+                ),
+                search_unicode_character(query, self.UNICODE_CHARACTER_LIST, 10),
+                f"Query: `{query}`",
+            )
+
+    def test_search_executor(self):
+        search_executor: SearchExecutor[str] = SearchExecutor(latency_budget=0.01)
+
+        def slow_search(should_stop) -> str:
+            while not should_stop():
+                time.sleep(0.001)
+
+            return "partial"
+
+        self.assertEqual(search_executor.search(slow_search), ("partial", True))
+        self.assertEqual(
+            search_executor.search(lambda should_stop: "done"), ("done", False)
+        )
+
+        # Finished without being stopped, though returned after the deadline.
+        def late_search(should_stop) -> str:
+            time.sleep(0.02)
+
+            return "done"
+
+        self.assertEqual(search_executor.search(late_search), ("done", False))
+        self.assertEqual(search_executor.generation, 3)
+
+        search_executor.shutdown()
+
+    def test_search_executor_supersede(self):
+        # No latency budget. Only newer search stops older one.
+        search_executor: SearchExecutor[str] = SearchExecutor(latency_budget=0)
+        search_started_event = threading.Event()
+        older_result_list: list[tuple[str, bool]] = []
+
+        def slow_search(should_stop) -> str:
+            search_started_event.set()
+
+            while not should_stop():
+                time.sleep(0.001)
+
+            return "partial"
+
+        older_search_thread = threading.Thread(
+            target=lambda: older_result_list.append(search_executor.search(slow_search))
+        )
+        older_search_thread.start()
+        self.assertTrue(search_started_event.wait(5))
+
+        self.assertEqual(
+            search_executor.search(lambda should_stop: "newer"), ("newer", False)
+        )
+        older_search_thread.join(5)
+        self.assertEqual(older_result_list, [("partial", True)])
+
+        search_executor.shutdown()
+
+    def test_search_worker_pool(self):
+        search_worker_pool = SearchWorkerPool(self.UNICODE_CHARACTER_LIST, 2)
+
+        try:
+            # Same as search of whole list in one process.
+            self.assertEqual(
+                search_worker_pool.search("qwxz", 10),
+                search_unicode_character_fuzzy(
+                    "qwxz", self.UNICODE_CHARACTER_LIST, 10, candidate_position_list=[]
+                ),
+            )
+
+            # Stopped search returns partial result, not waiting for whole list.
+            self.assertEqual(
+                search_worker_pool.search("qwxz", 10, should_stop=lambda: True), []
+            )
+
+            should_stop_call_list: list[bool] = []
+
+            def should_stop_while_searching() -> bool:
+                should_stop_call_list.append(True)
+                return len(should_stop_call_list) > 1
+
+            search_result = search_worker_pool.search(
+                "qwxz", 10, should_stop=should_stop_while_searching
+            )
+            self.assertLessEqual(len(search_result), 10)
+
+            # Next search is not stopped.
+            self.assertEqual(len(search_worker_pool.search("qwxz", 10)), 10)
+        finally:
+            search_worker_pool.shutdown()
+
+    def test_search_refinement_cache(self):
+        search_refinement_cache = SearchRefinementCache(self.UNICODE_CHARACTER_LIST)
+
+        query = "middle dot"
+        search_result_list = [
+            search_refinement_cache.search(query[:length], 10)
+            for length in range(1, len(query) + 1)
+        ]
+
+        (unicode_character, _, _) = search_result_list[-1][0]
+        self.assertEqual(unicode_character.u_code_point, "U+00B7")
+
+        # Backspace: `middle do`
+        self.assertEqual(
+            search_refinement_cache.search(query[:-1], 10), search_result_list[-2]
+        )
+
+        # Whole list is scored only up to limit. Result cut by it is not refined.
+        # (`qwx` -> `qwxz`)
+        for query in ["qwxz", "bdlh"]:
+            for length in range(1, len(query) + 1):
+                self.assertEqual(
+                    search_refinement_cache.search(query[:length], 10),
+                    search_unicode_character(
+                        query[:length], self.UNICODE_CHARACTER_LIST, 10
+                    ),
+                    f"Query: `{query[:length]}`",
+                )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,11 +1,28 @@
 import unittest
 
+import json
 import os
+import struct
 import sys
 import logging
-
-from .load_unicode_data import load_unicode_data
+import tempfile
+import unicodedata
+
+from .load_unicode_data import (
+    load_unicode_data,
+    load_unicode_data_from_binary,
+    load_unicode_data_from_delta,
+    load_unicode_data_from_json,
+)
 from .unicode_character import UnicodeCharacter
+from .unicode_character_search_index import get_unicode_character_search_index
+from .unicode_data_binary import UnicodeDataBinary
+from .unicode_data_snapshot import (
+    UNICODE_DATA_SNAPSHOT_FILENAME,
+    load_unicode_data_snapshot,
+    save_unicode_data_snapshot,
+)
+from .unicode_name_lexicon import UnicodeNameLexicon
 
 logger = logging.getLogger()
 logger.level = logging.DEBUG
@@ -13,6 +30,8 @@ logger.level = logging.DEBUG
 PROJECT_PATH = os.getcwd()
 
 UNICODE_DATA_JSON_PATH = f"{PROJECT_PATH}/data/unicode_data.json"
+UNICODE_DATA_BINARY_PATH = f"{PROJECT_PATH}/data/unicode_data.bin"
+UNICODE_DATA_DELTA_PATH = f"{PROJECT_PATH}/data/unicode_data_delta.json"
 
 
 class UnicodeDataJsonTest(unittest.TestCase):
@@ -20,7 +39,171 @@ class UnicodeDataJsonTest(unittest.TestCase):
         self.assertTrue(os.path.exists(UNICODE_DATA_JSON_PATH))
 
     def test_can_load_unicode_data(self):
-        load_unicode_data()
+        # Snapshot is saved in temporary directory, not in cache of user.
+        with tempfile.TemporaryDirectory() as temp_dir:
+            load_unicode_data(snapshot_dir_path=temp_dir)
+
+    def test_unicode_data_binary_is_same_as_json(self):
+        if not os.path.exists(UNICODE_DATA_BINARY_PATH):
+            self.skipTest("`unicode_data.bin` is not generated")
+
+        def to_tuple(unicode_character: UnicodeCharacter) -> tuple:
+            return (
+                unicode_character.code_point,
+                unicode_character.name,
+                unicode_character.block,
+                unicode_character.aliases,
+                unicode_character._string_data_for_search,
+            )
+
+        self.assertEqual(
+            list(
+                map(
+                    to_tuple,
+                    load_unicode_data_from_binary(UNICODE_DATA_BINARY_PATH)[
+                        "UNICODE_CHARACTER_LIST"
+                    ],
+                )
+            ),
+            list(
+                map(
+                    to_tuple,
+                    load_unicode_data_from_json(UNICODE_DATA_JSON_PATH)[
+                        "UNICODE_CHARACTER_LIST"
+                    ],
+                )
+            ),
+        )
+
+    def test_unicode_data_binary_close(self):
+        if not os.path.exists(UNICODE_DATA_BINARY_PATH):
+            self.skipTest("`unicode_data.bin` is not generated")
+
+        unicode_data_binary = UnicodeDataBinary(UNICODE_DATA_BINARY_PATH)
+        self.assertEqual(unicode_data_binary.get_code_point(0), 0)
+
+        # Records are copied. Nothing is read from the file after it's closed.
+        record_list = list(unicode_data_binary.iterate_record())
+        unicode_data_binary.close()
+
+        self.assertTrue(unicode_data_binary._mmap.closed)
+        self.assertEqual(record_list[0][0], 0)
+
+        with self.assertRaises(ValueError):
+            unicode_data_binary.get_code_point(0)
+
+    def test_unicode_data_delta_is_same_as_json(self):
+        if not os.path.exists(UNICODE_DATA_DELTA_PATH):
+            self.skipTest("`unicode_data_delta.json` is not generated")
+
+        with open(UNICODE_DATA_DELTA_PATH) as file:
+            if json.load(file)["unidata_version"] != unicodedata.unidata_version:
+                with self.assertRaises(ValueError):
+                    load_unicode_data_from_delta(UNICODE_DATA_DELTA_PATH)
+
+                self.skipTest("Unicode version of `unicodedata` is different")
+
+        def to_tuple(unicode_character: UnicodeCharacter) -> tuple:
+            return (
+                unicode_character.code_point,
+                unicode_character.name,
+                unicode_character.block,
+                unicode_character.aliases,
+                unicode_character._string_data_for_search,
+            )
+
+        # Every code point
+        self.assertEqual(
+            list(
+                map(
+                    to_tuple,
+                    load_unicode_data_from_delta(UNICODE_DATA_DELTA_PATH)[
+                        "UNICODE_CHARACTER_LIST"
+                    ],
+                )
+            ),
+            list(
+                map(
+                    to_tuple,
+                    load_unicode_data_from_json(UNICODE_DATA_JSON_PATH)[
+                        "UNICODE_CHARACTER_LIST"
+                    ],
+                )
+            ),
+        )
+
+    def test_unicode_data_binary_of_wrong_checksum_is_validated(self):
+        if not os.path.exists(UNICODE_DATA_BINARY_PATH):
+            self.skipTest("`unicode_data.bin` is not generated")
+
+        with open(UNICODE_DATA_BINARY_PATH, "rb") as file:
+            data = bytearray(file.read())
+
+        # Last code point of file is before the first one. (Not in order)
+        (code_point_offset,) = struct.unpack_from("<I", data, 28)
+        (character_number,) = struct.unpack_from("<I", data, 8)
+        struct.pack_into("<I", data, code_point_offset + (character_number - 1) * 4, 0)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            broken_binary_path = f"{temp_dir}/unicode_data.bin"
+
+            with open(broken_binary_path, "wb") as file:
+                file.write(data)
+
+            with self.assertLogs(level=logging.WARNING):
+                with self.assertRaises(ValueError):
+                    load_unicode_data_from_binary(broken_binary_path)
+
+    def test_unicode_name_lexicon(self):
+        lexicon = UnicodeNameLexicon()
+
+        word_id_list = lexicon.encode("LINE FEED (LF)", ["LINE FEED", "LF"])
+
+        # `LINE`, `FEED` are once in lexicon.
+        self.assertEqual(lexicon.word_list, ["LINE", "FEED", "(LF)", "LF"])
+        self.assertEqual(
+            lexicon.decode(word_id_list), ("LINE FEED (LF)", ["LINE FEED", "LF"])
+        )
+        self.assertEqual(lexicon.decode_name(word_id_list), "LINE FEED (LF)")
+        self.assertEqual(lexicon.decode(lexicon.encode("EM DASH", [])), ("EM DASH", []))
+
+    def test_unicode_data_snapshot(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            data_file_path = f"{temp_dir}/data_file"
+            snapshot_file_path = f"{temp_dir}/snapshot/{UNICODE_DATA_SNAPSHOT_FILENAME}"
+
+            with open(data_file_path, "w") as file:
+                file.write("a")
+
+            unicode_data = load_unicode_data(snapshot_dir_path=None)
+
+            save_unicode_data_snapshot(
+                snapshot_file_path, [data_file_path], unicode_data
+            )
+            loaded_unicode_data = (
+                load_unicode_data_snapshot(snapshot_file_path, [data_file_path]) or {}
+            )
+
+            self.assertIn("UNICODE_CHARACTER_LIST", loaded_unicode_data)
+            unicode_character_list = loaded_unicode_data["UNICODE_CHARACTER_LIST"]
+            self.assertEqual(
+                loaded_unicode_data["UNICODE_CHARACTER_DICT"]["U+2014"].name, "EM DASH"
+            )
+            # Index of loaded list is loaded too, not built again.
+            self.assertIs(
+                get_unicode_character_search_index(
+                    unicode_character_list
+                ).unicode_character_list,
+                unicode_character_list,
+            )
+
+            # Data file is changed
+            with open(data_file_path, "w") as file:
+                file.write("ab")
+
+            self.assertIsNone(
+                load_unicode_data_snapshot(snapshot_file_path, [data_file_path])
+            )
 
 
 class UnicodeDataVerificationTest(unittest.TestCase):
@@ -29,7 +212,7 @@ class UnicodeDataVerificationTest(unittest.TestCase):
         cls.UNICODE_CHARACTER_DICT: dict[str, UnicodeCharacter] = {}
         cls.UNICODE_CHARACTER_LIST: list[UnicodeCharacter] = []
 
-        loaded_unicode_data = load_unicode_data()
+        loaded_unicode_data = load_unicode_data(snapshot_dir_path=None)
 
         cls.UNICODE_CHARACTER_DICT = loaded_unicode_data["UNICODE_CHARACTER_DICT"]
         cls.UNICODE_CHARACTER_LIST = loaded_unicode_data["UNICODE_CHARACTER_LIST"]
@@ -148,6 +331,58 @@ class UnicodeDataVerificationTest(unittest.TestCase):
         )
         self.assertEqual(self.get_unicode_character_block("U+AC00"), "Hangul Syllables")
 
+    def test_unicode_character_list_and_dict_of_store(self):
+        unicode_character = self.get_unicode_character("U+000A")
+
+        # Same object for the same character
+        self.assertIs(self.UNICODE_CHARACTER_DICT["U+000A"], unicode_character)
+        self.assertIs(self.UNICODE_CHARACTER_LIST[10], unicode_character)
+        self.assertIn("EOL", unicode_character.aliases)
+        self.assertEqual(unicode_character.u_code_point, "U+000A")
+        self.assertEqual(unicode_character.character, "\n")
+        self.assertEqual(self.get_unicode_character("U+0041").aliases, [])
+        self.assertEqual(
+            self.UNICODE_CHARACTER_LIST[-1].u_code_point,
+            list(self.UNICODE_CHARACTER_DICT)[-1],
+        )
+
+        # Name of name range is made when accessed
+        unicode_character = self.get_unicode_character("U+9FFF")
+        self.assertEqual(unicode_character.name, "CJK UNIFIED IDEOGRAPH-9FFF")
+        self.assertEqual(
+            unicode_character._string_data_for_search,
+            "U+9FFF CJK UNIFIED IDEOGRAPH-9FFF",
+        )
+        self.assertEqual(unicode_character.aliases, [])
+        store = self.UNICODE_CHARACTER_LIST.store
+        self.assertEqual(
+            len(store.get_name_word_id_array(store.find_position(0x9FFF) or 0)), 0
+        )
+
+        # Key is same as `u_code_point`
+        for key in ["U+A", "U+000a", "U+000A ", "000A", "U+0378"]:
+            self.assertNotIn(key, self.UNICODE_CHARACTER_DICT)
+
+        # Found by code point too
+        self.assertIs(
+            self.UNICODE_CHARACTER_DICT.get_by_code_point(0x000A),
+            self.UNICODE_CHARACTER_DICT["U+000A"],
+        )
+        self.assertIsNone(self.UNICODE_CHARACTER_DICT.get_by_code_point(0x0378))
+
+        # Objects not used anymore are freed. (Not kept for every character)
+        materialized_number = self.UNICODE_CHARACTER_LIST.get_materialized_number()
+        unicode_character_list = self.UNICODE_CHARACTER_LIST[20000:30000]
+        self.assertGreaterEqual(
+            self.UNICODE_CHARACTER_LIST.get_materialized_number(),
+            materialized_number + 10000,
+        )
+        del unicode_character_list
+        self.assertLess(
+            self.UNICODE_CHARACTER_LIST.get_materialized_number(),
+            materialized_number + 10000,
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,11 +1,29 @@
 import unittest
 
+import json
 import os
 import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import wait
 
+from .code_point_query import parse_code_point_query
 from .load_unicode_data import load_unicode_data
-from .unicode_character_icon import reset_unicode_character_icon_dir
+from .search_unicode_character import search_unicode_character
 from .unicode_character import UnicodeCharacter
+from .unicode_character_icon import (
+    UnicodeCharacterIconCache,
+    UnicodeCharacterIconPrefetcher,
+    UNICODE_CHARACTER_ICON_VERSION,
+    create_unicode_character_icon_file,
+    generate_unicode_character_icon,
+    get_unicode_character_icon_dir_path,
+    get_unicode_character_icon_file_path,
+    get_unicode_character_icon_namespace,
+    remove_old_unicode_character_icon_dir,
+    touch_unicode_character_icon_dir,
+)
 from .unicode_extension_feature import UnicodeExtensionFeature
 from .util import get_project_path
 
@@ -14,15 +32,23 @@ from ulauncher.api.shared.item.ExtensionSmallResultItem import ExtensionSmallRes
 
 
 class UnicodeExtensionFeatureTest(unittest.TestCase):
-    def setUp(self):
-        reset_unicode_character_icon_dir()
+    @classmethod
+    def setUpClass(cls):
+        # Not saving snapshot in cache of user. Loaded once, search indexes too.
+        cls.LOADED_UNICODE_DATA = load_unicode_data(snapshot_dir_path=None)
 
-        loaded_unicode_data = load_unicode_data()
+    def setUp(self):
+        # Icons are made in temporary directory, not in cache of user.
+        self.icon_cache_temp_dir = tempfile.TemporaryDirectory(
+            ignore_cleanup_errors=True
+        )
+        self.addCleanup(self.icon_cache_temp_dir.cleanup)
 
         self.feature: UnicodeExtensionFeature = UnicodeExtensionFeature(
             project_path=get_project_path(),
-            unicode_character_list=loaded_unicode_data["UNICODE_CHARACTER_LIST"],
-            unicode_character_dict=loaded_unicode_data["UNICODE_CHARACTER_DICT"],
+            unicode_character_list=self.LOADED_UNICODE_DATA["UNICODE_CHARACTER_LIST"],
+            unicode_character_dict=self.LOADED_UNICODE_DATA["UNICODE_CHARACTER_DICT"],
+            icon_cache_dir_path=self.icon_cache_temp_dir.name,
         )
 
     def get_copy_value_of_extension_result_item(
@@ -51,6 +77,22 @@ class UnicodeExtensionFeatureTest(unittest.TestCase):
         self.feature.preferences.update({"search_result_list_size": "0"})
         self.assertEqual(0, self.feature.preferences.search_result_list_size)
 
+        self.feature.preferences.update({"search_worker_number": "asdf"})
+        self.assertEqual(self.feature.preferences.search_worker_number, 1)
+
+        self.feature.preferences.update({"search_worker_number": "0"})
+        self.assertEqual(
+            self.feature.preferences.search_worker_number,
+            1,
+            "'search_worker_number' can't be lower than 1",
+        )
+
+        self.feature.preferences.update({"search_latency_budget": "asdf"})
+        self.assertEqual(self.feature.preferences.search_latency_budget, 500)
+
+        self.feature.preferences.update({"search_latency_budget": "-1"})
+        self.assertEqual(self.feature.preferences.search_latency_budget, 500)
+
         self.feature.preferences.update({"unicode_character_icon_font": ""})
         self.assertNotEqual(
             "",
@@ -199,6 +241,169 @@ class UnicodeExtensionFeatureTest(unittest.TestCase):
 
         self.assertEqual(search_result[0].get_name(), "LATIN CAPITAL LETTER A")
 
+    def test_generate_search_result_prefetch(self):
+        # Prefetched characters don't change the result. (`CHECK MARK` is 4th)
+        for query in ["chekmark", "arrow"]:
+            search_result = self.feature.generate_search_result(query)
+
+            self.assertEqual(
+                [item.get_name() for item in search_result],
+                [
+                    unicode_character.name
+                    for (unicode_character, _, _) in search_unicode_character(
+                        query,
+                        self.feature.unicode_character_list,
+                        self.feature.preferences.search_result_list_size,
+                    )
+                ],
+                f"Query: `{query}`",
+            )
+
+        # Icon of character after the result is made in background.
+        wait(
+            list(
+                self.feature.unicode_character_icon_prefetcher._pending_future_dict.values()
+            ),
+            timeout=5,
+        )
+        limit = self.feature.preferences.search_result_list_size
+        (next_unicode_character, _, _) = search_unicode_character(
+            "arrow", self.feature.unicode_character_list, limit + 1
+        )[limit]
+        self.assertIsNotNone(
+            self.feature.unicode_character_icon_cache.find_icon(
+                next_unicode_character,
+                background=self.feature.preferences.unicode_character_icon_background,
+                font=self.feature.preferences.unicode_character_icon_font,
+            )
+        )
+
+    def test_generate_search_result_of_code_point(self):
+        def get_name_list(query: str) -> list[str]:
+            return [
+                item.get_name() for item in self.feature.generate_search_result(query)
+            ]
+
+        for query in ["U+2014", "2014", "0x2014", "&#x2014;", "#8212", "&#8212;"]:
+            self.assertEqual(get_name_list(query)[0], "EM DASH", f"Query: `{query}`")
+
+        self.assertEqual(
+            get_name_list("U+2190..U+2193"),
+            ["LEFTWARDS ARROW", "UPWARDS ARROW", "RIGHTWARDS ARROW", "DOWNWARDS ARROW"],
+        )
+
+        for query in ["2190..2193", "0x2190..U+2193"]:
+            self.assertEqual(
+                str(parse_code_point_query(query)), "range: U+2190..U+2193"
+            )
+
+        # Words are not a range. (Not `U+000A..U+000B`, `U+000C..U+000F`)
+        for query in ["a..b", "c..f", "face..feed"]:
+            self.assertIsNone(parse_code_point_query(query), f"Query: `{query}`")
+
+    def test_generate_search_result_of_block(self):
+        search_result = self.feature.generate_search_result("blk:arrows right")
+
+        self.assertEqual(search_result[0].get_name(), "RIGHTWARDS ARROW")
+        self.assertTrue(
+            all("(Arrows)" in item.get_description() for item in search_result)
+        )
+
+        search_result = self.feature.generate_search_result("in:box_drawing heavy")
+
+        self.assertTrue(
+            all(
+                item.get_name().startswith("BOX DRAWINGS HEAVY")
+                for item in search_result
+            )
+        )
+
+        # `A` is searched, not a word of `Latin Extended-A`. (Not completion)
+        search_result = self.feature.generate_search_result("blk:latin a")
+
+        self.assertGreater(len(search_result), 0)
+        self.assertTrue(
+            all(
+                "(Latin-1 Supplement)" in item.get_description()
+                for item in search_result
+            )
+        )
+
+        # Every word of block name
+        search_result = self.feature.generate_search_result("blk:latin extended-a a")
+
+        self.assertTrue(
+            all(
+                "(Latin Extended-A)" in item.get_description()
+                for item in search_result
+            )
+        )
+
+        # Block name completion
+        search_result = self.feature.generate_search_result("blk:box")
+
+        self.assertEqual(search_result[0].get_name(), "Box Drawing")
+        self.assertEqual(
+            search_result[0]._on_enter.query,  # type: ignore
+            "u blk:Box Drawing ",
+        )
+
+    def test_generate_search_result_cache(self):
+        from ulauncher.api.shared.event import PreferencesUpdateEvent
+
+        search_result = self.feature.generate_search_result("em dash")
+
+        hit_count = self.feature.search_result_cache.hit_count
+
+        # Same query except case and spaces
+        self.assertEqual(
+            self.feature.generate_search_result(" EM  dash "), search_result
+        )
+        self.assertEqual(self.feature.search_result_cache.hit_count, hit_count + 1)
+
+        self.feature.handle_preferences_update_event(
+            PreferencesUpdateEvent("search_result_view_type", "default", "small")
+        )
+        self.assertEqual(len(self.feature.search_result_cache), 0)
+
+        search_result = self.feature.generate_search_result("em dash")
+        self.assertIsInstance(search_result[0], ExtensionSmallResultItem)
+
+    def test_generate_search_result_cache_removed_icon(self):
+        icon_cache = self.feature.unicode_character_icon_cache
+
+        def get_icon_list(search_result: list[ExtensionResultItem]) -> list[str]:
+            return [
+                extension_result_item._icon  # type: ignore
+                for extension_result_item in search_result
+            ]
+
+        # Icons are made. (Not in icon pack)
+        self.feature.unicode_character_icon_prefetcher.wait_timeout = 5
+        icon_list = get_icon_list(self.feature.generate_search_result("hiragana a"))
+        self.assertTrue(all(os.path.isfile(icon) for icon in icon_list))
+
+        # Prefetched icons are made before the limit is lowered. (Made later, they
+        # would remove icons of the next result by the lowered limit)
+        wait(
+            list(
+                self.feature.unicode_character_icon_prefetcher._pending_future_dict.values()
+            ),
+            timeout=5,
+        )
+
+        # Icons used by cached result are removed by limit of icon cache.
+        icon_cache.set_limit(max_file_number=1, max_byte_size=icon_cache.max_byte_size)
+        icon_cache.set_limit(
+            max_file_number=icon_cache.DEFAULT_MAX_FILE_NUMBER,
+            max_byte_size=icon_cache.max_byte_size,
+        )
+        self.assertFalse(all(os.path.isfile(icon) for icon in icon_list))
+
+        # Result is made again, not using removed icons.
+        icon_list = get_icon_list(self.feature.generate_search_result("hiragana a"))
+        self.assertTrue(all(os.path.isfile(icon) for icon in icon_list))
+
     def test_handle_keyword_query_event(self):
         # TODO: improve
         from ulauncher.api.shared.action.RenderResultListAction import (
@@ -226,6 +431,245 @@ class UnicodeExtensionFeatureTest(unittest.TestCase):
 
         self.assertEqual(result[1].get_name(), "LATIN CAPITAL LETTER A")
 
+    def test_handle_keyword_query_event_in_background(self):
+        from ulauncher.api.shared.event import KeywordQueryEvent
+        from ulauncher.search.Query import Query
+
+        sent_query_list: list[str] = []
+
+        def handle_in_background(query: str):
+            return self.feature.handle_keyword_query_event_in_background(
+                KeywordQueryEvent(Query(query)),
+                lambda action: sent_query_list.append(query),
+            )
+
+        # Worker is busy. Queries typed meanwhile are waiting.
+        worker_event = threading.Event()
+        self.feature._keyword_query_executor.submit(worker_event.wait)
+
+        future_list = [
+            handle_in_background(query) for query in ["u em", "u em d", "u em dash"]
+        ]
+        worker_event.set()
+
+        for future in future_list:
+            future.result(timeout=30)
+
+        # Only result of the latest query is sent.
+        self.assertEqual(sent_query_list, ["u em dash"])
+
+    def test_handle_keyword_query_event_while_loading(self):
+        from ulauncher.api.shared.event import KeywordQueryEvent
+        from ulauncher.search.Query import Query
+
+        feature = UnicodeExtensionFeature(
+            project_path=get_project_path(),
+            icon_cache_dir_path=self.icon_cache_temp_dir.name,
+        )
+
+        self.assertFalse(feature.is_unicode_data_ready())
+
+        # Conversion is answered before Unicode data is loaded
+        result = feature.handle_keyword_query_event(
+            KeywordQueryEvent(Query("u a"))
+        ).result_list
+
+        self.assertEqual(result[0].get_name(), "LATIN SMALL LETTER A")
+        self.assertEqual(result[-1].get_name(), "Loading Unicode data…")
+        self.assertIsNotNone(feature.first_response_time)
+
+        result = feature.handle_keyword_query_event(
+            KeywordQueryEvent(Query("u ab"))
+        ).result_list
+
+        self.assertEqual(result[0].get_name(), "U+0061 U+0062")
+
+        feature.load_unicode_data_in_background(
+            lambda: load_unicode_data(snapshot_dir_path=None)
+        )
+
+        self.assertTrue(feature.wait_unicode_data(timeout=60))
+        self.assertIsNotNone(feature.unicode_data_ready_time)
+
+        result = feature.handle_keyword_query_event(
+            KeywordQueryEvent(Query("u latin capital letter a"))
+        ).result_list
+
+        self.assertEqual(result[1].get_name(), "LATIN CAPITAL LETTER A")
+
+    def test_unicode_character_icon_cache(self):
+        unicode_character = self.feature.unicode_character_dict["U+2014"]
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            icon_file_path = generate_unicode_character_icon(
+                unicode_character, font="sans-serif", icon_cache_dir_path=temp_dir
+            )
+            self.assertTrue(os.path.isfile(icon_file_path))
+            self.assertEqual(icon_file_path[-len("/14/u_2014.svg") :], "/14/u_2014.svg")
+
+            # Other font is in other directory. (Not the old icon of same path)
+            icon_file_path_of_serif = generate_unicode_character_icon(
+                unicode_character, font="serif", icon_cache_dir_path=temp_dir
+            )
+            self.assertNotEqual(icon_file_path, icon_file_path_of_serif)
+            self.assertEqual(
+                generate_unicode_character_icon(
+                    unicode_character, font="serif", icon_cache_dir_path=temp_dir
+                ),
+                icon_file_path_of_serif,
+            )
+
+            # Directory not used for a long time is removed.
+            icon_dir_path = get_unicode_character_icon_dir_path(
+                font="sans-serif", icon_cache_dir_path=temp_dir
+            )
+            old_time = time.time() - 100
+            os.utime(icon_dir_path, (old_time, old_time))
+            touch_unicode_character_icon_dir(font="serif", icon_cache_dir_path=temp_dir)
+
+            removed_dir_path_list = remove_old_unicode_character_icon_dir(
+                temp_dir, max_age=50
+            )
+            self.assertIn(icon_dir_path, removed_dir_path_list)
+            self.assertNotIn(
+                get_unicode_character_icon_dir_path(
+                    font="serif", icon_cache_dir_path=temp_dir
+                ),
+                removed_dir_path_list,
+            )
+            self.assertFalse(os.path.exists(icon_file_path))
+            self.assertTrue(os.path.isfile(icon_file_path_of_serif))
+
+    def test_unicode_character_icon_cache_limit(self):
+        unicode_character_list = [
+            self.feature.unicode_character_dict[f"U+{code_point:04X}"]
+            for code_point in range(0x41, 0x41 + 5)
+        ]
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            icon_cache = UnicodeCharacterIconCache(temp_dir, max_file_number=3)
+
+            icon_file_path_list = [
+                icon_cache.get_icon(unicode_character)
+                for unicode_character in unicode_character_list[:3]
+            ]
+
+            # `A` is used again, so `B` is least recently used.
+            icon_cache.get_icon(unicode_character_list[0])
+            icon_cache.get_icon(unicode_character_list[3])
+
+            self.assertEqual(len(icon_cache), 3)
+            self.assertEqual(icon_cache.removed_count, 1)
+            self.assertTrue(os.path.isfile(icon_file_path_list[0]))
+            self.assertFalse(os.path.exists(icon_file_path_list[1]))
+
+            # Files of before are found by new cache. (e.g., after restart)
+            # Temp file left by a stopped write is removed.
+            temp_file_path = f"{icon_file_path_list[0]}.1.1.tmp"
+            with open(temp_file_path, "w") as file:
+                file.write("<svg")
+
+            icon_cache = UnicodeCharacterIconCache(temp_dir, max_file_number=3)
+            self.assertEqual(len(icon_cache), 3)
+            self.assertFalse(os.path.exists(temp_file_path))
+            self.assertEqual(
+                icon_cache.find_icon(unicode_character_list[0]),
+                icon_file_path_list[0],
+            )
+            self.assertIsNone(icon_cache.find_icon(unicode_character_list[1]))
+
+            # Limit of bytes
+            icon_cache.set_limit(
+                max_file_number=3, max_byte_size=icon_cache.get_byte_size() - 1
+            )
+            self.assertEqual(len(icon_cache), 2)
+
+    def test_unicode_character_icon_pack(self):
+        unicode_character_a = self.feature.unicode_character_dict["U+0041"]
+        unicode_character_b = self.feature.unicode_character_dict["U+0042"]
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            icon_cache_dir_path = f"{temp_dir}/cache"
+            icon_pack_dir_path = f"{temp_dir}/pack"
+
+            # Icon pack of `A` (Same as `generate_data`)
+            icon_pack_file_path = get_unicode_character_icon_file_path(
+                unicode_character_a, icon_cache_dir_path=icon_pack_dir_path
+            )
+            create_unicode_character_icon_file(icon_pack_file_path, unicode_character_a)
+
+            with open(f"{icon_pack_dir_path}/icon_pack.json", "w") as file:
+                json.dump(
+                    {
+                        "version": UNICODE_CHARACTER_ICON_VERSION,
+                        "namespaces": {
+                            get_unicode_character_icon_namespace(None, "sans-serif"): {
+                                "font": "sans-serif",
+                                "background": None,
+                                "code_points": ["0041"],
+                            }
+                        },
+                    },
+                    file,
+                )
+
+            icon_cache = UnicodeCharacterIconCache(
+                icon_cache_dir_path, icon_pack_dir_path=icon_pack_dir_path
+            )
+
+            # Icon of pack is used, and no file is made for it.
+            self.assertEqual(
+                icon_cache.get_icon(unicode_character_a), icon_pack_file_path
+            )
+            self.assertEqual(len(icon_cache), 0)
+
+            # Other font is not in pack.
+            self.assertIsNone(icon_cache.find_icon(unicode_character_a, font="serif"))
+
+            # Character not in pack is made in cache.
+            self.assertTrue(
+                icon_cache.get_icon(unicode_character_b).startswith(icon_cache_dir_path)
+            )
+            self.assertEqual(len(icon_cache), 1)
+
+    def test_unicode_character_icon_prefetcher(self):
+        unicode_character_list = [
+            self.feature.unicode_character_dict[f"U+{code_point:04X}"]
+            for code_point in range(0x41, 0x41 + 4)
+        ]
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            icon_cache = UnicodeCharacterIconCache(temp_dir)
+            icon_prefetcher = UnicodeCharacterIconPrefetcher(
+                icon_cache, worker_number=1, wait_timeout=0.01
+            )
+
+            # Worker is busy. Icons are not made yet.
+            worker_event = threading.Event()
+            icon_prefetcher._executor.submit(worker_event.wait)
+
+            # Result doesn't wait for icons being made.
+            self.assertEqual(
+                icon_prefetcher.get_icon_list(
+                    unicode_character_list[:2], placeholder="placeholder"
+                ),
+                ["placeholder", "placeholder"],
+            )
+
+            icon_prefetcher.prefetch(unicode_character_list)
+
+            # Icon being made is requested once.
+            self.assertEqual(icon_prefetcher.request_count, 4)
+
+            worker_event.set()
+            icon_prefetcher._executor.shutdown(wait=True)
+
+            self.assertEqual(
+                icon_prefetcher.get_icon_list(unicode_character_list),
+                [icon_cache.get_icon(c) for c in unicode_character_list],
+            )
+            self.assertEqual(len(icon_cache), 4)
+
 
 if __name__ == "__main__":
     unittest.main()
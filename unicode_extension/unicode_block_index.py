@@ -0,0 +1,211 @@
+from .unicode_character import UnicodeCharacter
+from .unicode_character_search_index import TOKEN_PATTERN
+from .unicode_character_store import iterate_block
+
+
+# Not counted as an extra word of block name. (`Greek and Coptic`)
+BLOCK_NAME_STOP_WORD_SET = {"AND"}
+
+
+class UnicodeBlockIndex:
+    """
+    Index of Unicode blocks in `unicode_character_list`.
+
+    `unicode_character_list` is sorted by code point, and a block is a range of
+    code points, so characters of a block are a contiguous slice of the list.
+
+    Attributes:
+        unicode_character_list (list[UnicodeCharacter]): Indexed list.
+        block_list (list[str]): Block names in order of code point.
+            Example: `["Basic Latin", "Latin-1 Supplement", ...]`
+        block_position_range_dict (dict[str, range]): Block -> positions in list.
+            Example: `"Arrows"` -> `range(7841, 7953)`
+        block_token_list_dict (dict[str, list[str]]): Block -> upper case words.
+            Example: `"Latin Extended-A"` -> `["LATIN", "EXTENDED", "A"]`
+    """
+
+    unicode_character_list: list[UnicodeCharacter]
+    block_list: list[str]
+    block_position_range_dict: dict[str, range]
+    block_token_list_dict: dict[str, list[str]]
+
+    def __init__(self, unicode_character_list: list[UnicodeCharacter]):
+        self.unicode_character_list = unicode_character_list
+
+        self.block_list = []
+        self.block_position_range_dict = {}
+        self.block_token_list_dict = {}
+
+        block_first_position = 0
+
+        block_list = list(iterate_block(unicode_character_list))
+
+        for position, block in enumerate(block_list):
+            is_last_of_block = (position + 1 == len(block_list)) or (
+                block_list[position + 1] != block
+            )
+
+            if not is_last_of_block:
+                continue
+
+            self.block_list.append(block)
+            self.block_position_range_dict[block] = range(
+                block_first_position, position + 1
+            )
+            self.block_token_list_dict[block] = TOKEN_PATTERN.findall(block.upper())
+
+            block_first_position = position + 1
+
+    def __len__(self):
+        return len(self.unicode_character_list)
+
+    def find_block_list(self, block_query: str) -> list[str]:
+        """Find blocks matching block name query.
+
+        Every word of query should be a prefix of a word of block name, in order.
+        (`math op` -> `Mathematical Operators`, `box_draw` -> `Box Drawing`)
+
+        Args:
+            block_query: E.g., `"arrows"`, `"box drawing"`, `""` (Every block)
+
+        Returns:
+            Matched blocks. Better match first.
+
+            1. First word of query matches first word of block name.
+            2. Fewer words of block name not in query.
+            3. Order of code point.
+        """
+
+        query_token_list = TOKEN_PATTERN.findall(block_query.upper())
+
+        if len(query_token_list) == 0:
+            return list(self.block_list)
+
+        block_and_rank_list: list[tuple[str, tuple[bool, int, int]]] = []
+
+        for order, block in enumerate(self.block_list):
+            block_token_list = self.block_token_list_dict[block]
+
+            # Each query word matches the first block word it's a prefix of.
+            query_token_position = 0
+
+            for block_token in block_token_list:
+                if query_token_position == len(query_token_list):
+                    break
+
+                if block_token.startswith(query_token_list[query_token_position]):
+                    query_token_position += 1
+
+            if query_token_position < len(query_token_list):
+                continue
+
+            extra_token_number = self.__count_extra_token(block, query_token_list)
+
+            is_first_token_matched = block_token_list[0].startswith(query_token_list[0])
+
+            block_and_rank_list.append(
+                (block, (not is_first_token_matched, extra_token_number, order))
+            )
+
+        block_and_rank_list.sort(key=lambda block_and_rank: block_and_rank[1])
+
+        return [block for (block, _) in block_and_rank_list]
+
+    def __count_extra_token(self, block: str, query_token_list: list[str]) -> int:
+        """Number of words of block name not in matched query. (Stop words aren't)"""
+
+        def count_token(token_list: list[str]) -> int:
+            return len(
+                [token for token in token_list if token not in BLOCK_NAME_STOP_WORD_SET]
+            )
+
+        return count_token(self.block_token_list_dict[block]) - count_token(
+            query_token_list
+        )
+
+    def split_block_query(self, query: str) -> tuple[str | None, str]:
+        """Split leading block name from query.
+
+        Block name is the first word, and next words are taken only when they're
+        needed to make the match unique or exact. Other words are search query.
+
+        E.g., `"arrows right"` -> `("Arrows", "RIGHT")` (There is no `Arrows Right...`)
+        `"latin a"` -> `("Latin-1 Supplement", "A")` (Not `Latin Extended-A`)
+        `"latin extended-a"` -> `("Latin Extended-A", "")` (Every word of name)
+
+        Args:
+            query: Block name query followed by search query.
+
+        Returns:
+            (Best matched block, rest of query in upper case).
+            Block is `None` if the first word doesn't match any block.
+        """
+
+        word_list = query.upper().split()
+
+        block: str | None = None
+        block_word_number = 0
+        is_unique = False
+
+        for word_number in range(1, len(word_list) + 1):
+            block_query = " ".join(word_list[:word_number])
+
+            # Without any word, every block matches. (E.g., `-`)
+            if TOKEN_PATTERN.search(block_query) is None:
+                continue
+
+            block_list = self.find_block_list(block_query)
+
+            # More words of query match no more blocks.
+            if len(block_list) == 0:
+                break
+
+            is_exact = (
+                self.__count_extra_token(
+                    block_list[0], TOKEN_PATTERN.findall(block_query)
+                )
+                == 0
+            )
+
+            if (
+                (block is None)
+                or is_exact
+                or ((len(block_list) == 1) and (not is_unique))
+            ):
+                block = block_list[0]
+                block_word_number = word_number
+                is_unique = len(block_list) == 1
+
+        return (block, " ".join(word_list[block_word_number:]))
+
+
+# Built index of the last `unicode_character_list`. (Same as search index)
+_last_unicode_block_index: UnicodeBlockIndex | None = None
+
+
+def get_unicode_block_index(
+    unicode_character_list: list[UnicodeCharacter],
+) -> UnicodeBlockIndex:
+    """Get (or build at first time) block index of `unicode_character_list`"""
+
+    global _last_unicode_block_index
+
+    block_index = _last_unicode_block_index
+
+    if (
+        (block_index is None)
+        or (block_index.unicode_character_list is not unicode_character_list)
+        or (len(block_index) != len(unicode_character_list))
+    ):
+        block_index = UnicodeBlockIndex(unicode_character_list)
+        _last_unicode_block_index = block_index
+
+    return block_index
+
+
+def set_unicode_block_index(block_index: UnicodeBlockIndex):
+    """Use built `block_index` (e.g., loaded from snapshot) as the index of its list"""
+
+    global _last_unicode_block_index
+
+    _last_unicode_block_index = block_index
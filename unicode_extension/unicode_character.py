@@ -1,7 +1,20 @@
+import sys
+
+
+# Aliases of characters without aliases. Shared by them, so don't modify.
+EMPTY_ALIASES: list[str] = []
+
+
 class UnicodeCharacter:
     """
     UnicodeCharacter
 
+    Objects are made for characters in use (e.g., search result), not for all
+    characters. (See `UnicodeCharacterList`) Still many of them can be alive
+    (e.g., over-fetched results of `SearchRefinementCache`), so attributes are in
+    `__slots__`, block names are interned, and `u_code_point`, `character`
+    are made when they're read.
+
     Attributes:
         code_point (str): Code point with only number string.
             Example: `"0041"`
@@ -20,41 +33,67 @@ class UnicodeCharacter:
             Example: `"A"`
     """
 
+    # `__weakref__` for objects of `UnicodeCharacterList`, freed when not used.
+    __slots__ = (
+        "code_point",
+        "name",
+        "block",
+        "aliases",
+        "_string_data_for_search",
+        "__weakref__",
+    )
+
     code_point: str
-    u_code_point: str
     name: str
     block: str
     aliases: list[str]
-    character: str
 
     def __init__(self, code_point: str, name: str, block: str, aliases: list[str]):
 
-        if not (isinstance(code_point, str) and (code_point != "")):
-            raise ValueError(
-                f"UnicodeCharacter init - `code_point` value error. Should be `XXXX` (Hex number string). Current `code_point`: `{code_point}`"
-            )
-        if not (isinstance(name, str) and (name != "")):
-            raise ValueError(
-                f"UnicodeCharacter init - `name` value error. Current `name`: `{name}`"
-            )
-        if not (isinstance(block, str) and (block != "")):
-            raise ValueError(
-                f"UnicodeCharacter init - `block` value error. Current `block`: `{block}`"
-            )
-        if not isinstance(aliases, list):
-            raise ValueError(
-                f"UnicodeCharacter init - `aliases` value error. Current `aliases`: `{aliases}`"
-            )
+        validate_unicode_character_data(code_point, name, block, aliases)
 
         self.code_point = code_point
-        self.u_code_point = f"U+{code_point}"
         self.name = name
-        self.block = block
-        self.aliases = aliases
-        self.character = chr(int(code_point, base=16))
+        self.block = sys.intern(block)
+        self.aliases = aliases if len(aliases) > 0 else EMPTY_ALIASES
 
         self._string_data_for_search = self.__convert_for_search()
 
+    @classmethod
+    def create_trusted(
+        cls,
+        code_point: str,
+        name: str,
+        block: str,
+        aliases: list[str],
+        string_data_for_search: str,
+    ) -> "UnicodeCharacter":
+        """Create without validation, for data already validated.
+
+        (e.g., `unicode_data.bin` of valid checksum. See `UnicodeCharacterStore`)
+
+        Args:
+            string_data_for_search: Result of `convert_for_search` of the data.
+        """
+
+        unicode_character = cls.__new__(cls)
+
+        unicode_character.code_point = code_point
+        unicode_character.name = name
+        unicode_character.block = block
+        unicode_character.aliases = aliases
+        unicode_character._string_data_for_search = string_data_for_search
+
+        return unicode_character
+
+    @property
+    def u_code_point(self) -> str:
+        return f"U+{self.code_point}"
+
+    @property
+    def character(self) -> str:
+        return chr(int(self.code_point, base=16))
+
     def __str__(self):
         return f"{self.u_code_point} - '{self.name}' ({self.block})"
 
@@ -63,28 +102,63 @@ class UnicodeCharacter:
 
     # Preprocess for `search_unicode_character`
     def __convert_for_search(self):
-        string_list: list[str] = []
+        return convert_for_search(self.u_code_point, self.name, self.aliases)
+
+
+def validate_unicode_character_data(
+    code_point: str, name: str, block: str, aliases: list[str]
+):
+    """Validate data of `UnicodeCharacter`. Raises `ValueError` if it's wrong."""
+
+    if not (isinstance(code_point, str) and (code_point != "")):
+        raise ValueError(
+            f"UnicodeCharacter init - `code_point` value error. Should be `XXXX` (Hex number string). Current `code_point`: `{code_point}`"
+        )
+    if not (isinstance(name, str) and (name != "")):
+        raise ValueError(
+            f"UnicodeCharacter init - `name` value error. Current `name`: `{name}`"
+        )
+    if not (isinstance(block, str) and (block != "")):
+        raise ValueError(
+            f"UnicodeCharacter init - `block` value error. Current `block`: `{block}`"
+        )
+    if not isinstance(aliases, list):
+        raise ValueError(
+            f"UnicodeCharacter init - `aliases` value error. Current `aliases`: `{aliases}`"
+        )
+
+
+def convert_for_search(u_code_point: str, name: str, aliases: list[str]) -> str:
+    """Preprocess character data for `search_unicode_character`
+
+    Same as `UnicodeCharacter._string_data_for_search`, without the object.
+
+    Returns:
+        Example: `"U+000A LINE FEED (LF) END OF LINE EOL LF LINE FEED NEW LINE NL"`
+    """
+
+    string_list: list[str] = []
 
-        string_list.append(self.u_code_point)
+    string_list.append(u_code_point)
 
-        string_list.append(self.name)
+    string_list.append(name)
 
-        if len(self.aliases) > 0:
-            string_list.extend(self.aliases)
+    if len(aliases) > 0:
+        string_list.extend(aliases)
 
-        # When block information is added, the quality of search results significantly decreases.
-        #
-        # string_list.append(self.block)
+    # When block information is added, the quality of search results significantly decreases.
+    #
+    # string_list.append(self.block)
 
-        def remove_duplicate_in_list(original_list: list) -> list:
-            new_list: list = []
+    def remove_duplicate_in_list(original_list: list) -> list:
+        new_list: list = []
 
-            for item in original_list:
-                if item not in new_list:
-                    new_list.append(item)
+        for item in original_list:
+            if item not in new_list:
+                new_list.append(item)
 
-            return new_list
+        return new_list
 
-        result = " ".join(remove_duplicate_in_list(string_list)).upper()
+    result = " ".join(remove_duplicate_in_list(string_list)).upper()
 
-        return result
+    return result
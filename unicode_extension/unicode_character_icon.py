@@ -1,13 +1,42 @@
+import hashlib
+import json
+import logging
 import os
 import shutil
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 
 from .unicode_character import UnicodeCharacter
-from .util import get_project_path
+from .util import get_cache_dir_path, get_project_path
 
+logger = logging.getLogger(__name__)
 
 PROJECT_PATH = get_project_path()
-UNICODE_CHARACTER_ICON_DIR = ".unicode_character_icon"
-UNICODE_CHARACTER_ICON_DIR_PATH = f"{PROJECT_PATH}/{UNICODE_CHARACTER_ICON_DIR}"
+
+# Icons are kept between restarts, in a directory of each (font, background).
+# Icons are sharded by the last 2 hex digits of code point, to keep directories small.
+# E.g., `~/.cache/ulauncher-unicode-extension/unicode_character_icon/{namespace}/14/u_2014.svg`
+UNICODE_CHARACTER_ICON_CACHE_DIR_PATH = f"{get_cache_dir_path()}/unicode_character_icon"
+
+# Change it when content of icon file is changed. (Icons of old version are not used)
+UNICODE_CHARACTER_ICON_VERSION = 1
+
+# Directory of (font, background) not used for this time is removed.
+UNICODE_CHARACTER_ICON_NAMESPACE_MAX_AGE = 30 * 24 * 60 * 60
+
+# Icon directory of old versions, removed at every start.
+LEGACY_UNICODE_CHARACTER_ICON_DIR_PATH = f"{PROJECT_PATH}/.unicode_character_icon"
+
+# Icons made at build time (`generate_data/save_unicode_character_icon_pack.py`).
+# Same layout as cache directory, and found by `icon_pack.json` of it.
+UNICODE_CHARACTER_ICON_PACK_INDEX_FILENAME = "icon_pack.json"
+
+ICON_FILE_PREFIX = "u_"
+ICON_FILE_EXTENSION = ".svg"
+# Icon being written. Renamed to icon file when it's written. (Never half-written)
+ICON_TEMP_FILE_EXTENSION = ".tmp"
 
 # Associated code with generate Unicode Character Icon is come from
 # [GitHub - zensoup/ulauncher-unicode](https://github.com/zensoup/ulauncher-unicode) (GPL-3.0 license)
@@ -30,10 +59,52 @@ ICON_WITH_WHITE_BACKGROUND_TEMPLATE = """
 """
 
 
+def get_unicode_character_icon_namespace(background: None | str, font: str) -> str:
+    """Name of icon directory of (font, background)
+
+    Returns:
+        E.g., `"3f2a9c0e1b7d4a65"`
+    """
+
+    key = f"{UNICODE_CHARACTER_ICON_VERSION}\0{background}\0{font}"
+
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+
+
+def get_unicode_character_icon_dir_path(
+    background: None | str = None,
+    font: str = "sans-serif",
+    icon_cache_dir_path: str = UNICODE_CHARACTER_ICON_CACHE_DIR_PATH,
+) -> str:
+    namespace = get_unicode_character_icon_namespace(background, font)
+
+    return f"{icon_cache_dir_path}/{namespace}"
+
+
+def get_unicode_character_icon_file_path(
+    unicode_character: UnicodeCharacter,
+    background: None | str = None,
+    font: str = "sans-serif",
+    icon_cache_dir_path: str = UNICODE_CHARACTER_ICON_CACHE_DIR_PATH,
+) -> str:
+    """
+    Returns:
+        E.g., `"{icon_cache_dir_path}/{namespace}/14/u_2014.svg"`
+    """
+
+    icon_dir_path = get_unicode_character_icon_dir_path(
+        background, font, icon_cache_dir_path
+    )
+    code_point = unicode_character.code_point.lower()
+
+    return f"{icon_dir_path}/{code_point[-2:]}/{ICON_FILE_PREFIX}{code_point}{ICON_FILE_EXTENSION}"
+
+
 def generate_unicode_character_icon(
     unicode_character: UnicodeCharacter,
     background: None | str = None,
     font: str = "sans-serif",
+    icon_cache_dir_path: str = UNICODE_CHARACTER_ICON_CACHE_DIR_PATH,
 ):
     """Get Unicode Character Icon
 
@@ -42,22 +113,44 @@ def generate_unicode_character_icon(
 
     This problem might be resolved if Ulauncher produce an API that allows icons to be
     loaded without actual image files (such as generated image data).
+
+    Icon file is made once, and kept between restarts.
+    (See `remove_old_unicode_character_icon_dir`)
+    Number and size of files are limited by `UnicodeCharacterIconCache`.
     """
 
-    character_icon_file_path = f"{UNICODE_CHARACTER_ICON_DIR_PATH}/u_{unicode_character.code_point.lower()}.svg"
-
-    # 1. Font preference(`unicode_character_icon_font`) changes are not affected
-    #    properly until Ulauncher is restarted.
-    # 2. When Ulauncher is restarted, in other words, when this extension is restarted,
-    #    all existed icon file wll be removed. (`reset_unicode_character_icon_dir`)
-    #
-    # So it makes sense not to create a new file every time.
-    #
-    # If font preference changes are affected immediately, it should be create file in
-    # every time, but it isn't. (maybe the reason is GTK pixbuf loader cache)
+    character_icon_file_path = get_unicode_character_icon_file_path(
+        unicode_character, background, font, icon_cache_dir_path
+    )
+
+    # Icons of other font (or background) are in other directory, so file of a path
+    # is never changed. (GTK pixbuf loader caches image of path, and Ulauncher shows
+    # old icon of changed file until it's restarted)
     if os.path.isfile(character_icon_file_path):
         return character_icon_file_path
 
+    create_unicode_character_icon_file(
+        character_icon_file_path, unicode_character, background, font
+    )
+
+    return character_icon_file_path
+
+
+def create_unicode_character_icon_file(
+    icon_file_path: str,
+    unicode_character: UnicodeCharacter,
+    background: None | str = None,
+    font: str = "sans-serif",
+) -> int:
+    """Create icon file of character. (Overwritten if it exists)
+
+    File is written to a temp file, and renamed to `icon_file_path`.
+    So `icon_file_path` is never a half-written file.
+
+    Returns:
+        Size of file. (bytes)
+    """
+
     icon_content = None
 
     if background is None:
@@ -74,18 +167,451 @@ def generate_unicode_character_icon(
             f"Unknown background value. current background value: `{background}`"
         )
 
-    def create_icon_file(icon_file_path: str, content: str):
-        icon_file = open(icon_file_path, "w")
-        icon_file.write(content)
-        icon_file.close()
+    icon_data = icon_content.encode("utf-8")
+
+    def create_icon_file(icon_file_path: str, data: bytes):
+        temp_file_path = f"{icon_file_path}.{os.getpid()}.{threading.get_ident()}{ICON_TEMP_FILE_EXTENSION}"
+
+        try:
+            with open(temp_file_path, "wb") as icon_file:
+                icon_file.write(data)
+
+            os.replace(temp_file_path, icon_file_path)
+        except OSError:
+            remove_file_list([temp_file_path])
+            raise
 
     try:
-        create_icon_file(character_icon_file_path, icon_content)
+        create_icon_file(icon_file_path, icon_data)
     except FileNotFoundError:
-        prepare_unicode_character_icon_dir()
-        create_icon_file(character_icon_file_path, icon_content)
+        prepare_unicode_character_icon_dir(os.path.dirname(icon_file_path))
+        create_icon_file(icon_file_path, icon_data)
 
-    return character_icon_file_path
+    return len(icon_data)
+
+
+def load_unicode_character_icon_pack(icon_pack_dir_path: str) -> set[str]:
+    """Icon file paths of icon pack. (Empty if there's no icon pack)
+
+    Icons of other `UNICODE_CHARACTER_ICON_VERSION` are not used.
+
+    Returns:
+        E.g., `{"{icon_pack_dir_path}/{namespace}/14/u_2014.svg", ...}`
+    """
+
+    index_file_path = (
+        f"{icon_pack_dir_path}/{UNICODE_CHARACTER_ICON_PACK_INDEX_FILENAME}"
+    )
+
+    try:
+        with open(index_file_path) as index_file:
+            icon_pack_index: dict = json.load(index_file)
+    except FileNotFoundError:
+        return set()
+    except (OSError, ValueError) as error:
+        logger.warning(f"Can't load icon pack `{index_file_path}`. {error}")
+        return set()
+
+    if icon_pack_index.get("version") != UNICODE_CHARACTER_ICON_VERSION:
+        logger.info(
+            f"Icon pack of version {icon_pack_index.get('version')} is not used. (Current version: {UNICODE_CHARACTER_ICON_VERSION})"
+        )
+        return set()
+
+    icon_file_path_set: set[str] = set()
+
+    for namespace, namespace_data in icon_pack_index["namespaces"].items():
+        for code_point in namespace_data["code_points"]:
+            code_point = code_point.lower()
+
+            icon_file_path_set.add(
+                f"{icon_pack_dir_path}/{namespace}/{code_point[-2:]}/{ICON_FILE_PREFIX}{code_point}{ICON_FILE_EXTENSION}"
+            )
+
+    return icon_file_path_set
+
+
+class UnicodeCharacterIconCache:
+    """
+    Icon files of cache directory, limited by number of files and bytes.
+    Least recently used icon file is removed first.
+
+    Icon files and use of them are tracked in memory. Files made before
+    (e.g., before restart) are found by one scan at the first use, in order of
+    their access time. After that, icons are found without file system calls.
+    (Files should be made and removed only by this)
+
+    Icons of icon pack (`icon_pack_dir_path`) are used as they are, and no file is
+    made for them. They are not counted by the limits, and never removed.
+
+    Can be used by several threads. (See `UnicodeCharacterIconPrefetcher`)
+    Files are written without holding the lock.
+
+    Attributes:
+        icon_cache_dir_path (str): Directory of icons of every (font, background).
+        icon_pack_dir_path (str | None): Directory of icon pack. (`None` for no pack)
+        max_file_number (int): Max number of icon files.
+        max_byte_size (int): Max total size (bytes) of icon files.
+        removed_count (int): Number of icon files removed by the limits.
+    """
+
+    DEFAULT_MAX_FILE_NUMBER: int = 5000
+    DEFAULT_MAX_BYTE_SIZE: int = 8 * 1024 * 1024
+
+    icon_cache_dir_path: str
+    icon_pack_dir_path: str | None
+    max_file_number: int
+    max_byte_size: int
+    removed_count: int
+
+    def __init__(
+        self,
+        icon_cache_dir_path: str = UNICODE_CHARACTER_ICON_CACHE_DIR_PATH,
+        max_file_number: int = DEFAULT_MAX_FILE_NUMBER,
+        max_byte_size: int = DEFAULT_MAX_BYTE_SIZE,
+        icon_pack_dir_path: str | None = None,
+    ):
+        self.icon_cache_dir_path = icon_cache_dir_path
+        self.icon_pack_dir_path = icon_pack_dir_path
+        self.max_file_number = max_file_number
+        self.max_byte_size = max_byte_size
+        self.removed_count = 0
+
+        # Icon file path -> size. Least recently used first. (`None` before scan)
+        self._file_size_dict: OrderedDict[str, int] | None = None
+        self._byte_size = 0
+        # Icon file paths of icon pack. (Loaded by scan)
+        self._icon_pack_file_path_set: set[str] = set()
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        with self._lock:
+            return len(self.__get_file_size_dict())
+
+    def __str__(self):
+        return f"UnicodeCharacterIconCache(files: {len(self)}/{self.max_file_number}, bytes: {self.get_byte_size()}/{self.max_byte_size}, removed: {self.removed_count})"
+
+    def get_byte_size(self) -> int:
+        with self._lock:
+            self.__get_file_size_dict()
+
+            return self._byte_size
+
+    def scan(self):
+        """Find icon files made before, and icons of icon pack.
+        (Done at the first use, if not done)
+
+        Icon directories not used for long time are removed before it.
+        (See `remove_old_unicode_character_icon_dir`)
+        """
+
+        with self._lock:
+            self.__get_file_size_dict()
+
+    def set_limit(self, max_file_number: int, max_byte_size: int):
+        with self._lock:
+            self.max_file_number = max_file_number
+            self.max_byte_size = max_byte_size
+
+            removed_file_path_list = self.__remove_least_recently_used()
+
+        remove_file_list(removed_file_path_list)
+
+    def find_icon(
+        self,
+        unicode_character: UnicodeCharacter,
+        background: None | str = None,
+        font: str = "sans-serif",
+    ) -> str | None:
+        """Path of icon file, if it's made or in icon pack.
+        (Not made here, no file system call)"""
+
+        icon_file_path = get_unicode_character_icon_file_path(
+            unicode_character, background, font, self.icon_cache_dir_path
+        )
+
+        with self._lock:
+            file_size_dict = self.__get_file_size_dict()
+
+            if self.icon_pack_dir_path is not None:
+                icon_pack_file_path = get_unicode_character_icon_file_path(
+                    unicode_character, background, font, self.icon_pack_dir_path
+                )
+
+                if icon_pack_file_path in self._icon_pack_file_path_set:
+                    return icon_pack_file_path
+
+            if icon_file_path not in file_size_dict:
+                return None
+
+            file_size_dict.move_to_end(icon_file_path)
+
+        return icon_file_path
+
+    def get_icon(
+        self,
+        unicode_character: UnicodeCharacter,
+        background: None | str = None,
+        font: str = "sans-serif",
+    ) -> str:
+        """Path of icon file. It's made if it doesn't exist. (Or not in icon pack)
+
+        Same as `generate_unicode_character_icon`, but files are limited.
+        """
+
+        icon_file_path = self.find_icon(unicode_character, background, font)
+
+        if icon_file_path is not None:
+            return icon_file_path
+
+        icon_file_path = get_unicode_character_icon_file_path(
+            unicode_character, background, font, self.icon_cache_dir_path
+        )
+
+        file_size = create_unicode_character_icon_file(
+            icon_file_path, unicode_character, background, font
+        )
+
+        with self._lock:
+            file_size_dict = self.__get_file_size_dict()
+
+            self._byte_size += file_size - file_size_dict.pop(icon_file_path, 0)
+            file_size_dict[icon_file_path] = file_size
+
+            removed_file_path_list = self.__remove_least_recently_used()
+
+        remove_file_list(removed_file_path_list)
+
+        return icon_file_path
+
+    def __get_file_size_dict(self) -> OrderedDict[str, int]:
+        if self._file_size_dict is None:
+            remove_old_unicode_character_icon_dir(self.icon_cache_dir_path)
+
+            if self.icon_pack_dir_path is not None:
+                self._icon_pack_file_path_set = load_unicode_character_icon_pack(
+                    self.icon_pack_dir_path
+                )
+
+            self._file_size_dict = self.__scan_file_size_dict()
+            self._byte_size = sum(self._file_size_dict.values())
+
+            remove_file_list(self.__remove_least_recently_used())
+
+        return self._file_size_dict
+
+    def __scan_file_size_dict(self) -> OrderedDict[str, int]:
+        """Icon files in cache directory, in order of access time"""
+
+        file_list: list[tuple[float, str, int]] = []
+
+        for dir_path, _, file_name_list in os.walk(self.icon_cache_dir_path):
+            for file_name in file_name_list:
+                # Left by a stopped write.
+                if file_name.endswith(ICON_TEMP_FILE_EXTENSION):
+                    remove_file_list([f"{dir_path}/{file_name}"])
+                    continue
+
+                if not (
+                    file_name.startswith(ICON_FILE_PREFIX)
+                    and file_name.endswith(ICON_FILE_EXTENSION)
+                ):
+                    continue
+
+                file_path = f"{dir_path}/{file_name}"
+
+                try:
+                    stat = os.stat(file_path)
+                except OSError:
+                    continue
+
+                file_list.append(
+                    (max(stat.st_atime, stat.st_mtime), file_path, stat.st_size)
+                )
+
+        file_list.sort()
+
+        return OrderedDict(
+            (file_path, file_size) for _, file_path, file_size in file_list
+        )
+
+    def __remove_least_recently_used(self) -> list[str]:
+        """Remove least recently used icons over the limits from tracking.
+
+        Returns:
+            Paths of removed icons. Files should be removed. (See `remove_file_list`)
+        """
+
+        file_size_dict = self._file_size_dict
+        removed_file_path_list: list[str] = []
+
+        if file_size_dict is None:
+            return removed_file_path_list
+
+        # Most recently used one is kept, even if it's bigger than the limit.
+        while (len(file_size_dict) > 1) and (
+            (len(file_size_dict) > self.max_file_number)
+            or (self._byte_size > self.max_byte_size)
+        ):
+            file_path, file_size = file_size_dict.popitem(last=False)
+            self._byte_size -= file_size
+            self.removed_count += 1
+
+            removed_file_path_list.append(file_path)
+
+        return removed_file_path_list
+
+
+def remove_file_list(file_path_list: list[str]):
+    for file_path in file_path_list:
+        try:
+            os.remove(file_path)
+        except OSError:
+            pass
+
+
+class UnicodeCharacterIconPrefetcher:
+    """
+    Makes icon files on worker threads, not to wait for files to show result.
+
+    Icon being made is requested once. Showing result doesn't wait for it,
+    and shows placeholder icon instead.
+
+    Attributes:
+        icon_cache (UnicodeCharacterIconCache): Cache icons are made in.
+        wait_timeout (float): Max time (sec) to wait for icons newly requested
+            by `get_icon_list`.
+        request_count (int): Number of icons requested to workers.
+    """
+
+    DEFAULT_WORKER_NUMBER: int = 2
+    DEFAULT_WAIT_TIMEOUT: float = 0.05
+
+    icon_cache: UnicodeCharacterIconCache
+    wait_timeout: float
+    request_count: int
+
+    def __init__(
+        self,
+        icon_cache: UnicodeCharacterIconCache,
+        worker_number: int = DEFAULT_WORKER_NUMBER,
+        wait_timeout: float = DEFAULT_WAIT_TIMEOUT,
+    ):
+        self.icon_cache = icon_cache
+        self.wait_timeout = wait_timeout
+        self.request_count = 0
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=worker_number, thread_name_prefix="UnicodeCharacterIcon"
+        )
+        # Icon file path -> making icon. (Removed when it's made)
+        self._pending_future_dict: dict[str, Future[str]] = {}
+        self._lock = threading.Lock()
+
+        # Files made before are found before the first result.
+        self._executor.submit(self.icon_cache.scan)
+
+    def request_icon(
+        self,
+        unicode_character: UnicodeCharacter,
+        background: None | str = None,
+        font: str = "sans-serif",
+    ) -> tuple[Future[str], bool]:
+        """Make icon file on worker, if it's not requested yet.
+
+        Returns:
+            (Future of icon file path, `True` if it's newly requested)
+        """
+
+        icon_file_path = get_unicode_character_icon_file_path(
+            unicode_character, background, font, self.icon_cache.icon_cache_dir_path
+        )
+
+        with self._lock:
+            future = self._pending_future_dict.get(icon_file_path)
+
+            if future is not None:
+                return (future, False)
+
+            future = self._executor.submit(
+                self.icon_cache.get_icon, unicode_character, background, font
+            )
+
+            self._pending_future_dict[icon_file_path] = future
+            self.request_count += 1
+
+        def remove_pending_future(_: Future[str]):
+            with self._lock:
+                self._pending_future_dict.pop(icon_file_path, None)
+
+        future.add_done_callback(remove_pending_future)
+
+        return (future, True)
+
+    def get_icon_list(
+        self,
+        unicode_character_list: list[UnicodeCharacter],
+        background: None | str = None,
+        font: str = "sans-serif",
+        placeholder: str = "",
+    ) -> list[str]:
+        """Icon file paths of characters. (Shown now)
+
+        Icons not made are requested, and waited for up to `wait_timeout`.
+        Icons already requested before (e.g., by `prefetch`) are not waited for.
+
+        Returns:
+            Icon file path, or `placeholder` if it's not made yet, of each character.
+        """
+
+        icon_list: list[str | Future[str]] = []
+        new_future_list: list[Future[str]] = []
+
+        for unicode_character in unicode_character_list:
+            icon_file_path = self.icon_cache.find_icon(
+                unicode_character, background, font
+            )
+
+            if icon_file_path is not None:
+                icon_list.append(icon_file_path)
+                continue
+
+            future, is_new = self.request_icon(unicode_character, background, font)
+
+            icon_list.append(future)
+
+            if is_new:
+                new_future_list.append(future)
+
+        if (len(new_future_list) > 0) and (self.wait_timeout > 0):
+            wait(new_future_list, timeout=self.wait_timeout)
+
+        return [
+            icon if isinstance(icon, str) else get_future_icon(icon, placeholder)
+            for icon in icon_list
+        ]
+
+    def prefetch(
+        self,
+        unicode_character_list: list[UnicodeCharacter],
+        background: None | str = None,
+        font: str = "sans-serif",
+    ):
+        """Make icons on worker, not waiting. (e.g., likely shown by next query)"""
+
+        for unicode_character in unicode_character_list:
+            if self.icon_cache.find_icon(unicode_character, background, font) is None:
+                self.request_icon(unicode_character, background, font)
+
+
+def get_future_icon(future: Future[str], placeholder: str) -> str:
+    if not future.done():
+        return placeholder
+
+    try:
+        return future.result()
+    except (OSError, ValueError):
+        return placeholder
 
 
 # This(`generate_unicode_character_icon_without_file`) is not work.
@@ -128,12 +654,67 @@ def generate_unicode_character_icon(
 #     return data
 
 
-def prepare_unicode_character_icon_dir():
-    if not os.path.isdir(UNICODE_CHARACTER_ICON_DIR_PATH):
-        os.mkdir(UNICODE_CHARACTER_ICON_DIR_PATH)
+def prepare_unicode_character_icon_dir(icon_dir_path: str):
+    os.makedirs(icon_dir_path, exist_ok=True)
+
+
+def touch_unicode_character_icon_dir(
+    background: None | str = None,
+    font: str = "sans-serif",
+    icon_cache_dir_path: str = UNICODE_CHARACTER_ICON_CACHE_DIR_PATH,
+):
+    """Mark icon directory of (font, background) as used now. (Not to be removed)"""
+
+    icon_dir_path = get_unicode_character_icon_dir_path(
+        background, font, icon_cache_dir_path
+    )
+
+    try:
+        prepare_unicode_character_icon_dir(icon_dir_path)
+        os.utime(icon_dir_path)
+    except OSError as error:
+        logger.warning(f"Can't prepare icon directory `{icon_dir_path}`. {error}")
+
+
+def remove_old_unicode_character_icon_dir(
+    icon_cache_dir_path: str = UNICODE_CHARACTER_ICON_CACHE_DIR_PATH,
+    max_age: float = UNICODE_CHARACTER_ICON_NAMESPACE_MAX_AGE,
+) -> list[str]:
+    """Remove icon directories of (font, background) not used for `max_age` sec.
+
+    Directory of icon in use is modified by `touch_unicode_character_icon_dir`.
+    Icon directory of old versions
+    (`.unicode_character_icon` of project) is removed too.
+
+    Returns:
+        Removed directory paths.
+    """
+
+    removed_dir_path_list: list[str] = []
+
+    if os.path.isdir(LEGACY_UNICODE_CHARACTER_ICON_DIR_PATH):
+        shutil.rmtree(LEGACY_UNICODE_CHARACTER_ICON_DIR_PATH, ignore_errors=True)
+        removed_dir_path_list.append(LEGACY_UNICODE_CHARACTER_ICON_DIR_PATH)
+
+    if not os.path.isdir(icon_cache_dir_path):
+        return removed_dir_path_list
+
+    now = time.time()
+
+    for dir_entry in os.scandir(icon_cache_dir_path):
+        if not dir_entry.is_dir(follow_symlinks=False):
+            continue
+
+        try:
+            if now - dir_entry.stat().st_mtime <= max_age:
+                continue
+        except OSError:
+            continue
+
+        shutil.rmtree(dir_entry.path, ignore_errors=True)
+        removed_dir_path_list.append(dir_entry.path)
 
+    if len(removed_dir_path_list) > 0:
+        logger.info(f"Old icon directories removed. {removed_dir_path_list}")
 
-def reset_unicode_character_icon_dir():
-    if os.path.isdir(UNICODE_CHARACTER_ICON_DIR_PATH):
-        shutil.rmtree(UNICODE_CHARACTER_ICON_DIR_PATH)
-    prepare_unicode_character_icon_dir()
+    return removed_dir_path_list
@@ -0,0 +1,512 @@
+import bisect
+import itertools
+import re
+from array import array
+from collections.abc import Iterator, Sequence
+
+from .unicode_character import UnicodeCharacter
+from .unicode_character_store import (
+    get_code_point_array,
+    get_name_range_list,
+    get_name_word_data,
+    get_string_data_for_search_list,
+)
+from .unicode_name_lexicon import ALIAS_SEPARATOR_WORD_ID, UnicodeNameLexicon
+from .unicode_name_range import UnicodeNameRange
+
+# Token is a run of letters or digits.
+# E.g., `"U+000A LINE FEED (LF)"` -> `["000A", "LINE", "FEED", "LF"]`
+TOKEN_PATTERN = re.compile(r"[0-9A-Z]+")
+
+# `U+` of code point (e.g., `U+2014`) is not a token. Only the number part is.
+CODE_POINT_PREFIX_PATTERN = re.compile(r"(?<![0-9A-Z])U\+")
+
+# Words of name are separated by space or hyphen. (`CJK UNIFIED IDEOGRAPH-4E00`)
+# Some aliases have parentheses. (`LINE FEED (LF)`)
+NAME_WORD_SEPARATOR_TABLE = str.maketrans({"-": " ", "(": None, ")": None})
+
+
+def tokenize_for_search(string: str) -> list[str]:
+    """Split string to search tokens.
+
+    Args:
+        string: E.g., `"u+00b7 middle dot"`
+
+    Returns:
+        Upper case tokens without duplicate, in order of appearance.
+
+        E.g., `["00B7", "MIDDLE", "DOT"]`
+    """
+
+    string = CODE_POINT_PREFIX_PATTERN.sub(" ", string.upper())
+
+    return list(dict.fromkeys(TOKEN_PATTERN.findall(string)))
+
+
+def generate_acronym(name: str) -> str:
+    """Generate acronym (initials of words) of name.
+
+    Args:
+        name: Upper case name. E.g., `"BOX DRAWINGS LIGHT HORIZONTAL"`
+
+    Returns:
+        E.g., `"BDLH"`
+    """
+
+    return "".join(
+        [word[0] for word in name.translate(NAME_WORD_SEPARATOR_TABLE).split()]
+    )
+
+
+class UnicodeCharacterSearchIndex:
+    """
+    Inverted index of search tokens for `search_unicode_character`.
+
+    Maps token of code point, name, aliases to positions in `unicode_character_list`,
+    so searching can score only the characters that share a token
+    (or a token prefix) with the query instead of the whole list.
+
+    Tokens are sorted, and a token is its index (token id) in `token_list`.
+    Positions of every token are in one array, so tokens starting with a prefix
+    are a range of token ids, and their positions are one slice of the array.
+
+    Also has sorted names (and aliases) for exact and prefix match of whole name,
+    and sorted acronyms of them for abbreviation. (`bdlh` -> `BOX DRAWINGS LIGHT...`)
+    They're kept as word ids of names (See `UnicodeNameLexicon`), not strings.
+
+    Characters whose names are made by a rule (`CJK UNIFIED IDEOGRAPH-4E00`) are
+    not indexed. They're found by `name_range_list`.
+
+    Attributes:
+        unicode_character_list (list[UnicodeCharacter]): Indexed list.
+        string_data_for_search_list (Sequence[str | None]): `_string_data_for_search`
+            of each character. Choices of fuzzy search, without `UnicodeCharacter`.
+            (`None` for characters of `name_range_list`, skipped by RapidFuzz)
+        character_set (frozenset[str]): Characters of strings for search.
+            Query having none of them scores 0 with every character. (`😀`, `..`)
+        name_range_list (list[UnicodeNameRange]): Ranges of characters whose
+            names are made by a rule.
+        lexicon (UnicodeNameLexicon): Words of names and aliases.
+        name_word_id_array (array): Word ids of names and aliases.
+            (See `UnicodeCharacterStore.name_word_id_array`)
+        name_word_offset_array (array): Offset of each character in
+            `name_word_id_array`.
+        token_list (list[str]): Sorted tokens. Index is token id.
+        token_position_offset_array (array): Offset of positions of each token
+            in `token_position_array`, and the end.
+        token_position_array (array): Positions of every token, in order of token.
+            Example: Positions of `"DOT"` are `array("I", [183, ...])`
+        sorted_name_start_array (array): Start of sorted names and aliases in
+            `name_word_id_array`.
+        sorted_name_position_array (array): Position of each sorted name.
+        sorted_name_length_array (array): Length of each sorted name.
+        sorted_acronym_start_array (array): Same as `sorted_name_start_array`,
+            in order of acronym. Example: `"LCLA"` of `LATIN CAPITAL LETTER A`
+        sorted_acronym_position_array (array): Position of each sorted acronym.
+        sorted_acronym_length_array (array): Length of each sorted acronym.
+    """
+
+    unicode_character_list: list[UnicodeCharacter]
+    string_data_for_search_list: Sequence[str | None]
+    character_set: frozenset[str]
+    name_range_list: list[UnicodeNameRange]
+    lexicon: UnicodeNameLexicon
+    name_word_id_array: array
+    name_word_offset_array: array
+    token_list: list[str]
+    token_position_offset_array: array
+    token_position_array: array
+    sorted_name_start_array: array
+    sorted_name_position_array: array
+    sorted_name_length_array: array
+    sorted_acronym_start_array: array
+    sorted_acronym_position_array: array
+    sorted_acronym_length_array: array
+
+    def __init__(self, unicode_character_list: list[UnicodeCharacter]):
+        self.unicode_character_list = unicode_character_list
+        self.string_data_for_search_list = get_string_data_for_search_list(
+            unicode_character_list
+        )
+        self.name_range_list = get_name_range_list(unicode_character_list)
+        (
+            self.lexicon,
+            self.name_word_id_array,
+            self.name_word_offset_array,
+        ) = get_name_word_data(unicode_character_list)
+
+        code_point_array = get_code_point_array(unicode_character_list)
+        word_list = self.lexicon.word_list
+
+        # `U+` and hex digits of code points, and words of names and aliases.
+        # (Names of name ranges are made of them too)
+        self.character_set = frozenset("U+ 0123456789ABCDEF").union(*word_list)
+        name_word_id_list = self.name_word_id_array.tolist()
+        name_word_offset_list = self.name_word_offset_array.tolist()
+
+        # Characters of name range have no word.
+        indexed_position_list = [
+            position
+            for position in range(len(unicode_character_list))
+            if name_word_offset_list[position] < name_word_offset_list[position + 1]
+        ]
+
+        # Tokens of words, then of characters. (Same as tokens of strings for search)
+        word_token_list_list = [tokenize_for_search(word) for word in word_list]
+
+        self.token_list = sorted(
+            set(
+                f"{code_point_array[position]:04X}"
+                for position in indexed_position_list
+            ).union(*word_token_list_list)
+        )
+        token_id_dict = {token: i for i, token in enumerate(self.token_list)}
+
+        word_token_id_list_list = [
+            [token_id_dict[token] for token in word_token_list]
+            for word_token_list in word_token_list_list
+        ]
+        token_position_list_list: list[list[int]] = [[] for _ in self.token_list]
+
+        for position in indexed_position_list:
+            token_id_set = {token_id_dict[f"{code_point_array[position]:04X}"]}
+
+            for word_id in name_word_id_list[
+                name_word_offset_list[position] : name_word_offset_list[position + 1]
+            ]:
+                if word_id != ALIAS_SEPARATOR_WORD_ID:
+                    token_id_set.update(word_token_id_list_list[word_id])
+
+            for token_id in token_id_set:
+                token_position_list_list[token_id].append(position)
+
+        self.token_position_offset_array = array(
+            "I",
+            itertools.accumulate(map(len, token_position_list_list), initial=0),
+        )
+        self.token_position_array = array(
+            "I", itertools.chain.from_iterable(token_position_list_list)
+        )
+
+        # Names and aliases: (name, position, start of name in word ids)
+        # Strings are made only while building. Index keeps `start`.
+        name_and_position_list: list[tuple[str, int, int]] = []
+
+        for position in indexed_position_list:
+            end = name_word_offset_list[position + 1]
+            start = name_word_offset_list[position]
+            name_of_character = None
+
+            for i in range(start, end + 1):
+                if (i < end) and (name_word_id_list[i] != ALIAS_SEPARATOR_WORD_ID):
+                    continue
+
+                name = self.lexicon.decode_name(name_word_id_list[start:i])
+
+                # Alias same as name is skipped.
+                if name_of_character is None:
+                    name_of_character = name
+                    name_and_position_list.append((name, position, start))
+                elif name != name_of_character:
+                    name_and_position_list.append((name, position, start))
+
+                start = i + 1
+
+        name_and_position_list.sort()
+
+        self.sorted_name_start_array = array(
+            "I", [start for (_, _, start) in name_and_position_list]
+        )
+        self.sorted_name_position_array = array(
+            "I", [position for (_, position, _) in name_and_position_list]
+        )
+        self.sorted_name_length_array = array(
+            "H", [len(name) for (name, _, _) in name_and_position_list]
+        )
+
+        acronym_and_position_list = sorted(
+            (generate_acronym(name), position, start)
+            for (name, position, start) in name_and_position_list
+        )
+
+        # Same acronym of the same character is once.
+        acronym_and_position_list = list(
+            {
+                (acronym, position): (acronym, position, start)
+                for (acronym, position, start) in acronym_and_position_list
+            }.values()
+        )
+
+        self.sorted_acronym_start_array = array(
+            "I", [start for (_, _, start) in acronym_and_position_list]
+        )
+        self.sorted_acronym_position_array = array(
+            "I", [position for (_, position, _) in acronym_and_position_list]
+        )
+        self.sorted_acronym_length_array = array(
+            "H", [len(acronym) for (acronym, _, _) in acronym_and_position_list]
+        )
+
+    def __len__(self):
+        return len(self.unicode_character_list)
+
+    def get_name_of_start(self, start: int, position: int) -> str:
+        """Name (or alias) starting at `start` of `name_word_id_array`
+
+        Args:
+            start: E.g., item of `sorted_name_start_array`
+            position: Position of character having the name.
+        """
+
+        return self.lexicon.decode_name(
+            self.name_word_id_array[start : self.name_word_offset_array[position + 1]]
+        )
+
+    def get_sorted_name(self, i: int) -> str:
+        return self.get_name_of_start(
+            self.sorted_name_start_array[i], self.sorted_name_position_array[i]
+        )
+
+    def get_sorted_acronym(self, i: int) -> str:
+        return generate_acronym(
+            self.get_name_of_start(
+                self.sorted_acronym_start_array[i],
+                self.sorted_acronym_position_array[i],
+            )
+        )
+
+    def get_token_position_array(self, token_id_range: range) -> array:
+        """Positions of characters having a token of `token_id_range`
+
+        Positions of each token are sorted, but not of the whole range.
+        Same position can be in it more than once.
+        """
+
+        start = self.token_position_offset_array[token_id_range.start]
+        end = self.token_position_offset_array[token_id_range.stop]
+
+        return self.token_position_array[start:end]
+
+    def find_token_id(self, token: str) -> int | None:
+        """Token id of `token`. `None` if no character has the token."""
+
+        token_id = bisect.bisect_left(self.token_list, token)
+
+        if (token_id < len(self.token_list)) and (self.token_list[token_id] == token):
+            return token_id
+
+        return None
+
+    def find_token_id_range_starts_with(self, prefix: str) -> range:
+        """Token ids of tokens starting with `prefix` (including `prefix` itself)"""
+
+        start = bisect.bisect_left(self.token_list, prefix)
+        end = bisect.bisect_left(self.token_list, prefix + "\U0010ffff", lo=start)
+
+        return range(start, end)
+
+    def get_string_data_for_search(self, position: int) -> str:
+        """`_string_data_for_search` of character, also of name range"""
+
+        string_data_for_search = self.string_data_for_search_list[position]
+
+        if string_data_for_search is None:
+            return self.unicode_character_list[position]._string_data_for_search
+
+        return string_data_for_search
+
+    def find_name_range_position_list(self, query: str) -> Iterator[int]:
+        """Find positions of characters whose names are made by a rule
+
+        E.g., `"CJK UNIFIED IDEOGRAPH 6F22"` -> position of U+6F22
+        (See `UnicodeNameRange.find_position_list`)
+
+        Args:
+            query: Upper case query.
+        """
+
+        for name_range in self.name_range_list:
+            yield from name_range.find_position_list(query)
+
+    def find_name_position_list(self, name: str) -> list[int]:
+        """Find positions of characters whose name (or alias) is `name`
+
+        Args:
+            name: Upper case name. E.g., `"EM DASH"`
+        """
+
+        sorted_name_range = range(len(self.sorted_name_start_array))
+
+        start = bisect.bisect_left(sorted_name_range, name, key=self.get_sorted_name)
+        end = bisect.bisect_right(
+            sorted_name_range, name, lo=start, key=self.get_sorted_name
+        )
+
+        return sorted(set(self.sorted_name_position_array[start:end]))
+
+    def find_name_prefix_position_list(self, prefix: str) -> list[int]:
+        """Find positions of characters whose name (or alias) starts with `prefix`
+
+        Args:
+            prefix: Upper case prefix of name. E.g., `"EM DA"`
+
+        Returns:
+            Positions in order of shorter name. (Same length in order of position)
+        """
+
+        sorted_name_range = range(len(self.sorted_name_start_array))
+
+        start = bisect.bisect_left(sorted_name_range, prefix, key=self.get_sorted_name)
+        end = bisect.bisect_left(
+            sorted_name_range,
+            prefix + "\U0010ffff",
+            lo=start,
+            key=self.get_sorted_name,
+        )
+
+        name_length_and_position_list = sorted(
+            zip(
+                self.sorted_name_length_array[start:end],
+                self.sorted_name_position_array[start:end],
+            )
+        )
+
+        return list(
+            dict.fromkeys(position for (_, position) in name_length_and_position_list)
+        )
+
+    def find_acronym_prefix_position_list(self, prefix: str) -> list[int]:
+        """Find positions of characters whose acronym of name (or alias) starts with
+        `prefix`
+
+        Args:
+            prefix: Upper case prefix of acronym. E.g., `"RWA"`
+
+        Returns:
+            Positions in order of shorter acronym. (Same length in order of position)
+            E.g., `RIGHTWARDS WAVE ARROW`, `RIGHTWARDS WHITE ARROW`,
+            `RIGHTWARDS WHITE ARROW FROM WALL`, ...
+        """
+
+        sorted_acronym_range = range(len(self.sorted_acronym_start_array))
+
+        start = bisect.bisect_left(
+            sorted_acronym_range, prefix, key=self.get_sorted_acronym
+        )
+        end = bisect.bisect_left(
+            sorted_acronym_range,
+            prefix + "\U0010ffff",
+            lo=start,
+            key=self.get_sorted_acronym,
+        )
+
+        acronym_length_and_position_list = sorted(
+            zip(
+                self.sorted_acronym_length_array[start:end],
+                self.sorted_acronym_position_array[start:end],
+            )
+        )
+
+        return list(
+            dict.fromkeys(
+                position for (_, position) in acronym_length_and_position_list
+            )
+        )
+
+    def find_word_position_list(self, query: str) -> list[int]:
+        """Find positions of characters having every token of query as a whole word
+
+        E.g., `"a with acute"` -> positions of `LATIN CAPITAL LETTER A WITH ACUTE`, ...
+
+        Returns:
+            Sorted positions. Empty list if query has no token.
+        """
+
+        query_token_list = tokenize_for_search(query)
+
+        if len(query_token_list) == 0:
+            return []
+
+        position_array_list: list[array] = []
+
+        for query_token in query_token_list:
+            token_id = self.find_token_id(query_token)
+
+            if token_id is None:
+                return []
+
+            position_array_list.append(
+                self.get_token_position_array(range(token_id, token_id + 1))
+            )
+
+        # Start from the smallest
+        position_array_list.sort(key=len)
+
+        word_position_set = set(position_array_list[0])
+
+        for position_array in position_array_list[1:]:
+            word_position_set.intersection_update(position_array)
+
+            if len(word_position_set) == 0:
+                break
+
+        return sorted(word_position_set)
+
+    def find_candidate_position_list(self, query: str) -> list[int]:
+        """Find positions of characters sharing a token or token prefix with query.
+
+        Args:
+            query: Query for search
+
+        Returns:
+            Sorted positions in `unicode_character_list`.
+            Empty list if no character shares a token with query.
+        """
+
+        candidate_position_set: set[int] = set()
+
+        for query_token in tokenize_for_search(query):
+            candidate_position_set.update(
+                self.get_token_position_array(
+                    self.find_token_id_range_starts_with(query_token)
+                )
+            )
+
+        return sorted(candidate_position_set)
+
+
+# Built index of the last `unicode_character_list`.
+#
+# Extension has only one list, so keeping only the last one is enough.
+_last_unicode_character_search_index: UnicodeCharacterSearchIndex | None = None
+
+
+def get_unicode_character_search_index(
+    unicode_character_list: list[UnicodeCharacter],
+) -> UnicodeCharacterSearchIndex:
+    """Get (or build at first time) search index of `unicode_character_list`
+
+    Building takes time, so call this once when data is loaded to prebuild it.
+    """
+
+    global _last_unicode_character_search_index
+
+    search_index = _last_unicode_character_search_index
+
+    if (
+        (search_index is None)
+        or (search_index.unicode_character_list is not unicode_character_list)
+        or (len(search_index) != len(unicode_character_list))
+    ):
+        search_index = UnicodeCharacterSearchIndex(unicode_character_list)
+        _last_unicode_character_search_index = search_index
+
+    return search_index
+
+
+def set_unicode_character_search_index(search_index: UnicodeCharacterSearchIndex):
+    """Use built `search_index` (e.g., loaded from snapshot) as the index of its list"""
+
+    global _last_unicode_character_search_index
+
+    _last_unicode_character_search_index = search_index
@@ -0,0 +1,515 @@
+import bisect
+import itertools
+import sys
+import weakref
+from array import array
+from collections.abc import Mapping, Sequence
+from typing import Iterator
+
+from .unicode_character import (
+    EMPTY_ALIASES,
+    UnicodeCharacter,
+    convert_for_search,
+    validate_unicode_character_data,
+)
+from .unicode_name_lexicon import UnicodeNameLexicon
+from .unicode_name_range import (
+    HANGUL_SYLLABLE_FIRST_CODE_POINT,
+    HANGUL_SYLLABLE_LAST_CODE_POINT,
+    HANGUL_SYLLABLE_NAME_PREFIX,
+    UnicodeNameRange,
+    find_name_prefix,
+    is_name_prefix,
+)
+
+# Biggest code point of Unicode
+MAX_CODE_POINT = 0x10FFFF
+
+
+class UnicodeCharacterStore:
+    """
+    Columnar store of Unicode characters.
+
+    Each column has one item per character, in order of code point.
+    Search needs only the columns (e.g., `string_data_for_search_list`),
+    so `UnicodeCharacter` objects are not made for every character.
+    (See `UnicodeCharacterList`)
+
+    Names and aliases are kept as word ids of `lexicon`, and read when needed.
+
+    Names made by a rule (e.g., `CJK UNIFIED IDEOGRAPH-4E00`) are not stored.
+    They have no word ids (`None` in `string_data_for_search_list`), and are made
+    from `name_range_list` when needed.
+
+    Attributes:
+        code_point_array (array): Code points. Example: `array("I", [0, 1, ...])`
+        lexicon (UnicodeNameLexicon): Words of names and aliases.
+        name_word_id_array (array): Word ids of names and aliases of every
+            character. (See `UnicodeNameLexicon.encode`)
+        name_word_offset_array (array): Offset of word ids of each character in
+            `name_word_id_array`, and the end. Example: `array("I", [0, 2, ...])`
+        block_id_array (array): Index of `block_list` of each character.
+        block_list (list[str]): Block names. One string per block.
+        string_data_for_search_list (list[str | None]): Same as
+            `UnicodeCharacter._string_data_for_search` of each character.
+        name_range_list (list[UnicodeNameRange]): Ranges of characters whose
+            names are made by a rule. In order of code point.
+    """
+
+    code_point_array: array
+    lexicon: UnicodeNameLexicon
+    name_word_id_array: array
+    name_word_offset_array: array
+    block_id_array: array
+    block_list: list[str]
+    string_data_for_search_list: list[str | None]
+    name_range_list: list[UnicodeNameRange]
+
+    def __init__(self, lexicon: UnicodeNameLexicon | None = None):
+        """
+        Args:
+            lexicon: Lexicon of word ids given to `append_trusted`.
+                (e.g., of `unicode_data.bin`) New one if `None`.
+        """
+
+        self.code_point_array = array("I")
+        self.lexicon = lexicon if lexicon is not None else UnicodeNameLexicon()
+        self.name_word_id_array = array("H")
+        self.name_word_offset_array = array("I", [0])
+        self.block_id_array = array("H")
+        self.block_list = []
+        self.string_data_for_search_list = []
+        self.name_range_list = []
+
+        self._block_id_dict: dict[str, int] = {}
+
+    def __len__(self):
+        return len(self.code_point_array)
+
+    def append(self, code_point: int, name: str, aliases: list[str], block: str):
+        """Append a character. Should be appended in order of code point.
+
+        Character is validated, and string for search is made from it.
+        (Raises `ValueError` if it's wrong)
+
+        If the name is made by a rule, it's added to `name_range_list` instead.
+        """
+
+        self.__validate_code_point(code_point)
+
+        validate_unicode_character_data(f"{code_point:04X}", name, block, aliases)
+
+        if not all(isinstance(alias, str) and (alias != "") for alias in aliases):
+            raise ValueError(
+                f"UnicodeCharacterStore append - `aliases` value error. Current `aliases`: `{aliases}`"
+            )
+
+        name_prefix = find_name_prefix(code_point, name) if len(aliases) == 0 else None
+
+        if name_prefix is not None:
+            self.append_name_range(name_prefix, code_point, code_point, block)
+            return
+
+        self.append_trusted(
+            code_point,
+            self.lexicon.encode(name, aliases),
+            block,
+            convert_for_search(f"U+{code_point:04X}", name, aliases),
+        )
+
+    def append_trusted(
+        self,
+        code_point: int,
+        name_word_id_list: Sequence[int],
+        block: str,
+        string_data_for_search: str,
+    ):
+        """Append a character without validation, for data already validated.
+
+        (e.g., `unicode_data.bin` of valid checksum)
+
+        Args:
+            name_word_id_list: Word ids of name and aliases, of `lexicon`.
+            string_data_for_search: Result of `convert_for_search` of the character.
+        """
+
+        block_id = self.__get_block_id(block)
+
+        self.code_point_array.append(code_point)
+        self.name_word_id_array.extend(name_word_id_list)
+        self.name_word_offset_array.append(len(self.name_word_id_array))
+        self.block_id_array.append(block_id)
+        self.string_data_for_search_list.append(string_data_for_search)
+
+    def append_name_range(
+        self, prefix: str, first_code_point: int, last_code_point: int, block: str
+    ):
+        """Append characters whose names are made by the rule of `prefix`.
+
+        It's joined to the last range, if it continues the last range.
+        (Raises `ValueError` if it's wrong)
+
+        Args:
+            prefix: E.g., `"CJK UNIFIED IDEOGRAPH-"` (See `unicode_name_range.py`)
+        """
+
+        self.__validate_code_point(first_code_point)
+        self.__validate_code_point(last_code_point, min_code_point=first_code_point)
+
+        if not is_name_prefix(prefix):
+            raise ValueError(
+                f"UnicodeCharacterStore append_name_range - `prefix` value error. Current `prefix`: `{prefix}`"
+            )
+        if (prefix == HANGUL_SYLLABLE_NAME_PREFIX) and not (
+            HANGUL_SYLLABLE_FIRST_CODE_POINT
+            <= first_code_point
+            <= last_code_point
+            <= HANGUL_SYLLABLE_LAST_CODE_POINT
+        ):
+            raise ValueError(
+                f"UnicodeCharacterStore append_name_range - Not Hangul syllable. Current range: `{first_code_point:04X}..{last_code_point:04X}`"
+            )
+
+        block_id = self.__get_block_id(block)
+        character_number = last_code_point - first_code_point + 1
+
+        last_name_range = self.name_range_list[-1] if self.name_range_list else None
+
+        if (
+            (last_name_range is not None)
+            and (last_name_range.prefix == prefix)
+            and (last_name_range.last_code_point + 1 == first_code_point)
+            and (last_name_range.first_position + len(last_name_range) == len(self))
+            and (self.block_id_array[-1] == block_id)
+        ):
+            last_name_range.last_code_point = last_code_point
+        else:
+            self.name_range_list.append(
+                UnicodeNameRange(prefix, first_code_point, last_code_point, len(self))
+            )
+
+        self.code_point_array.extend(range(first_code_point, last_code_point + 1))
+        self.name_word_offset_array.extend(
+            itertools.repeat(len(self.name_word_id_array), character_number)
+        )
+        self.block_id_array.extend(array("H", [block_id]) * character_number)
+        self.string_data_for_search_list.extend(
+            itertools.repeat(None, character_number)
+        )
+
+    def __validate_code_point(self, code_point: int, min_code_point: int = -1):
+        if not (
+            isinstance(code_point, int)
+            and (0 <= code_point <= MAX_CODE_POINT)
+            and ((len(self) == 0) or (self.code_point_array[-1] < code_point))
+            and (min_code_point <= code_point)
+        ):
+            raise ValueError(
+                f"UnicodeCharacterStore append - `code_point` value error. Should be in order. Current `code_point`: `{code_point}`"
+            )
+
+    def __get_block_id(self, block: str) -> int:
+        block_id = self._block_id_dict.get(block)
+
+        if block_id is None:
+            block_id = len(self.block_list)
+            self.block_list.append(sys.intern(block))
+            self._block_id_dict[block] = block_id
+
+        return block_id
+
+    def get_name_word_id_array(self, position: int) -> array:
+        """Word ids of name and aliases. Empty for characters of name range."""
+
+        start = self.name_word_offset_array[position]
+        end = self.name_word_offset_array[position + 1]
+
+        return self.name_word_id_array[start:end]
+
+    def get_name(self, position: int) -> str:
+        name_word_id_array = self.get_name_word_id_array(position)
+
+        if len(name_word_id_array) == 0:
+            return self.find_name_range(position).get_name(position)  # type: ignore
+
+        return self.lexicon.decode_name(name_word_id_array)
+
+    def get_string_data_for_search(self, position: int) -> str:
+        string_data_for_search = self.string_data_for_search_list[position]
+
+        if string_data_for_search is None:
+            return convert_for_search(
+                f"U+{self.code_point_array[position]:04X}",
+                self.get_name(position),
+                EMPTY_ALIASES,
+            )
+
+        return string_data_for_search
+
+    def find_name_range(self, position: int) -> UnicodeNameRange | None:
+        """Find name range having the character of `position`"""
+
+        i = (
+            bisect.bisect_right(
+                self.name_range_list,
+                position,
+                key=lambda name_range: name_range.first_position,
+            )
+            - 1
+        )
+
+        if i < 0:
+            return None
+
+        name_range = self.name_range_list[i]
+
+        if position >= name_range.first_position + len(name_range):
+            return None
+
+        return name_range
+
+    def get_block(self, position: int) -> str:
+        return self.block_list[self.block_id_array[position]]
+
+    def get_aliases(self, position: int) -> list[str]:
+        name_word_id_array = self.get_name_word_id_array(position)
+
+        if len(name_word_id_array) == 0:
+            return EMPTY_ALIASES
+
+        _, aliases = self.lexicon.decode(name_word_id_array)
+
+        return aliases
+
+    def find_position(self, code_point: int) -> int | None:
+        """Find position of code point.
+
+        Returns:
+            Position, or `None` if the code point is not in store.
+        """
+
+        position = bisect.bisect_left(self.code_point_array, code_point)
+
+        if (position < len(self)) and (self.code_point_array[position] == code_point):
+            return position
+
+        return None
+
+
+class UnicodeCharacterList(Sequence[UnicodeCharacter]):
+    """
+    `list[UnicodeCharacter]` of `UnicodeCharacterStore`.
+
+    `UnicodeCharacter` is made when it's accessed (e.g., search result),
+    and the same object is returned for the same position while it's in use.
+
+    Objects are kept by weak references. Object not referenced anymore
+    (e.g., result of old query) is freed, and made again when it's accessed.
+    So objects of every character are not kept after broad searches.
+
+    Attributes:
+        store (UnicodeCharacterStore): Characters of list.
+    """
+
+    store: UnicodeCharacterStore
+
+    def __init__(self, store: UnicodeCharacterStore):
+        self.store = store
+
+        self._unicode_character_dict: weakref.WeakValueDictionary[
+            int, UnicodeCharacter
+        ] = weakref.WeakValueDictionary()
+
+    def __len__(self):
+        return len(self.store)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[position] for position in range(*index.indices(len(self)))]
+
+        if index < 0:
+            index += len(self)
+
+        if not (0 <= index < len(self)):
+            raise IndexError("UnicodeCharacterList index out of range")
+
+        unicode_character = self._unicode_character_dict.get(index)
+
+        if unicode_character is None:
+            # Store is already validated.
+            unicode_character = UnicodeCharacter.create_trusted(
+                code_point=f"{self.store.code_point_array[index]:04X}",
+                name=self.store.get_name(index),
+                block=self.store.get_block(index),
+                aliases=self.store.get_aliases(index),
+                string_data_for_search=self.store.get_string_data_for_search(index),
+            )
+
+            self._unicode_character_dict[index] = unicode_character
+
+        return unicode_character
+
+    def __getstate__(self):
+        # Objects of characters are not saved. (e.g., to snapshot)
+        return {"store": self.store}
+
+    def __setstate__(self, state: dict):
+        self.__init__(state["store"])
+
+    def get_materialized_number(self) -> int:
+        """Number of `UnicodeCharacter` made and still in use"""
+
+        return len(self._unicode_character_dict)
+
+
+class UnicodeCharacterDict(Mapping[str, UnicodeCharacter]):
+    """
+    `dict[str, UnicodeCharacter]` of `UnicodeCharacterList`. Key is `U+XXXX`.
+
+    Use `get_by_code_point` to find by code point (`int`), not making the key.
+
+    Attributes:
+        unicode_character_list (UnicodeCharacterList): Characters of dict.
+    """
+
+    unicode_character_list: UnicodeCharacterList
+
+    def __init__(self, unicode_character_list: UnicodeCharacterList):
+        self.unicode_character_list = unicode_character_list
+
+    def __len__(self):
+        return len(self.unicode_character_list)
+
+    def __iter__(self) -> Iterator[str]:
+        for code_point in self.unicode_character_list.store.code_point_array:
+            yield f"U+{code_point:04X}"
+
+    def __getitem__(self, key: str) -> UnicodeCharacter:
+        position = None
+
+        if isinstance(key, str) and key.startswith("U+"):
+            try:
+                code_point = int(key[2:], base=16)
+            except ValueError:
+                code_point = None
+
+            # Same key as `u_code_point`. Not `U+41`, `U+0041 `, ...
+            if (code_point is not None) and (key == f"U+{code_point:04X}"):
+                position = self.unicode_character_list.store.find_position(code_point)
+
+        if position is None:
+            raise KeyError(key)
+
+        return self.unicode_character_list[position]
+
+    def get_by_code_point(self, code_point: int) -> UnicodeCharacter | None:
+        """Find character by code point. `None` if it's not in dict."""
+
+        position = self.unicode_character_list.store.find_position(code_point)
+
+        if position is None:
+            return None
+
+        return self.unicode_character_list[position]
+
+
+def get_unicode_character_by_code_point(
+    unicode_character_dict: Mapping[str, UnicodeCharacter], code_point: int
+) -> UnicodeCharacter | None:
+    """Find character by code point, without making `U+XXXX` key if it can.
+
+    Returns:
+        Character, or `None` if the code point is not in dict.
+    """
+
+    if isinstance(unicode_character_dict, UnicodeCharacterDict):
+        return unicode_character_dict.get_by_code_point(code_point)
+
+    return unicode_character_dict.get(f"U+{code_point:04X}")
+
+
+def get_string_data_for_search_list(
+    unicode_character_list: Sequence[UnicodeCharacter],
+) -> Sequence[str | None]:
+    """`_string_data_for_search` of each character, without making objects.
+
+    `None` for characters of name range. (See `get_name_range_list`)
+    """
+
+    if isinstance(unicode_character_list, UnicodeCharacterList):
+        return unicode_character_list.store.string_data_for_search_list
+
+    return [
+        unicode_character._string_data_for_search
+        for unicode_character in unicode_character_list
+    ]
+
+
+def get_name_word_data(
+    unicode_character_list: Sequence[UnicodeCharacter],
+) -> tuple[UnicodeNameLexicon, array, array]:
+    """Names and aliases of characters as word ids, without making objects.
+
+    Made by encoding names if list is not of `UnicodeCharacterStore`.
+
+    Returns:
+        (lexicon, name word ids, name word offsets)
+        (See `UnicodeCharacterStore.name_word_id_array`)
+        Characters of name range have no word ids. (See `get_name_range_list`)
+    """
+
+    if isinstance(unicode_character_list, UnicodeCharacterList):
+        store = unicode_character_list.store
+
+        return (store.lexicon, store.name_word_id_array, store.name_word_offset_array)
+
+    lexicon = UnicodeNameLexicon()
+    name_word_id_array = array("H")
+    name_word_offset_array = array("I", [0])
+
+    for unicode_character in unicode_character_list:
+        name_word_id_array.extend(
+            lexicon.encode(unicode_character.name, unicode_character.aliases)
+        )
+        name_word_offset_array.append(len(name_word_id_array))
+
+    return (lexicon, name_word_id_array, name_word_offset_array)
+
+
+def get_code_point_array(unicode_character_list: Sequence[UnicodeCharacter]) -> array:
+    """Code point of each character, without making objects."""
+
+    if isinstance(unicode_character_list, UnicodeCharacterList):
+        return unicode_character_list.store.code_point_array
+
+    return array(
+        "I",
+        [
+            int(unicode_character.code_point, base=16)
+            for unicode_character in unicode_character_list
+        ],
+    )
+
+
+def iterate_block(unicode_character_list: Sequence[UnicodeCharacter]) -> Iterator[str]:
+    """Block of each character, without making objects."""
+
+    if isinstance(unicode_character_list, UnicodeCharacterList):
+        store = unicode_character_list.store
+
+        for block_id in store.block_id_array:
+            yield store.block_list[block_id]
+    else:
+        for unicode_character in unicode_character_list:
+            yield unicode_character.block
+
+
+def get_name_range_list(
+    unicode_character_list: Sequence[UnicodeCharacter],
+) -> list[UnicodeNameRange]:
+    """Ranges of characters whose names are made by a rule, and not stored."""
+
+    if isinstance(unicode_character_list, UnicodeCharacterList):
+        return unicode_character_list.store.name_range_list
+
+    return []
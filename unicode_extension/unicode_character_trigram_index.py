@@ -0,0 +1,185 @@
+import logging
+import math
+import sys
+from array import array
+from collections import Counter
+
+from .unicode_character import UnicodeCharacter
+from .unicode_character_search_index import (
+    get_unicode_character_search_index,
+    tokenize_for_search,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def generate_trigram_set(string: str) -> set[str]:
+    """Generate trigrams of words in string, for typo tolerant search.
+
+    Words with digit (code point `2014`, `4E00` of `CJK UNIFIED IDEOGRAPH-4E00`)
+    are skipped. They are found by the search index, and most of them are unique,
+    so their trigrams would be most of the index.
+
+    Args:
+        string: E.g., `"ellipsis"`
+
+    Returns:
+        Upper case trigrams. E.g., `{"ELL", "LLI", "LIP", "IPS", "PSI", "SIS"}`
+    """
+
+    trigram_set: set[str] = set()
+
+    for token in tokenize_for_search(string):
+        if (len(token) < 3) or (not token.isalpha()):
+            continue
+
+        trigram_set.update(token[i : i + 3] for i in range(len(token) - 2))
+
+    return trigram_set
+
+
+class UnicodeCharacterTrigramIndex:
+    """
+    Trigram index of `unicode_character_list`, for misspelled queries.
+
+    Misspelled query (`chekmark`, `elipsis`) shares no token with characters,
+    but shares most of its trigrams with the right ones. (`CHECK MARK`, `ELLIPSIS`)
+    Characters sharing enough trigrams are candidates of fuzzy search,
+    instead of the whole list.
+
+    Attributes:
+        unicode_character_list (list[UnicodeCharacter]): Indexed list.
+        trigram_position_dict (dict[str, array]): Trigram -> positions in list.
+            Example: `"LIP"` -> `array("I", [8230, ...])`
+    """
+
+    DEFAULT_MIN_SHARED_RATIO: float = 0.4
+    DEFAULT_MAX_CANDIDATE_NUMBER: int = 2000
+
+    unicode_character_list: list[UnicodeCharacter]
+    trigram_position_dict: dict[str, array]
+
+    def __init__(self, unicode_character_list: list[UnicodeCharacter]):
+        self.unicode_character_list = unicode_character_list
+
+        # Characters of a trigram are the characters of tokens having the trigram.
+        # Token postings are already in the search index. (Much less than characters)
+        search_index = get_unicode_character_search_index(unicode_character_list)
+
+        trigram_position_array_list_dict: dict[str, list[array]] = {}
+
+        for token_id, token in enumerate(search_index.token_list):
+            position_array = search_index.get_token_position_array(
+                range(token_id, token_id + 1)
+            )
+
+            for trigram in generate_trigram_set(token):
+                position_array_list = trigram_position_array_list_dict.get(trigram)
+
+                if position_array_list is None:
+                    trigram_position_array_list_dict[trigram] = [position_array]
+                else:
+                    position_array_list.append(position_array)
+
+        self.trigram_position_dict = {
+            trigram: array("I", sorted(set().union(*position_array_list)))
+            for trigram, position_array_list in trigram_position_array_list_dict.items()
+        }
+
+    def __len__(self):
+        return len(self.unicode_character_list)
+
+    def get_memory_size(self) -> int:
+        """Approximate memory size (bytes) of the index. Dict, keys and arrays."""
+
+        return (
+            sys.getsizeof(self.trigram_position_dict)
+            + sum(map(sys.getsizeof, self.trigram_position_dict.keys()))
+            + sum(map(sys.getsizeof, self.trigram_position_dict.values()))
+        )
+
+    def find_candidate_position_list(
+        self,
+        query: str,
+        min_shared_ratio: float = DEFAULT_MIN_SHARED_RATIO,
+        max_candidate_number: int = DEFAULT_MAX_CANDIDATE_NUMBER,
+    ) -> list[int]:
+        """Find positions of characters sharing enough trigrams with query.
+
+        Args:
+            query: Query for search. E.g., `"chekmark"`
+            min_shared_ratio: Ratio of query trigrams a candidate should have.
+            max_candidate_number: Candidates sharing more trigrams are kept.
+
+        Returns:
+            Sorted positions in `unicode_character_list`.
+            Empty list if query has no trigram. (Shorter than 3 letters)
+        """
+
+        query_trigram_set = generate_trigram_set(query)
+
+        if len(query_trigram_set) == 0:
+            return []
+
+        shared_trigram_counter: Counter[int] = Counter()
+
+        for trigram in query_trigram_set:
+            position_array = self.trigram_position_dict.get(trigram)
+
+            if position_array is not None:
+                shared_trigram_counter.update(position_array)
+
+        min_shared_trigram_number = max(
+            1, math.ceil(len(query_trigram_set) * min_shared_ratio)
+        )
+
+        candidate_list = [
+            (shared_trigram_number, position)
+            for position, shared_trigram_number in shared_trigram_counter.items()
+            if shared_trigram_number >= min_shared_trigram_number
+        ]
+
+        if len(candidate_list) > max_candidate_number:
+            candidate_list.sort(key=lambda candidate: (-candidate[0], candidate[1]))
+            candidate_list = candidate_list[:max_candidate_number]
+
+        return sorted(position for (_, position) in candidate_list)
+
+
+# Built index of the last `unicode_character_list`. (Same as search index)
+_last_unicode_character_trigram_index: UnicodeCharacterTrigramIndex | None = None
+
+
+def get_unicode_character_trigram_index(
+    unicode_character_list: list[UnicodeCharacter],
+) -> UnicodeCharacterTrigramIndex:
+    """Get (or build at first time) trigram index of `unicode_character_list`
+
+    Building takes time, so call this once when data is loaded to prebuild it.
+    """
+
+    global _last_unicode_character_trigram_index
+
+    trigram_index = _last_unicode_character_trigram_index
+
+    if (
+        (trigram_index is None)
+        or (trigram_index.unicode_character_list is not unicode_character_list)
+        or (len(trigram_index) != len(unicode_character_list))
+    ):
+        trigram_index = UnicodeCharacterTrigramIndex(unicode_character_list)
+        _last_unicode_character_trigram_index = trigram_index
+
+        logger.debug(
+            f"Trigram index built. Trigrams: {len(trigram_index.trigram_position_dict)}, Memory: {trigram_index.get_memory_size() / 1024 / 1024:.1f}MiB"
+        )
+
+    return trigram_index
+
+
+def set_unicode_character_trigram_index(trigram_index: UnicodeCharacterTrigramIndex):
+    """Use built `trigram_index` (e.g., loaded from snapshot) as the index of its list"""
+
+    global _last_unicode_character_trigram_index
+
+    _last_unicode_character_trigram_index = trigram_index
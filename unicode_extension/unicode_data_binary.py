@@ -0,0 +1,265 @@
+import bisect
+import mmap
+import struct
+import sys
+import zlib
+from typing import Iterator
+
+# Format of `unicode_data.bin`.
+# See `generate_data/save_unicode_data_to_binary_file.py` for the layout.
+UNICODE_DATA_BINARY_MAGIC = b"UCDB"
+UNICODE_DATA_BINARY_VERSION = 4
+UNICODE_DATA_BINARY_HEADER = struct.Struct("<4sHHIIIIIIIIIIIIIIIIII")
+
+
+class UnicodeDataBinary:
+    """
+    Reader of `unicode_data.bin`.
+
+    The file is a compact format of columns. (Arrays of code points, word ids,
+    block ids, and strings for search) It's memory-mapped while open, and
+    `iterate_record` parses every record, copying it out of the mapping.
+    (`load_unicode_data_from_binary` keeps them in `UnicodeCharacterStore`)
+    Block names and words are read at open.
+
+    `close` unmaps the file. Arrays of it can't be read after that.
+
+    Characters whose names are made by a rule are not records, but name ranges.
+    (See `iterate_name_range`)
+
+    Names and aliases of records are word ids of `word_list`.
+    (Same as `UnicodeNameLexicon.encode`)
+
+    Attributes:
+        file_path (str): Path of `unicode_data.bin`
+        block_list (list[str]): Block names. Index is block id.
+        word_list (list[str]): Words of names and aliases. Index is word id.
+        is_checksum_valid (bool): Checksum of the file is same as the one in header.
+            If not, records should be validated before use. (File is broken)
+    """
+
+    file_path: str
+    block_list: list[str]
+    word_list: list[str]
+    is_checksum_valid: bool
+
+    def __init__(self, file_path: str):
+        # Arrays of file are little endian, used as native `memoryview`.
+        if sys.byteorder != "little":
+            raise ValueError("UnicodeDataBinary - Only for little endian machine.")
+
+        self.file_path = file_path
+
+        with open(file_path, "rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        # Views of the mapping, released by `close`.
+        self._memoryview_list: list[memoryview] = []
+
+        try:
+            self.__read(file_path)
+        except BaseException:
+            self.close()
+            raise
+
+    def __read(self, file_path: str):
+        if len(self._mmap) < UNICODE_DATA_BINARY_HEADER.size:
+            raise ValueError(f"UnicodeDataBinary - `{file_path}` is too small.")
+
+        (
+            magic,
+            version,
+            _,
+            character_number,
+            block_number,
+            name_range_number,
+            word_number,
+            checksum,
+            code_point_offset,
+            name_word_offset_offset,
+            block_id_offset,
+            block_string_offset_offset,
+            search_string_offset_offset,
+            name_range_offset,
+            name_range_prefix_offset_offset,
+            word_offset_offset,
+            name_word_id_offset,
+            block_string_blob_offset,
+            search_string_blob_offset,
+            name_range_prefix_blob_offset,
+            word_blob_offset,
+        ) = UNICODE_DATA_BINARY_HEADER.unpack_from(self._mmap)
+
+        if magic != UNICODE_DATA_BINARY_MAGIC:
+            raise ValueError(f"UnicodeDataBinary - `{file_path}` is not Unicode data.")
+        if version != UNICODE_DATA_BINARY_VERSION:
+            raise ValueError(
+                f"UnicodeDataBinary - Version of `{file_path}` is `{version}`, not `{UNICODE_DATA_BINARY_VERSION}`."
+            )
+
+        buffer = memoryview(self._mmap)
+        self._memoryview_list.append(buffer)
+
+        self.is_checksum_valid = (
+            zlib.crc32(buffer[UNICODE_DATA_BINARY_HEADER.size :]) == checksum
+        )
+
+        def get_section(offset: int, item_number: int, format: str) -> memoryview:
+            size = item_number * struct.calcsize(format)
+
+            if offset + size > len(buffer):
+                raise ValueError(f"UnicodeDataBinary - `{file_path}` is truncated.")
+
+            section = buffer[offset : offset + size].cast(format)
+            self._memoryview_list.append(section)
+
+            return section
+
+        self._code_point_array = get_section(code_point_offset, character_number, "I")
+        self._name_word_offset_array = get_section(
+            name_word_offset_offset, character_number + 1, "I"
+        )
+        self._name_word_id_array = get_section(
+            name_word_id_offset, self._name_word_offset_array[-1], "H"
+        )
+        self._block_id_array = get_section(block_id_offset, character_number, "H")
+        block_string_offset_array = get_section(
+            block_string_offset_offset, block_number + 1, "I"
+        )
+        block_string_blob = get_section(
+            block_string_blob_offset, block_string_offset_array[-1], "B"
+        )
+        self._search_string_offset_array = get_section(
+            search_string_offset_offset, character_number + 1, "I"
+        )
+        self._search_string_blob = get_section(
+            search_string_blob_offset, self._search_string_offset_array[-1], "B"
+        )
+
+        self._name_range_array = get_section(
+            name_range_offset, name_range_number * 3, "I"
+        )
+        self._name_range_prefix_offset_array = get_section(
+            name_range_prefix_offset_offset, name_range_number + 1, "I"
+        )
+        self._name_range_prefix_blob = get_section(
+            name_range_prefix_blob_offset, self._name_range_prefix_offset_array[-1], "B"
+        )
+
+        word_offset_array = get_section(word_offset_offset, word_number + 1, "I")
+        word_blob = get_section(word_blob_offset, word_offset_array[-1], "B")
+
+        self.block_list = [
+            str(block_string_blob[start:end], "utf-8")
+            for start, end in zip(
+                block_string_offset_array[:-1], block_string_offset_array[1:]
+            )
+        ]
+        self.word_list = [
+            str(word_blob[start:end], "utf-8")
+            for start, end in zip(word_offset_array[:-1], word_offset_array[1:])
+        ]
+
+    def close(self):
+        """Unmap the file. Views of `get_name_word_id_array` should be released
+        before it. (Otherwise `BufferError`)"""
+
+        for view in reversed(self._memoryview_list):
+            view.release()
+
+        self._memoryview_list.clear()
+        self._mmap.close()
+
+    def __len__(self):
+        return len(self._code_point_array)
+
+    def get_code_point(self, position: int) -> int:
+        return self._code_point_array[position]
+
+    def get_block(self, position: int) -> str:
+        return self.block_list[self._block_id_array[position]]
+
+    def get_name_word_id_array(self, position: int) -> memoryview:
+        """Word ids of name and aliases of character. (Of `word_list`)"""
+
+        start = self._name_word_offset_array[position]
+        end = self._name_word_offset_array[position + 1]
+
+        return self._name_word_id_array[start:end]
+
+    def iterate_record(self) -> Iterator[tuple[int, list[int], str, str]]:
+        """Read every record in order. Faster than reading each record by position.
+
+        Yields:
+            (code point, word ids of name and aliases, block, string for search)
+
+            String for search is same as `convert_for_search` of the record.
+        """
+
+        name_word_offset_list = self._name_word_offset_array.tolist()
+        name_word_id_list = self._name_word_id_array.tolist()
+        search_string_offset_list = self._search_string_offset_array.tolist()
+        search_string_blob = bytes(self._search_string_blob)
+        block_list = self.block_list
+
+        for (
+            code_point,
+            start,
+            end,
+            block_id,
+            search_string_start,
+            search_string_end,
+        ) in zip(
+            self._code_point_array.tolist(),
+            name_word_offset_list[:-1],
+            name_word_offset_list[1:],
+            self._block_id_array.tolist(),
+            search_string_offset_list[:-1],
+            search_string_offset_list[1:],
+        ):
+            yield (
+                code_point,
+                name_word_id_list[start:end],
+                block_list[block_id],
+                str(search_string_blob[search_string_start:search_string_end], "utf-8"),
+            )
+
+    def iterate_name_range(self) -> Iterator[tuple[str, int, int, str]]:
+        """Read every name range in order of code point.
+
+        Yields:
+            (prefix, first code point, last code point, block)
+
+            E.g., `("CJK UNIFIED IDEOGRAPH-", 0x4E00, 0x9FFF, "CJK Unified Ideographs")`
+        """
+
+        name_range_list = self._name_range_array.tolist()
+        prefix_offset_list = self._name_range_prefix_offset_array.tolist()
+
+        for i, (start, end) in enumerate(
+            zip(prefix_offset_list[:-1], prefix_offset_list[1:])
+        ):
+            first_code_point, last_code_point, block_id = name_range_list[
+                i * 3 : i * 3 + 3
+            ]
+
+            yield (
+                str(self._name_range_prefix_blob[start:end], "utf-8"),
+                first_code_point,
+                last_code_point,
+                self.block_list[block_id],
+            )
+
+    def find_position(self, code_point: int) -> int | None:
+        """Find position of code point. (Records are sorted by code point)
+
+        Returns:
+            Position, or `None` if the code point is not in data.
+        """
+
+        position = bisect.bisect_left(self._code_point_array, code_point)
+
+        if (position < len(self)) and (self._code_point_array[position] == code_point):
+            return position
+
+        return None
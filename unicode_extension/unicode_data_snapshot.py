@@ -0,0 +1,161 @@
+import gc
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+
+from .unicode_block_index import get_unicode_block_index, set_unicode_block_index
+from .unicode_character_search_index import (
+    get_unicode_character_search_index,
+    set_unicode_character_search_index,
+)
+from .unicode_character_trigram_index import (
+    get_unicode_character_trigram_index,
+    set_unicode_character_trigram_index,
+)
+
+logger = logging.getLogger(__name__)
+
+# Change when the layout of snapshot file changes.
+UNICODE_DATA_SNAPSHOT_VERSION = 1
+UNICODE_DATA_SNAPSHOT_FILENAME = "unicode_data_snapshot.pickle"
+
+
+def get_extension_version() -> str:
+    """Digest of extension source files.
+
+    Pickled objects are only valid for the code that made them, so any change
+    of `unicode_extension` makes a new version. (There is no version number
+    of the extension)
+    """
+
+    extension_dir_path = os.path.dirname(os.path.abspath(__file__))
+    digest = hashlib.sha1()
+
+    for filename in sorted(os.listdir(extension_dir_path)):
+        if (not filename.endswith(".py")) or filename.startswith("test_"):
+            continue
+
+        digest.update(filename.encode("utf-8"))
+
+        with open(f"{extension_dir_path}/{filename}", "rb") as file:
+            digest.update(file.read())
+
+    return digest.hexdigest()
+
+
+def get_data_file_signature(data_file_path_list: list[str]) -> list:
+    """Size and modified time of data files. (`None` if file doesn't exist)"""
+
+    signature = []
+
+    for data_file_path in data_file_path_list:
+        try:
+            stat = os.stat(data_file_path)
+        except OSError:
+            signature.append(None)
+            continue
+
+        signature.append(
+            (os.path.abspath(data_file_path), stat.st_size, stat.st_mtime_ns)
+        )
+
+    return signature
+
+
+def create_unicode_data_snapshot_header(data_file_path_list: list[str]) -> dict:
+    return {
+        "version": UNICODE_DATA_SNAPSHOT_VERSION,
+        "extension_version": get_extension_version(),
+        "data_file_signature": get_data_file_signature(data_file_path_list),
+    }
+
+
+def save_unicode_data_snapshot(
+    snapshot_file_path: str, data_file_path_list: list[str], unicode_data: dict
+):
+    """Save loaded Unicode data and its search indexes to snapshot file.
+
+    Indexes are built here if they're not yet. (They're needed anyway)
+
+    Args:
+        snapshot_file_path: Path of snapshot file.
+        data_file_path_list: Data files `unicode_data` is loaded from.
+            Snapshot is valid while they're not changed.
+        unicode_data: Result of `load_unicode_data`
+    """
+
+    unicode_character_list = unicode_data["UNICODE_CHARACTER_LIST"]
+
+    payload = {
+        "unicode_data": unicode_data,
+        "search_index": get_unicode_character_search_index(unicode_character_list),
+        "trigram_index": get_unicode_character_trigram_index(unicode_character_list),
+        "block_index": get_unicode_block_index(unicode_character_list),
+    }
+
+    snapshot_dir_path = os.path.dirname(snapshot_file_path)
+
+    os.makedirs(snapshot_dir_path, exist_ok=True)
+
+    # Write whole file, then replace. Another process can be reading old one.
+    temp_file_descriptor, temp_file_path = tempfile.mkstemp(dir=snapshot_dir_path)
+
+    try:
+        with os.fdopen(temp_file_descriptor, "wb") as file:
+            # Header first, so it can be checked without reading payload.
+            pickle.dump(
+                create_unicode_data_snapshot_header(data_file_path_list),
+                file,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+            pickle.dump(payload, file, protocol=pickle.HIGHEST_PROTOCOL)
+
+        os.replace(temp_file_path, snapshot_file_path)
+    except BaseException:
+        os.remove(temp_file_path)
+        raise
+
+
+def load_unicode_data_snapshot(
+    snapshot_file_path: str, data_file_path_list: list[str]
+) -> dict | None:
+    """Load Unicode data and its search indexes from snapshot file.
+
+    Loaded indexes are used by `get_unicode_character_search_index`, ...
+
+    Returns:
+        Same as `load_unicode_data`. `None` if there is no valid snapshot.
+    """
+
+    if not os.path.exists(snapshot_file_path):
+        return None
+
+    try:
+        with open(snapshot_file_path, "rb") as file:
+            header = pickle.load(file)
+
+            if header != create_unicode_data_snapshot_header(data_file_path_list):
+                logger.info(f"Snapshot `{snapshot_file_path}` is outdated.")
+                return None
+
+            # Many objects are made at once. GC during that only wastes time.
+            is_gc_enabled = gc.isenabled()
+            gc.disable()
+
+            try:
+                payload = pickle.load(file)
+            finally:
+                if is_gc_enabled:
+                    gc.enable()
+    except Exception as error:
+        # Broken file can raise almost any error while unpickling.
+        logger.warning(f"Can't load snapshot `{snapshot_file_path}`. {error}")
+        return None
+
+    set_unicode_character_search_index(payload["search_index"])
+    set_unicode_character_trigram_index(payload["trigram_index"])
+    set_unicode_block_index(payload["block_index"])
+
+    return payload["unicode_data"]
@@ -1,18 +1,46 @@
 import logging
 import os
 import sys
+import threading
+import time
+import unicodedata
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable
 
 from ulauncher.api.shared.item.ExtensionResultItem import ExtensionResultItem
 from ulauncher.api.shared.item.ExtensionSmallResultItem import ExtensionSmallResultItem
 from ulauncher.api.shared.action.RenderResultListAction import RenderResultListAction
 from ulauncher.api.shared.action.CopyToClipboardAction import CopyToClipboardAction
+from ulauncher.api.shared.action.DoNothingAction import DoNothingAction
+from ulauncher.api.shared.action.SetUserQueryAction import SetUserQueryAction
 
 from ulauncher.api.shared.event import KeywordQueryEvent
 from ulauncher.api.shared.event import PreferencesEvent
 from ulauncher.api.shared.event import PreferencesUpdateEvent
 
-from .search_unicode_character import search_unicode_character
-from .unicode_character_icon import generate_unicode_character_icon
+from .block_query import (
+    BlockQuery,
+    parse_block_query,
+    search_unicode_character_in_block,
+)
+from .code_point_query import (
+    parse_code_point_query,
+    search_unicode_character_by_code_point,
+)
+from .lru_cache import LRUCache
+from .search_executor import SearchExecutor
+from .search_refinement_cache import SearchRefinementCache
+from .search_unicode_character import configure_search_worker_pool
+from .unicode_block_index import UnicodeBlockIndex, get_unicode_block_index
+from .unicode_character_icon import (
+    UNICODE_CHARACTER_ICON_CACHE_DIR_PATH,
+    UnicodeCharacterIconCache,
+    UnicodeCharacterIconPrefetcher,
+    touch_unicode_character_icon_dir,
+)
+from .unicode_character_search_index import get_unicode_character_search_index
+from .unicode_character_store import get_unicode_character_by_code_point
+from .unicode_character_trigram_index import get_unicode_character_trigram_index
 
 from .unicode_character import UnicodeCharacter
 
@@ -20,12 +48,62 @@ logger = logging.getLogger(__name__)
 
 
 class UnicodeExtensionFeature:
+    """
+    Features of extension. (Search, Convert)
+
+    Unicode data can be loaded after the extension starts.
+    (See `load_unicode_data_in_background`)
+    Until it's ready, conversion of letters is answered by Python `unicodedata`,
+    with an item telling that search is loading.
+
+    Attributes:
+        start_time (float): `time.perf_counter()` when feature is made.
+        first_response_time (float | None): Time (sec) from start to the first
+            answered query. (Time to first response)
+        unicode_data_ready_time (float | None): Time (sec) from start to when
+            Unicode data and search indexes are ready. (Time to full search)
+        unicode_data_load_error (Exception | None): Error of background loading.
+    """
+
+    SEARCH_RESULT_CACHE_SIZE: int = 256
+
+    unicode_character_list: list[UnicodeCharacter]
+    unicode_character_dict: dict[str, UnicodeCharacter]
+    unicode_block_index: UnicodeBlockIndex
+    search_refinement_cache: SearchRefinementCache
+
     def __init__(
         self,
         project_path: str,
-        unicode_character_list: list,
-        unicode_character_dict: dict,
+        unicode_character_list: list | None = None,
+        unicode_character_dict: dict | None = None,
+        icon_cache_dir_path: str = UNICODE_CHARACTER_ICON_CACHE_DIR_PATH,
     ):
+        """
+        Args:
+            project_path: Path of project.
+            unicode_character_list: `UNICODE_CHARACTER_LIST` of `load_unicode_data`.
+                `None` to set it later. (See `set_unicode_data`)
+            unicode_character_dict: `UNICODE_CHARACTER_DICT` of `load_unicode_data`.
+            icon_cache_dir_path: Directory of icons made by extension.
+        """
+
+        self.start_time: float = time.perf_counter()
+        self.first_response_time: float | None = None
+        self.unicode_data_ready_time: float | None = None
+        self.unicode_data_load_error: Exception | None = None
+
+        self._unicode_data_ready_event = threading.Event()
+        self._search_worker_pool_lock = threading.Lock()
+
+        # Keyword queries handled in background, one at a time. Generation number
+        # of the latest query. (See `handle_keyword_query_event_in_background`)
+        self._keyword_query_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="KeywordQuery"
+        )
+        self._keyword_query_generation = 0
+        self._keyword_query_generation_lock = threading.Lock()
+
         self.project_path: str = project_path
 
         self.icon_extension = f"{self.project_path}/images/icon.png"
@@ -34,10 +112,108 @@ class UnicodeExtensionFeature:
 
         self.preferences: UnicodeExtensionPreferences = UnicodeExtensionPreferences()
 
-        self.unicode_character_dict: dict[
-            str, UnicodeCharacter
-        ] = unicode_character_dict
-        self.unicode_character_list: list[UnicodeCharacter] = unicode_character_list
+        # Generated result items for repeated queries (`arrow`, `dash`, ...)
+        # with characters of them. Cleared when preferences are changed.
+        self.search_result_cache: LRUCache[
+            tuple[list[UnicodeCharacter], list[ExtensionResultItem]]
+        ] = LRUCache(self.SEARCH_RESULT_CACHE_SIZE)
+
+        # Icon files, limited by number and size. (Least recently used is removed)
+        # Icons of icon pack made by `generate_data` are used without making files.
+        self.unicode_character_icon_cache: UnicodeCharacterIconCache = (
+            UnicodeCharacterIconCache(
+                icon_cache_dir_path,
+                icon_pack_dir_path=f"{self.project_path}/data/unicode_character_icon_pack",
+            )
+        )
+        self.__set_unicode_character_icon_cache_limit()
+
+        # Icons are made on worker threads. Result doesn't wait for icons being made.
+        self.unicode_character_icon_prefetcher: UnicodeCharacterIconPrefetcher = (
+            UnicodeCharacterIconPrefetcher(self.unicode_character_icon_cache)
+        )
+
+        # Newer query stops older search, and slow search returns partial result.
+        self.search_executor: SearchExecutor[list[UnicodeCharacter]] = SearchExecutor(
+            self.preferences.search_latency_budget / 1000
+        )
+
+        if (unicode_character_list is not None) and (
+            unicode_character_dict is not None
+        ):
+            self.set_unicode_data(unicode_character_list, unicode_character_dict)
+
+    def set_unicode_data(
+        self,
+        unicode_character_list: list[UnicodeCharacter],
+        unicode_character_dict: dict[str, UnicodeCharacter],
+    ):
+        """Set loaded Unicode data, and build search indexes of it.
+
+        Search is answered after this. (Can be called on another thread)
+        """
+
+        self.unicode_character_dict = unicode_character_dict
+        self.unicode_character_list = unicode_character_list
+
+        # Prebuild, not to build it at the first query
+        get_unicode_character_search_index(self.unicode_character_list)
+        get_unicode_character_trigram_index(self.unicode_character_list)
+
+        # For block scoped query (`blk:arrows right`, `in:box heavy`)
+        self.unicode_block_index = get_unicode_block_index(self.unicode_character_list)
+
+        # For type-ahead queries (`arr`, `arro`, `arrow`, ...) in this session
+        self.search_refinement_cache = SearchRefinementCache(
+            self.unicode_character_list
+        )
+
+        self.unicode_data_ready_time = time.perf_counter() - self.start_time
+        self._unicode_data_ready_event.set()
+
+        logger.info(
+            f"Unicode data is ready. Time to full search: {self.unicode_data_ready_time * 1000:.1f}ms"
+        )
+
+        # Preferences can be set while loading.
+        self.__configure_search_worker_pool()
+
+    def load_unicode_data_in_background(
+        self, load_unicode_data: Callable[[], dict]
+    ) -> threading.Thread:
+        """Load Unicode data on a thread, not to block start of extension.
+
+        Args:
+            load_unicode_data: Function returning the result of `load_unicode_data`
+
+        Returns:
+            Started thread.
+        """
+
+        def load():
+            try:
+                unicode_data = load_unicode_data()
+
+                self.set_unicode_data(
+                    unicode_data["UNICODE_CHARACTER_LIST"],
+                    unicode_data["UNICODE_CHARACTER_DICT"],
+                )
+            except Exception as error:
+                self.unicode_data_load_error = error
+                logger.exception("Can't load Unicode data.")
+
+        thread = threading.Thread(target=load, name="UnicodeDataLoader", daemon=True)
+        thread.start()
+
+        return thread
+
+    def is_unicode_data_ready(self) -> bool:
+        return self._unicode_data_ready_event.is_set()
+
+    def wait_unicode_data(self, timeout: float | None = None) -> bool:
+        """Wait until Unicode data is ready. Returns: `False` if timeout."""
+
+        return self._unicode_data_ready_event.wait(timeout)
 
     def handle_keyword_query_event(
         self, event: KeywordQueryEvent
@@ -63,30 +239,119 @@ class UnicodeExtensionFeature:
         except ValueError:
             pass
 
-        try:
-            search_result = self.generate_search_result(content)
-            extension_result_item_list.extend(search_result)
-        except Exception:
-            pass
+        if self.is_unicode_data_ready():
+            try:
+                search_result = self.generate_search_result(content)
+                extension_result_item_list.extend(search_result)
+            except Exception:
+                pass
+        else:
+            extension_result_item_list.append(self.__generate_loading_result_item())
+
+        if self.first_response_time is None:
+            self.first_response_time = time.perf_counter() - self.start_time
+
+            logger.info(
+                f"Time to first response: {self.first_response_time * 1000:.1f}ms"
+                + ("" if self.is_unicode_data_ready() else " (Unicode data is loading)")
+            )
 
         return RenderResultListAction(extension_result_item_list)
 
+    def handle_keyword_query_event_in_background(
+        self,
+        event: KeywordQueryEvent,
+        send_action: Callable[[RenderResultListAction], None],
+    ) -> Future[None]:
+        """Handle keyword query on worker thread, not blocking the caller.
+
+        So the next keystroke arrives while the search is running, and stops it.
+        (See `SearchExecutor`) Result of superseded query is not sent.
+
+        Args:
+            event: Keyword query event.
+            send_action: Sends result of the query. (Called on worker thread)
+
+        Returns:
+            Future done when query is handled, or skipped by newer query.
+        """
+
+        with self._keyword_query_generation_lock:
+            self._keyword_query_generation += 1
+            generation = self._keyword_query_generation
+
+        # Search of older query (if running) is stopped, and its worker is free soon.
+        self.search_executor.supersede()
+
+        def is_superseded() -> bool:
+            return generation != self._keyword_query_generation
+
+        def handle():
+            # Newer query is waiting. (Typed while older one was searched)
+            if is_superseded():
+                return
+
+            try:
+                action = self.handle_keyword_query_event(event)
+            except Exception:
+                logger.exception(f"Can't handle query `{event.get_argument()}`")
+                return
+
+            if is_superseded():
+                logger.debug(f"Result of `{event.get_argument()}` is dropped. (Stale)")
+                return
+
+            send_action(action)
+
+        return self._keyword_query_executor.submit(handle)
+
     def handle_preferences_event(self, event: PreferencesEvent):
         self.preferences.update(event.preferences)  # type: ignore
 
+        self.search_result_cache.clear()
+        self.__configure_search_worker_pool()
+        self.search_executor.latency_budget = (
+            self.preferences.search_latency_budget / 1000
+        )
+        self.__touch_unicode_character_icon_dir()
+        self.__set_unicode_character_icon_cache_limit()
+
     def handle_preferences_update_event(self, event: PreferencesUpdateEvent):
         preference_id = event.id
         new_value = event.new_value
 
         self.preferences.update({preference_id: new_value})
 
+        self.search_result_cache.clear()
+        logger.debug(f"Search result cache cleared. {self.search_result_cache}")
+
+        if preference_id == "search_worker_number":
+            self.__configure_search_worker_pool()
+        if preference_id == "search_latency_budget":
+            self.search_executor.latency_budget = (
+                self.preferences.search_latency_budget / 1000
+            )
+        if preference_id in [
+            "unicode_character_icon_font",
+            "unicode_character_icon_background",
+        ]:
+            # Icons of new font are in another directory. Shown without restart.
+            self.__touch_unicode_character_icon_dir()
+        if preference_id in [
+            "unicode_character_icon_cache_max_file_number",
+            "unicode_character_icon_cache_max_size",
+        ]:
+            self.__set_unicode_character_icon_cache_limit()
+
     def convert_one_letter_to_unicode_info(self, letter: str) -> ExtensionResultItem:
-        unicode_character = self.__get_unicode_character_from_letter(letter)
+        u_code_point, character_name = self.__get_u_code_point_and_name_from_letter(
+            letter
+        )
 
-        name = f"{unicode_character.name}"
-        description = f"'{letter}' is {unicode_character.u_code_point}"
+        name = f"{character_name}"
+        description = f"'{letter}' is {u_code_point}"
 
-        value = f"{unicode_character.u_code_point} {unicode_character.name}"
+        value = f"{u_code_point} {character_name}"
 
         result_item = ExtensionResultItem(
             icon=self.icon_convert,
@@ -98,26 +363,21 @@ class UnicodeExtensionFeature:
         return result_item
 
     def convert_all_letter_to_unicode_info(self, content: str) -> ExtensionResultItem:
-        unicode_character_list: list[UnicodeCharacter] = []
+        u_code_point_list: list[str] = []
 
         for letter in content:
-            unicode_character = self.__get_unicode_character_from_letter(letter)
-
-            unicode_character_list.append(unicode_character)
+            if self.is_unicode_data_ready():
+                unicode_character = self.__get_unicode_character_from_letter(letter)
+                u_code_point_list.append(unicode_character.u_code_point)
+            else:
+                u_code_point_list.append(f"U+{ord(letter):04X}")
 
-        name = " ".join(
-            map(
-                lambda unicode_character: f"{unicode_character.u_code_point}",
-                unicode_character_list,
-            )
-        )
+        name = " ".join(u_code_point_list)
         description = f'"{content}" to Unicode code point'
 
         value = " ".join(
-            map(
-                lambda unicode_character: f"{unicode_character.character}({unicode_character.u_code_point})",
-                unicode_character_list,
-            )
+            f"{letter}({u_code_point})"
+            for (letter, u_code_point) in zip(content, u_code_point_list)
         )
 
         result_item = ExtensionResultItem(
@@ -130,41 +390,312 @@ class UnicodeExtensionFeature:
         return result_item
 
     def generate_search_result(self, query: str) -> list[ExtensionResultItem]:
+        # Only block name is typed (`blk:`, `blk:arr`). Suggest block names.
+        block_query = parse_block_query(query, self.unicode_block_index)
+
+        if (block_query is not None) and block_query.is_completing:
+            return self.__generate_block_completion_result_item_list(block_query)
+
+        # Search is case insensitive, and spaces between words are not meaningful.
+        query = " ".join(query.upper().split())
+
+        search_result_cache_key = (
+            query,
+            self.preferences.search_result_list_size,
+            self.preferences.search_result_view_type,
+            self.preferences.unicode_character_icon_font,
+            self.preferences.unicode_character_icon_background,
+        )
+
+        cached_search_result = self.search_result_cache.get(search_result_cache_key)
+
+        if cached_search_result is not None:
+            cached_unicode_character_list, cached_extension_result_item_list = (
+                cached_search_result
+            )
+
+            # Icon files of cached items can be removed by limits of icon cache.
+            # Used icons are marked as used, and result is made again if removed.
+            if self.__find_unicode_character_icon_list(cached_unicode_character_list):
+                return list(cached_extension_result_item_list)
+
+            self.search_result_cache.remove(search_result_cache_key)
+
         extension_result_item_list: list[ExtensionResultItem] = []
 
-        search_result = search_unicode_character(
-            query=query,
-            unicode_character_list=self.unicode_character_list,
-            limit=self.preferences.search_result_list_size,
+        limit = self.preferences.search_result_list_size
+
+        search_result, is_search_stopped = self.search_executor.search(
+            lambda should_stop: self.__search_unicode_character(
+                query, should_stop, limit=limit
+            ),
+            name=query,
         )
 
-        for index, item in enumerate(search_result):
-            (unicode_character, score, _) = item
+        icon_list = self.__get_unicode_character_icon_list(search_result)
 
+        for unicode_character, icon in zip(search_result, icon_list):
             extension_result_item: ExtensionResultItem | ExtensionSmallResultItem = (
                 self.__generate_extension_result_item_of_search_result_character(
-                    unicode_character
+                    unicode_character, icon
                 )
             )
 
             extension_result_item_list.append(extension_result_item)
 
+        # Icons of characters just after the result are made in background.
+        # (Shown by next queries, e.g., `arr` -> `arro`) They're taken from the
+        # cached fuzzy search, not searched again. (Same limit decides the fallback)
+        prefetch_search_result = self.__search_unicode_character(
+            query, limit=limit * 2, is_cached_only=True
+        )
+
+        self.unicode_character_icon_prefetcher.prefetch(
+            [
+                unicode_character
+                for unicode_character in prefetch_search_result
+                if (unicode_character not in search_result)
+                and unicode_character.character.isprintable()
+            ],
+            background=self.preferences.unicode_character_icon_background,
+            font=self.preferences.unicode_character_icon_font,
+        )
+
+        # Partial result of stopped search is shown, but not reused.
+        # Result with placeholder icons is not reused too.
+        if (not is_search_stopped) and (self.icon_extension not in icon_list):
+            self.search_result_cache.put(
+                search_result_cache_key,
+                (search_result, list(extension_result_item_list)),
+            )
+
         return extension_result_item_list
 
-    def __get_unicode_character_icon(
-        self,
-        unicode_character: UnicodeCharacter,
-    ) -> str:
-        if not unicode_character.character.isprintable():
-            return self.icon_non_printable
+    def __configure_search_worker_pool(self):
+        # Configured when Unicode data is ready. (See `set_unicode_data`)
+        if not self.is_unicode_data_ready():
+            return
+
+        with self._search_worker_pool_lock:
+            configure_search_worker_pool(
+                self.unicode_character_list, self.preferences.search_worker_number
+            )
 
-        unicode_character_icon_file_path = generate_unicode_character_icon(
-            unicode_character,
+    def __touch_unicode_character_icon_dir(self):
+        # Icon directory in use is not removed as old one.
+        touch_unicode_character_icon_dir(
             background=self.preferences.unicode_character_icon_background,
             font=self.preferences.unicode_character_icon_font,
+            icon_cache_dir_path=self.unicode_character_icon_cache.icon_cache_dir_path,
+        )
+
+    def __set_unicode_character_icon_cache_limit(self):
+        preferences = self.preferences
+        max_megabyte_size = preferences.unicode_character_icon_cache_max_size
+
+        self.unicode_character_icon_cache.set_limit(
+            max_file_number=preferences.unicode_character_icon_cache_max_file_number,
+            max_byte_size=max_megabyte_size * 1024 * 1024,
+        )
+
+    def __generate_loading_result_item(self) -> ExtensionResultItem:
+        if self.unicode_data_load_error is not None:
+            return ExtensionResultItem(
+                icon=self.icon_extension,
+                name="Can't load Unicode data",
+                description=f"{self.unicode_data_load_error}",
+                on_enter=DoNothingAction(),
+            )
+
+        return ExtensionResultItem(
+            icon=self.icon_extension,
+            name="Loading Unicode data…",
+            description="Search is available in a moment. Type again to search.",
+            on_enter=DoNothingAction(),
+        )
+
+    def __search_unicode_character(
+        self,
+        query: str,
+        should_stop: Callable[[], bool] | None = None,
+        limit: int | None = None,
+        is_cached_only: bool = False,
+    ) -> list[UnicodeCharacter]:
+        """
+        Args:
+            is_cached_only: Fuzzy match is only taken from cached results, no
+                character is scored for it. (See `SearchRefinementCache.search_cached`)
+        """
+
+        if limit is None:
+            limit = self.preferences.search_result_list_size
+
+        unicode_character_result_list: list[UnicodeCharacter] = []
+
+        # Block scoped query (`blk:arrows right`) is searched only in the block.
+        block_query = parse_block_query(query, self.unicode_block_index)
+
+        # Block scoped search is not cached. (Characters of block without search
+        # query are taken)
+        if (
+            (block_query is not None)
+            and is_cached_only
+            and (block_query.search_query != "")
+        ):
+            return []
+
+        if block_query is not None:
+            return search_unicode_character_in_block(
+                block_query,
+                unicode_character_list=self.unicode_character_list,
+                unicode_block_index=self.unicode_block_index,
+                limit=limit,
+                should_stop=should_stop,
+            )
+
+        # Code point query (`U+2014`, `0x1F600`, `#9731`, `U+2190..U+21FF`, ...)
+        # is found directly, without fuzzy search.
+        code_point_query = parse_code_point_query(query)
+
+        if code_point_query is not None:
+            unicode_character_result_list = search_unicode_character_by_code_point(
+                code_point_query,
+                unicode_character_list=self.unicode_character_list,
+                unicode_character_dict=self.unicode_character_dict,
+                limit=limit,
+            )
+
+            # Bare hex number (e.g., `2014`, `4E00`) can be a part of character name.
+            # Rest of result is filled by fuzzy search.
+            if code_point_query.kind != "bare":
+                return unicode_character_result_list
+
+        if is_cached_only:
+            search_result = self.search_refinement_cache.search_cached(
+                query=query, limit=limit
+            )
+        else:
+            search_result = self.search_refinement_cache.search(
+                query=query, limit=limit, should_stop=should_stop
+            )
+
+        for unicode_character, _, _ in search_result:
+            if len(unicode_character_result_list) >= limit:
+                break
+
+            if unicode_character not in unicode_character_result_list:
+                unicode_character_result_list.append(unicode_character)
+
+        return unicode_character_result_list
+
+    def __generate_block_completion_result_item_list(
+        self, block_query: BlockQuery
+    ) -> list[ExtensionResultItem]:
+        block_list = self.unicode_block_index.find_block_list(block_query.block_query)
+
+        extension_result_item_list: list[ExtensionResultItem] = []
+
+        for block in block_list[: self.preferences.search_result_list_size]:
+            block_position_range = self.unicode_block_index.block_position_range_dict[
+                block
+            ]
+
+            first_unicode_character = self.unicode_character_list[
+                block_position_range[0]
+            ]
+            last_unicode_character = self.unicode_character_list[
+                block_position_range[-1]
+            ]
+
+            description = f"{first_unicode_character.u_code_point}..{last_unicode_character.u_code_point} ({len(block_position_range)} characters)"
+
+            # Enter completes block name, then user types search query.
+            extension_result_item = ExtensionResultItem(
+                icon=self.icon_extension,
+                name=block,
+                description=description,
+                on_enter=SetUserQueryAction(
+                    f"{self.preferences.keyword} {block_query.prefix}{block} "
+                ),
+            )
+
+            extension_result_item_list.append(extension_result_item)
+
+        return extension_result_item_list
+
+    def __get_unicode_character_icon_list(
+        self,
+        unicode_character_list: list[UnicodeCharacter],
+    ) -> list[str]:
+        """Icon of each character. Extension icon if it's being made."""
+
+        printable_unicode_character_list = [
+            unicode_character
+            for unicode_character in unicode_character_list
+            if unicode_character.character.isprintable()
+        ]
+
+        printable_icon_iterator = iter(
+            self.unicode_character_icon_prefetcher.get_icon_list(
+                printable_unicode_character_list,
+                background=self.preferences.unicode_character_icon_background,
+                font=self.preferences.unicode_character_icon_font,
+                placeholder=self.icon_extension,
+            )
         )
 
-        return unicode_character_icon_file_path
+        return [
+            (
+                next(printable_icon_iterator)
+                if unicode_character.character.isprintable()
+                else self.icon_non_printable
+            )
+            for unicode_character in unicode_character_list
+        ]
+
+    def __find_unicode_character_icon_list(
+        self,
+        unicode_character_list: list[UnicodeCharacter],
+    ) -> bool:
+        """`True` if icons of every character are still in icon cache.
+
+        Found icons are marked as used. (Not removed before unused ones)
+        """
+
+        for unicode_character in unicode_character_list:
+            if not unicode_character.character.isprintable():
+                continue
+
+            icon_file_path = self.unicode_character_icon_cache.find_icon(
+                unicode_character,
+                background=self.preferences.unicode_character_icon_background,
+                font=self.preferences.unicode_character_icon_font,
+            )
+
+            if icon_file_path is None:
+                return False
+
+        return True
+
+    def __get_u_code_point_and_name_from_letter(self, letter: str) -> tuple[str, str]:
+        """
+        Returns:
+            E.g., `("U+0041", "LATIN CAPITAL LETTER A")`
+        """
+
+        if not self.is_unicode_data_ready():
+            if len(letter) != 1:
+                raise ValueError(
+                    f"Letter should be one letter. current 'letter' value: `{letter}`"
+                )
+
+            # Python `unicodedata` has names too, without loading. (Raises `ValueError`
+            # if it has no name. e.g., control character)
+            return (f"U+{ord(letter):04X}", unicodedata.name(letter))
+
+        unicode_character = self.__get_unicode_character_from_letter(letter)
+
+        return (unicode_character.u_code_point, unicode_character.name)
 
     def __get_unicode_character_from_letter(self, letter: str) -> UnicodeCharacter:
         if len(letter) > 1:
@@ -172,15 +703,18 @@ class UnicodeExtensionFeature:
                 f"Letter should be one letter. current 'letter' value: `{letter}`"
             )
 
-        hex_code_str = f"{ord(letter):X}"
-        code_point = f"U+{hex_code_str.zfill(4)}"
+        # By code point, not making `U+XXXX` key for every letter of content.
+        unicode_character = get_unicode_character_by_code_point(
+            self.unicode_character_dict, ord(letter)
+        )
 
-        unicode_character = self.unicode_character_dict[code_point]
+        if unicode_character is None:
+            raise KeyError(f"U+{ord(letter):04X}")
 
         return unicode_character
 
     def __generate_extension_result_item_of_search_result_character(
-        self, unicode_character: UnicodeCharacter
+        self, unicode_character: UnicodeCharacter, icon: str
     ) -> ExtensionResultItem | ExtensionSmallResultItem:
         def generate_extension_result_item(
             unicode_character: UnicodeCharacter,
@@ -193,7 +727,7 @@ class UnicodeExtensionFeature:
                 description = f"{description} [{alias}]"
 
             result_item = ExtensionResultItem(
-                icon=self.__get_unicode_character_icon(unicode_character),
+                icon=icon,
                 name=name,
                 description=description,
                 on_enter=CopyToClipboardAction(unicode_character.character),
@@ -206,7 +740,7 @@ class UnicodeExtensionFeature:
             name = f"{unicode_character.name} ({unicode_character.u_code_point})"
 
             small_result_item = ExtensionSmallResultItem(
-                icon=self.__get_unicode_character_icon(unicode_character),
+                icon=icon,
                 name=name,
                 on_enter=CopyToClipboardAction(unicode_character.character),
             )
@@ -227,23 +761,39 @@ class UnicodeExtensionPreferences:
     DEFAULT_KEYWORD: str = "u"
     DEFAULT_SEARCH_RESULT_LIST_SIZE: int = 10
     DEFAULT_SEARCH_RESULT_VIEW_TYPE: str = "default"
+    DEFAULT_SEARCH_WORKER_NUMBER: int = 1
+    DEFAULT_SEARCH_LATENCY_BUDGET: int = 500
     DEFAULT_UNICODE_CHARACTER_ICON_FONT: str = "sans-serif"
     DEFAULT_UNICODE_CHARACTER_ICON_BACKGROUND = None
+    DEFAULT_UNICODE_CHARACTER_ICON_CACHE_MAX_FILE_NUMBER: int = 5000
+    DEFAULT_UNICODE_CHARACTER_ICON_CACHE_MAX_SIZE: int = 8
 
     keyword: str
     search_result_list_size: int
     search_result_view_type: str
+    search_worker_number: int
+    search_latency_budget: int
     unicode_character_icon_font: str
     unicode_character_icon_background: None | str
+    unicode_character_icon_cache_max_file_number: int
+    unicode_character_icon_cache_max_size: int
 
     def __init__(self):
         self.keyword: str = self.DEFAULT_KEYWORD
         self.search_result_list_size: int = self.DEFAULT_SEARCH_RESULT_LIST_SIZE
         self.search_result_view_type: str = self.DEFAULT_SEARCH_RESULT_VIEW_TYPE
+        self.search_worker_number: int = self.DEFAULT_SEARCH_WORKER_NUMBER
+        self.search_latency_budget: int = self.DEFAULT_SEARCH_LATENCY_BUDGET
         self.unicode_character_icon_font: str = self.DEFAULT_UNICODE_CHARACTER_ICON_FONT
         self.unicode_character_icon_background: None | str = (
             self.DEFAULT_UNICODE_CHARACTER_ICON_BACKGROUND
         )
+        self.unicode_character_icon_cache_max_file_number: int = (
+            self.DEFAULT_UNICODE_CHARACTER_ICON_CACHE_MAX_FILE_NUMBER
+        )
+        self.unicode_character_icon_cache_max_size: int = (
+            self.DEFAULT_UNICODE_CHARACTER_ICON_CACHE_MAX_SIZE
+        )
 
     def update(self, new_preferences: dict):
         if "keyword" in new_preferences.keys():
@@ -256,6 +806,10 @@ class UnicodeExtensionPreferences:
             self.update_search_result_view_type(
                 new_preferences["search_result_view_type"]
             )
+        if "search_worker_number" in new_preferences.keys():
+            self.update_search_worker_number(new_preferences["search_worker_number"])
+        if "search_latency_budget" in new_preferences.keys():
+            self.update_search_latency_budget(new_preferences["search_latency_budget"])
         if "unicode_character_icon_font" in new_preferences.keys():
             self.update_unicode_character_icon_font(
                 new_preferences["unicode_character_icon_font"]
@@ -264,6 +818,14 @@ class UnicodeExtensionPreferences:
             self.update_unicode_character_icon_background(
                 new_preferences["unicode_character_icon_background"]
             )
+        if "unicode_character_icon_cache_max_file_number" in new_preferences.keys():
+            self.update_unicode_character_icon_cache_max_file_number(
+                new_preferences["unicode_character_icon_cache_max_file_number"]
+            )
+        if "unicode_character_icon_cache_max_size" in new_preferences.keys():
+            self.update_unicode_character_icon_cache_max_size(
+                new_preferences["unicode_character_icon_cache_max_size"]
+            )
 
     def update_keyword(self, new_value: str):
         self.keyword = new_value
@@ -282,6 +844,25 @@ class UnicodeExtensionPreferences:
     def update_search_result_view_type(self, new_value: str):
         self.search_result_view_type = new_value
 
+    def update_search_worker_number(self, new_value: str):
+        try:
+            self.search_worker_number = int(new_value)
+        except ValueError:
+            self.search_worker_number = self.DEFAULT_SEARCH_WORKER_NUMBER
+
+        if self.search_worker_number < 1:
+            self.search_worker_number = self.DEFAULT_SEARCH_WORKER_NUMBER
+
+    def update_search_latency_budget(self, new_value: str):
+        # Milliseconds. `0` for no limit.
+        try:
+            self.search_latency_budget = int(new_value)
+        except ValueError:
+            self.search_latency_budget = self.DEFAULT_SEARCH_LATENCY_BUDGET
+
+        if self.search_latency_budget < 0:
+            self.search_latency_budget = self.DEFAULT_SEARCH_LATENCY_BUDGET
+
     def update_unicode_character_icon_font(self, new_value: str):
         self.unicode_character_icon_font = new_value
 
@@ -297,3 +878,31 @@ class UnicodeExtensionPreferences:
             self.unicode_character_icon_background = (
                 self.DEFAULT_UNICODE_CHARACTER_ICON_BACKGROUND
             )
+
+    def update_unicode_character_icon_cache_max_file_number(self, new_value: str):
+        try:
+            self.unicode_character_icon_cache_max_file_number = int(new_value)
+        except ValueError:
+            self.unicode_character_icon_cache_max_file_number = (
+                self.DEFAULT_UNICODE_CHARACTER_ICON_CACHE_MAX_FILE_NUMBER
+            )
+
+        # Icons of a search result should be kept.
+        if self.unicode_character_icon_cache_max_file_number < 100:
+            self.unicode_character_icon_cache_max_file_number = (
+                self.DEFAULT_UNICODE_CHARACTER_ICON_CACHE_MAX_FILE_NUMBER
+            )
+
+    def update_unicode_character_icon_cache_max_size(self, new_value: str):
+        # Megabytes
+        try:
+            self.unicode_character_icon_cache_max_size = int(new_value)
+        except ValueError:
+            self.unicode_character_icon_cache_max_size = (
+                self.DEFAULT_UNICODE_CHARACTER_ICON_CACHE_MAX_SIZE
+            )
+
+        if self.unicode_character_icon_cache_max_size < 1:
+            self.unicode_character_icon_cache_max_size = (
+                self.DEFAULT_UNICODE_CHARACTER_ICON_CACHE_MAX_SIZE
+            )
@@ -0,0 +1,113 @@
+import sys
+from collections.abc import Sequence
+
+from .unicode_character import EMPTY_ALIASES
+
+
+# Words of name are separated by space. (`LATIN CAPITAL LETTER A`)
+NAME_WORD_SEPARATOR = " "
+
+# Word id between name and aliases, and between aliases.
+# (Not a word, so the number of words is less than this)
+ALIAS_SEPARATOR_WORD_ID = 0xFFFF
+
+
+class UnicodeNameLexicon:
+    """
+    Words of names and aliases. Names are kept as ids of the words.
+
+    Names share a small vocabulary (`LATIN`, `CAPITAL`, `LETTER`, `WITH`, ...),
+    so a word id (2 bytes) for each word is much smaller than a string for each
+    name. Like names of CPython `unicodedata`.
+
+    Name and aliases of a character are one sequence of word ids:
+    name words, `ALIAS_SEPARATOR_WORD_ID`, alias words, `ALIAS_SEPARATOR_WORD_ID`, ...
+
+    Attributes:
+        word_list (list[str]): Words. Index is word id. Example: `["A", "ABOVE", ...]`
+    """
+
+    word_list: list[str]
+
+    def __init__(self, word_list: list[str] | None = None):
+        self.word_list = [sys.intern(word) for word in word_list or []]
+
+        # Word -> word id. Made when words are added. (Not needed only to read)
+        self._word_id_dict: dict[str, int] | None = None
+
+    def __len__(self):
+        return len(self.word_list)
+
+    def get_word_id(self, word: str) -> int:
+        """Id of `word`. Word is added if it's new. (Raises `ValueError` if full)"""
+
+        if self._word_id_dict is None:
+            self._word_id_dict = {
+                known_word: i for i, known_word in enumerate(self.word_list)
+            }
+
+        word_id = self._word_id_dict.get(word)
+
+        if word_id is None:
+            word_id = len(self.word_list)
+
+            if word_id >= ALIAS_SEPARATOR_WORD_ID:
+                raise ValueError("UnicodeNameLexicon - Too many words.")
+
+            self.word_list.append(sys.intern(word))
+            self._word_id_dict[word] = word_id
+
+        return word_id
+
+    def encode(self, name: str, aliases: list[str]) -> list[int]:
+        """Word ids of name and aliases
+
+        Returns:
+            E.g., `[12, 7, 30]` for `"EM DASH"` and no aliases.
+        """
+
+        word_id_list = [
+            self.get_word_id(word) for word in name.split(NAME_WORD_SEPARATOR)
+        ]
+
+        for alias in aliases:
+            word_id_list.append(ALIAS_SEPARATOR_WORD_ID)
+            word_id_list.extend(
+                self.get_word_id(word) for word in alias.split(NAME_WORD_SEPARATOR)
+            )
+
+        return word_id_list
+
+    def decode_name(self, word_id_list: Sequence[int]) -> str:
+        """Name of word ids. (Aliases are not read)"""
+
+        word_list = self.word_list
+        word_string_list: list[str] = []
+
+        for word_id in word_id_list:
+            if word_id == ALIAS_SEPARATOR_WORD_ID:
+                break
+
+            word_string_list.append(word_list[word_id])
+
+        return NAME_WORD_SEPARATOR.join(word_string_list)
+
+    def decode(self, word_id_list: Sequence[int]) -> tuple[str, list[str]]:
+        """Name and aliases of word ids. (Reverse of `encode`)"""
+
+        word_list = self.word_list
+        string_list: list[str] = []
+        word_string_list: list[str] = []
+
+        for word_id in word_id_list:
+            if word_id == ALIAS_SEPARATOR_WORD_ID:
+                string_list.append(NAME_WORD_SEPARATOR.join(word_string_list))
+                word_string_list = []
+            else:
+                word_string_list.append(word_list[word_id])
+
+        string_list.append(NAME_WORD_SEPARATOR.join(word_string_list))
+
+        name, *aliases = string_list
+
+        return (name, aliases or EMPTY_ALIASES)
@@ -0,0 +1,279 @@
+import bisect
+from typing import Iterator
+
+# Names made of prefix and code point. (`CJK UNIFIED IDEOGRAPH-4E00`)
+#
+# See: [UAX #44 - 4.8 Name](https://www.unicode.org/reports/tr44/#Name), NR2
+CODE_POINT_NAME_PREFIX_LIST = [
+    "CJK UNIFIED IDEOGRAPH-",
+    "CJK COMPATIBILITY IDEOGRAPH-",
+    "TANGUT IDEOGRAPH-",
+    "KHITAN SMALL SCRIPT CHARACTER-",
+    "NUSHU CHARACTER-",
+]
+
+# Names made of prefix and jamo of syllable. (`HANGUL SYLLABLE GA`), NR1
+#
+# See: [The Unicode Standard - 3.12 Conjoining Jamo Behavior](https://www.unicode.org/versions/latest/ch03.pdf)
+HANGUL_SYLLABLE_NAME_PREFIX = "HANGUL SYLLABLE "
+HANGUL_SYLLABLE_FIRST_CODE_POINT = 0xAC00
+HANGUL_SYLLABLE_LAST_CODE_POINT = 0xD7A3
+
+HANGUL_JAMO_L_NAME_LIST = [
+    *["G", "GG", "N", "D", "DD", "R", "M", "B", "BB", "S"],
+    *["SS", "", "J", "JJ", "C", "K", "T", "P", "H"],
+]
+HANGUL_JAMO_V_NAME_LIST = [
+    *["A", "AE", "YA", "YAE", "EO", "E", "YEO", "YE", "O", "WA", "WAE"],
+    *["OE", "YO", "U", "WEO", "WE", "WI", "YU", "EU", "YI", "I"],
+]
+HANGUL_JAMO_T_NAME_LIST = [
+    *["", "G", "GG", "GS", "N", "NJ", "NH", "D", "L", "LG", "LM", "LB", "LS", "LT"],
+    *["LP", "LH", "M", "B", "BS", "S", "SS", "NG", "J", "C", "K", "T", "P", "H"],
+]
+
+
+def generate_name(prefix: str, code_point: int) -> str:
+    """Make name of character by the rule of `prefix`
+
+    Returns:
+        E.g., `"CJK UNIFIED IDEOGRAPH-4E00"`, `"HANGUL SYLLABLE GA"`
+    """
+
+    if prefix == HANGUL_SYLLABLE_NAME_PREFIX:
+        syllable_index = code_point - HANGUL_SYLLABLE_FIRST_CODE_POINT
+
+        l_index, vt_index = divmod(
+            syllable_index,
+            len(HANGUL_JAMO_V_NAME_LIST) * len(HANGUL_JAMO_T_NAME_LIST),
+        )
+        v_index, t_index = divmod(vt_index, len(HANGUL_JAMO_T_NAME_LIST))
+
+        return (
+            prefix
+            + HANGUL_JAMO_L_NAME_LIST[l_index]
+            + HANGUL_JAMO_V_NAME_LIST[v_index]
+            + HANGUL_JAMO_T_NAME_LIST[t_index]
+        )
+
+    return f"{prefix}{code_point:04X}"
+
+
+def find_name_prefix(code_point: int, name: str) -> str | None:
+    """Find prefix of the rule `name` is made by.
+
+    Returns:
+        E.g., `"CJK UNIFIED IDEOGRAPH-"`. `None` if `name` is not made by a rule.
+    """
+
+    if (
+        HANGUL_SYLLABLE_FIRST_CODE_POINT
+        <= code_point
+        <= HANGUL_SYLLABLE_LAST_CODE_POINT
+    ):
+        prefix = HANGUL_SYLLABLE_NAME_PREFIX
+    else:
+        prefix = name[: name.rfind("-") + 1]
+
+        if prefix not in CODE_POINT_NAME_PREFIX_LIST:
+            return None
+
+    if name != generate_name(prefix, code_point):
+        return None
+
+    return prefix
+
+
+def is_name_prefix(prefix: str) -> bool:
+    return (prefix == HANGUL_SYLLABLE_NAME_PREFIX) or (
+        prefix in CODE_POINT_NAME_PREFIX_LIST
+    )
+
+
+class UnicodeNameRange:
+    """
+    Characters of contiguous code points, whose names are made by a rule.
+
+    Names (and strings for search) of them are not stored, but made when needed.
+
+    Attributes:
+        prefix (str): Prefix of the rule. Example: `"CJK UNIFIED IDEOGRAPH-"`
+        first_code_point (int): Example: `0x4E00`
+        last_code_point (int): Example: `0x9FFF`
+        first_position (int): Position of the first character in
+            `unicode_character_list`. Characters are in order of code point.
+    """
+
+    prefix: str
+    first_code_point: int
+    last_code_point: int
+    first_position: int
+
+    def __init__(
+        self,
+        prefix: str,
+        first_code_point: int,
+        last_code_point: int,
+        first_position: int,
+    ):
+        self.prefix = prefix
+        self.first_code_point = first_code_point
+        self.last_code_point = last_code_point
+        self.first_position = first_position
+
+        # Words of prefix. E.g., `["CJK", "UNIFIED", "IDEOGRAPH"]`
+        self._prefix_word_list = prefix.replace("-", " ").split()
+
+        # Sorted names without prefix, only for Hangul syllables. (Made at first use)
+        self._sorted_suffix_and_position_list: list[tuple[str, int]] | None = None
+
+    def __len__(self):
+        return self.last_code_point - self.first_code_point + 1
+
+    def __str__(self):
+        return f"U+{self.first_code_point:04X}..U+{self.last_code_point:04X} - '{self.prefix}'"
+
+    def __repr__(self):
+        return str(self)
+
+    def get_name(self, position: int) -> str:
+        return generate_name(
+            self.prefix, self.first_code_point + (position - self.first_position)
+        )
+
+    def is_named_by(self, query: str) -> bool:
+        """`True` if query is the whole prefix and a part of the rest of names.
+
+        Characters found by it are named by the query, not only sharing words of
+        prefix. (`"CJK UNIFIED IDEOGRAPH 4E0"`, `"HANGUL SYLLABLE G"`)
+
+        Args:
+            query: Upper case query.
+        """
+
+        prefix = self.prefix.replace("-", " ")
+        query = query.replace("-", " ")
+
+        return query.startswith(prefix) and (len(query) > len(prefix))
+
+    def find_position_list(self, query: str) -> Iterator[int]:
+        """Find positions of characters by query of name
+
+        Words of query are words of prefix, and at most one word of the rest.
+        (The last word of query can be a part of a word of prefix, while typing)
+
+        - `"CJK UNIFIED IDEOGRAPH 6F22"`, `"cjk ideograph-6f22"`: U+6F22
+        - `"CJK UNIFIED IDEOGRAPH 6F2"`: U+6F20..U+6F2F
+        - `"cjk unified"`: Every character of range.
+        - `"HANGUL SYLLABLE G"`: `HANGUL SYLLABLE GA`, `HANGUL SYLLABLE GAE`, ...
+        - `"6F22"`, `"GA"`: Only the exact match, without words of prefix.
+
+        Args:
+            query: Upper case query.
+
+        Returns:
+            Positions. Better match first, then in order of code point.
+        """
+
+        query_word_list = query.replace("-", " ").split()
+
+        rest_word_list: list[str] = []
+        matched_prefix_word_set: set[str] = set()
+
+        for i, query_word in enumerate(query_word_list):
+            if query_word in self._prefix_word_list:
+                matched_prefix_word_set.add(query_word)
+                continue
+
+            if (i == len(query_word_list) - 1) and any(
+                prefix_word.startswith(query_word)
+                and (prefix_word not in matched_prefix_word_set)
+                for prefix_word in self._prefix_word_list
+            ):
+                matched_prefix_word_set.add(query_word)
+                continue
+
+            rest_word_list.append(query_word)
+
+        if len(rest_word_list) > 1:
+            return iter([])
+
+        if len(rest_word_list) == 0:
+            if len(matched_prefix_word_set) == 0:
+                return iter([])
+
+            return iter(range(self.first_position, self.first_position + len(self)))
+
+        rest_word = rest_word_list[0]
+        is_exact_match_only = len(matched_prefix_word_set) == 0
+
+        if self.prefix == HANGUL_SYLLABLE_NAME_PREFIX:
+            return self.__find_hangul_syllable_position_list(
+                rest_word, is_exact_match_only
+            )
+
+        return self.__find_code_point_position_list(rest_word, is_exact_match_only)
+
+    def __find_code_point_position_list(
+        self, code_point_prefix: str, is_exact_match_only: bool
+    ) -> Iterator[int]:
+        try:
+            code_point = int(code_point_prefix, base=16)
+        except ValueError:
+            return
+
+        if (self.first_code_point <= code_point <= self.last_code_point) and (
+            f"{code_point:04X}" == code_point_prefix
+        ):
+            yield self.first_position + (code_point - self.first_code_point)
+
+        if is_exact_match_only:
+            return
+
+        # Code points starting with `code_point_prefix`. (`XXXX` to `XXXXXX`)
+        for digit_number in range(max(4, len(code_point_prefix) + 1), 7):
+            shift = 4 * (digit_number - len(code_point_prefix))
+            first_code_point = max(
+                code_point << shift,
+                16 ** (digit_number - 1) if digit_number > 4 else 0,
+                self.first_code_point,
+            )
+            last_code_point = min(((code_point + 1) << shift) - 1, self.last_code_point)
+
+            for code_point_of_range in range(first_code_point, last_code_point + 1):
+                yield self.first_position + (
+                    code_point_of_range - self.first_code_point
+                )
+
+    def __find_hangul_syllable_position_list(
+        self, suffix_prefix: str, is_exact_match_only: bool
+    ) -> Iterator[int]:
+        if self._sorted_suffix_and_position_list is None:
+            self._sorted_suffix_and_position_list = sorted(
+                (
+                    self.get_name(position)[len(self.prefix) :],
+                    position,
+                )
+                for position in range(
+                    self.first_position, self.first_position + len(self)
+                )
+            )
+
+        sorted_suffix_and_position_list = self._sorted_suffix_and_position_list
+
+        start = bisect.bisect_left(sorted_suffix_and_position_list, (suffix_prefix,))
+        end = bisect.bisect_left(
+            sorted_suffix_and_position_list, (suffix_prefix + "\U0010ffff",), lo=start
+        )
+
+        # Shorter first. (Exact match is the first)
+        suffix_length_and_position_list = sorted(
+            (len(suffix), position)
+            for (suffix, position) in sorted_suffix_and_position_list[start:end]
+        )
+
+        for suffix_length, position in suffix_length_and_position_list:
+            if is_exact_match_only and (suffix_length != len(suffix_prefix)):
+                return
+
+            yield position
@@ -54,5 +54,17 @@ def get_project_path() -> str:
     return project_path
 
 
+def get_cache_dir_path() -> str:
+    """Get Cache Directory Path of extension (XDG Base Directory)
+
+    Returns:
+        Example: `"/home/{user}/.cache/ulauncher-unicode-extension"`
+    """
+
+    cache_home_path = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+
+    return f"{cache_home_path}/ulauncher-unicode-extension"
+
+
 if __name__ == "__main__":
     print(get_project_path())